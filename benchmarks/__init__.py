@@ -0,0 +1,16 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""Benchmarks of this package.
+
+Every ``bench_*.py`` module defines ``bench_*`` functions which return a
+dict that maps the name of a measurement to its value, run a module directly
+to print its measurements::
+
+    $ python -m benchmarks.bench_memory
+
+Run all modules, or some of them, by :mod:`benchmarks.run`, save the
+results as a baseline and compare with it later on the same machine::
+
+    $ python -m benchmarks.run --save baseline.json
+    $ python -m benchmarks.run bench_types --compare baseline.json
+"""
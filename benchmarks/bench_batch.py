@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""Batch validation against creating models one by one."""
+from __future__ import print_function, division, unicode_literals
+
+import timeit
+
+from parameter import Model, Argument, ArgumentError, types
+from parameter.adapter import JSONAdapter
+
+
+RECORDS = 10000
+
+
+class BatchEntity(Model):
+    id = Argument(types.Integer)
+    name = Argument(types.Unicode(max_len=50))
+    score = Argument(types.Double)
+    level = Argument(types.Integer, default=0)
+    tags = Argument(types.Unicode, multiple=True)
+
+
+def _records():
+    return [{"id": i, "name": "name%d" % i, "score": i / 3.0,
+             "tags": ["a", "b"]} for i in range(RECORDS)]
+
+
+def _loop(records):
+    results = []
+    for record in records:
+        try:
+            results.append(BatchEntity(JSONAdapter(record)))
+        except ArgumentError as e:
+            results.append(e)
+    return results
+
+
+def _batch(records):
+    return list(BatchEntity.validate_many(records))
+
+
+def bench_validate_many():
+    """Records per second of the loop and ``Model.validate_many``."""
+    records = _records()
+    loop = min(timeit.repeat(lambda: _loop(records), number=1, repeat=5))
+    batch = min(timeit.repeat(lambda: _batch(records), number=1, repeat=5))
+
+    return {
+        "loop_records_per_sec": RECORDS / loop,
+        "batch_records_per_sec": RECORDS / batch,
+        "speedup": loop / batch,
+    }
+
+
+if __name__ == "__main__":
+    for key, value in sorted(bench_validate_many().items()):
+        print("%-24s %.2f" % (key, value))
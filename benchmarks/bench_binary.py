@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""MessagePack against JSON, in wire size and adapter throughput."""
+from __future__ import print_function, division, unicode_literals
+
+import json
+import timeit
+
+from parameter import binary
+from parameter.adapter import JSONAdapter, MessagePackAdapter
+
+
+RECORD = {
+    "id": 123456,
+    "name": "payload",
+    "score": 1 / 3.0,
+    "active": True,
+    "records": [{"id": i, "name": "name%d" % i, "tags": ["a", "b"]}
+                for i in range(20)],
+}
+
+
+def bench_binary():
+    """Size and records per second of JSON and MessagePack."""
+    payload = json.dumps(RECORD).encode("utf8")
+    packed = binary.packb(RECORD)
+    adapters = {
+        "json": lambda: JSONAdapter(payload),
+        "json_stdlib": lambda: JSONAdapter(payload, decoder="json"),
+        "msgpack": lambda: MessagePackAdapter(packed),
+        "msgpack_pure": lambda: MessagePackAdapter(
+            packed, decoder=binary.py_unpackb),
+    }
+
+    results = {
+        "json_bytes": len(payload),
+        "msgpack_bytes": len(packed),
+    }
+    number = 2000
+    for name, create in adapters.items():
+        seconds = min(timeit.repeat(create, number=number, repeat=3))
+        results["%s_records_per_sec" % name] = number / seconds
+    return results
+
+
+if __name__ == "__main__":
+    for key, value in sorted(bench_binary().items()):
+        print("%-28s %.2f" % (key, value))
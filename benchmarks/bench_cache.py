@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""Converting recurring values with and without the LRU cache."""
+from __future__ import print_function, division, unicode_literals
+
+import timeit
+
+from parameter import types
+
+
+VALUES = 10000
+
+
+def bench_cached():
+    """Values per second of the types with and without
+    :class:`~parameter.types.Cached`, on values which only have a few
+    distinct ones. The decimals show a cheap conversion gains little."""
+    ret = {}
+    for name, type_, values in (
+            ("datetime", types.Datetime("%d/%m/%Y %H:%M"),
+             ["%02d/01/2017 08:00" % (1 + i % 7) for i in range(VALUES)]),
+            ("decimal", types.Decimal(),
+             ["%d.99" % (i % 20) for i in range(VALUES)])):
+        cached = type_.cached(maxsize=64)
+        plain = min(timeit.repeat(lambda: type_.convert_many(values),
+                                  number=1, repeat=5))
+        memoized = min(timeit.repeat(lambda: cached.convert_many(values),
+                                     number=1, repeat=5))
+        ret["%s_per_sec" % name] = VALUES / plain
+        ret["%s_cached_per_sec" % name] = VALUES / memoized
+        ret["%s_speedup" % name] = plain / memoized
+    return ret
+
+
+if __name__ == "__main__":
+    for key, value in sorted(bench_cached().items()):
+        print("%-28s %.2f" % (key, value))
@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""Columnar validation against validating the records in batch."""
+from __future__ import print_function, division, unicode_literals
+
+import timeit
+
+from benchmarks.bench_batch import BatchEntity, RECORDS, _records
+
+
+def _columns(records):
+    return {key: [record[key] for record in records]
+            for key in ("id", "name", "score", "tags")}
+
+
+def bench_validate_columns():
+    """Records per second of ``validate_many`` and ``validate_columns``."""
+    records = _records()
+    columns = _columns(records)
+    batch = min(timeit.repeat(
+        lambda: list(BatchEntity.validate_many(records)), number=1,
+        repeat=5))
+    columnar = min(timeit.repeat(
+        lambda: BatchEntity.validate_columns(columns), number=1, repeat=5))
+    return {
+        "batch_records_per_sec": RECORDS / batch,
+        "columns_records_per_sec": RECORDS / columnar,
+        "speedup": batch / columnar,
+    }
+
+
+if __name__ == "__main__":
+    for key, value in sorted(bench_validate_columns().items()):
+        print("%-28s %.2f" % (key, value))
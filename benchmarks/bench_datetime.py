@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""Parsing datetimes by the fast path against ``strptime``."""
+from __future__ import print_function, division, unicode_literals
+
+import timeit
+
+from datetime import datetime
+
+from parameter import types
+
+
+VALUES = 10000
+
+
+def _values(format_):
+    return [datetime(2017, 1, 1 + i % 28, i % 24, i % 60, i % 60).strftime(
+        format_) for i in range(VALUES)]
+
+
+def _strptime(values, format_):
+    return [datetime.strptime(value, format_) for value in values]
+
+
+def bench_datetime():
+    """Values per second of ``strptime`` and the fast path of
+    :class:`~parameter.types.Datetime` and :class:`~parameter.types.Date`."""
+    ret = {}
+    for name, format_, type_ in (
+            ("datetime", "%Y-%m-%d %H:%M:%S", types.Datetime()),
+            ("date", "%Y-%m-%d", types.Date()),
+            ("iso8601", "%Y-%m-%dT%H:%M:%S.%f",
+             types.Datetime(types.ISO8601))):
+        values = _values(format_)
+        strptime = min(timeit.repeat(lambda: _strptime(values, format_),
+                                     number=1, repeat=5))
+        fast = min(timeit.repeat(lambda: type_.convert_many(values),
+                                 number=1, repeat=5))
+        ret["%s_strptime_per_sec" % name] = VALUES / strptime
+        ret["%s_fast_per_sec" % name] = VALUES / fast
+        ret["%s_speedup" % name] = strptime / fast
+    return ret
+
+
+if __name__ == "__main__":
+    for key, value in sorted(bench_datetime().items()):
+        print("%-28s %.2f" % (key, value))
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""Throughput of the installed JSON decoders."""
+from __future__ import print_function, division, unicode_literals
+
+import json
+import timeit
+
+from parameter import decoder
+from parameter.adapter import JSONAdapter
+
+
+def _payload(records):
+    return json.dumps({
+        "id": 1,
+        "name": "payload",
+        "records": [{"id": i, "name": "name%d" % i, "score": i / 3.0,
+                     "tags": ["a", "b"]} for i in range(records)],
+    }).encode("utf8")
+
+
+# Name of the size to the payload.
+PAYLOADS = {
+    "small": _payload(1),
+    "medium": _payload(200),
+    "large": _payload(20000),
+}
+
+
+def bench_decoders():
+    """MB/s of ``JSONAdapter`` decoding bytes by each decoder."""
+    results = {}
+    for name in decoder.available_decoders():
+        loads = decoder.get_decoder(name)
+        for size, payload in sorted(PAYLOADS.items()):
+            number = max(1, 2000000 // len(payload))
+            seconds = min(timeit.repeat(
+                lambda: JSONAdapter(payload, decoder=loads),
+                number=number, repeat=3))
+            results["%s_%s_mb_per_sec" % (name, size)] = (
+                len(payload) * number / seconds / 1024 / 1024)
+    return results
+
+
+if __name__ == "__main__":
+    for key, value in sorted(bench_decoders().items()):
+        print("%-28s %.2f" % (key, value))
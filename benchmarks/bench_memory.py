@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""Memory usage of model instances."""
+from __future__ import print_function, division, unicode_literals
+
+import gc
+import tracemalloc
+
+from parameter import Model, Argument, types
+from parameter.adapter import JSONAdapter
+
+
+FIELDS = 10
+INSTANCES = 100000
+
+
+def _make_model():
+    namespace = dict(("field%d" % i, Argument(types.Integer))
+                     for i in range(FIELDS))
+    return type(Model)(str("SlotsEntity"), (Model,), namespace)
+
+
+class _DictLayoutEntity(object):
+    """The layout before slots: a ``_arguments`` dict per instance and
+    resolving each argument through ``__getattr__``."""
+
+    def __init__(self, adapter):
+        self.adapter = adapter
+        self._arguments = {}
+        for i in range(FIELDS):
+            name = "field%d" % i
+            self._arguments[name] = adapter.get_argument(name, None)
+
+    def __getattr__(self, key):
+        return self._arguments[key]
+
+
+def _measure(factory, adapter):
+    gc.collect()
+    tracemalloc.start()
+    instances = [factory(adapter) for _ in range(INSTANCES)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(instances) == INSTANCES
+    return size / INSTANCES
+
+
+def bench_instance_size():
+    """Average bytes per instance of the dict layout and the slots layout."""
+    adapter = JSONAdapter(dict(("field%d" % i, i) for i in range(FIELDS)))
+    dict_layout = _measure(_DictLayoutEntity, adapter)
+    slots_layout = _measure(_make_model(), adapter)
+
+    return {
+        "dict_layout_bytes": dict_layout,
+        "slots_layout_bytes": slots_layout,
+        "ratio": slots_layout / dict_layout,
+    }
+
+
+if __name__ == "__main__":
+    for key, value in sorted(bench_instance_size().items()):
+        print("%-20s %.2f" % (key, value))
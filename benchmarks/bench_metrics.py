@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""Overhead of the metrics hooks on creating models."""
+from __future__ import print_function, division, unicode_literals
+
+import timeit
+
+from parameter import metrics
+from parameter.adapter import JSONAdapter
+
+from benchmarks.bench_batch import BatchEntity
+
+
+MODELS = 10000
+
+
+def _noop(model_cls, field, duration, outcome):
+    pass
+
+
+def _rate(init, entities):
+    def run():
+        for entity in entities:
+            init(entity)
+
+    return MODELS / min(timeit.repeat(run, number=1, repeat=5))
+
+
+def bench_metrics():
+    """``_init`` per second, the specialized one against the instrumented
+    one with a no-op hook and with a
+    :class:`~parameter.metrics.MetricsRecorder`. The ``_init`` are called
+    directly on the created models, so only the conversion is measured."""
+    entities = [BatchEntity(JSONAdapter({
+        "id": i, "name": "name%d" % i, "score": i / 3.0, "tags": ["a", "b"],
+    })) for i in range(MODELS)]
+    specialized = vars(BatchEntity)["_init"]
+    ret = {"specialized_per_sec": _rate(specialized, entities)}
+
+    for key, hook in (("noop_hook_per_sec", _noop),
+                      ("recorder_per_sec", metrics.MetricsRecorder())):
+        metrics.add_hook(hook)
+        try:
+            ret[key] = _rate(vars(BatchEntity)["_init"], entities)
+        finally:
+            metrics.remove_hook(hook)
+
+    assert vars(BatchEntity)["_init"] is specialized
+    ret["noop_hook_overhead"] = (ret["specialized_per_sec"] /
+                                 ret["noop_hook_per_sec"])
+    ret["recorder_overhead"] = (ret["specialized_per_sec"] /
+                                ret["recorder_per_sec"])
+    return ret
+
+
+if __name__ == "__main__":
+    for key, value in sorted(bench_metrics().items()):
+        print("%-28s %.2f" % (key, value))
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""Creating models of realistic shapes: flat, wide, deeply nested and with
+multiple arguments."""
+from __future__ import print_function, division, unicode_literals
+
+import gc
+import json
+import timeit
+import tracemalloc
+
+from parameter import Model, Argument, types
+from parameter.adapter import JSONAdapter
+
+
+WIDE_FIELDS = 120
+DEPTH = 8
+ITEMS = 100
+
+
+class FlatEntity(Model):
+    id = Argument(types.Integer)
+    name = Argument(types.Unicode(max_len=50))
+    email = Argument(types.Unicode(max_len=100))
+    score = Argument(types.Double)
+    price = Argument(types.Decimal)
+    created = Argument(types.Datetime)
+    active = Argument(types.Integer, default=1)
+    level = Argument(types.Integer, default=0)
+
+
+WideEntity = type(Model)(str("WideEntity"), (Model,), dict(
+    ("field%d" % i, Argument(types.Unicode if i % 2 else types.Integer))
+    for i in range(WIDE_FIELDS)))
+
+
+def _make_deep():
+    model_cls = type(Model)(str("Level0Entity"), (Model,), {
+        "value": Argument(types.Integer)})
+    for depth in range(1, DEPTH):
+        model_cls = type(Model)(str("Level%dEntity" % depth), (Model,), {
+            "value": Argument(types.Integer),
+            "child": Argument(types.Nested(model_cls)),
+        })
+    return model_cls
+
+
+DeepEntity = _make_deep()
+
+
+class MultipleEntity(Model):
+    ids = Argument(types.Integer, multiple=True)
+    scores = Argument(types.Double(packed=True), multiple=True)
+    tags = Argument(types.Unicode, multiple=True)
+    names = Argument(types.String, multiple=True)
+    days = Argument(types.Date, multiple=True)
+
+
+def _flat():
+    return {"id": 1, "name": "name", "email": "name@example.com",
+            "score": 1.5, "price": "9.99", "created": "2017-01-01 08:00:00"}
+
+
+def _wide():
+    return dict(("field%d" % i, "value%d" % i if i % 2 else i)
+                for i in range(WIDE_FIELDS))
+
+
+def _deep():
+    data = {"value": 0}
+    for depth in range(1, DEPTH):
+        data = {"value": depth, "child": data}
+    return data
+
+
+def _multiple():
+    return {"ids": list(range(ITEMS)),
+            "scores": [i / 3.0 for i in range(ITEMS)],
+            "tags": ["tag%d" % i for i in range(ITEMS)],
+            "names": ["name%d" % i for i in range(ITEMS)],
+            "days": ["2017-01-%02d" % (1 + i % 28) for i in range(ITEMS)]}
+
+
+# Name of the shape to the model and the data.
+SHAPES = {
+    "flat": (FlatEntity, _flat()),
+    "wide": (WideEntity, _wide()),
+    "deep": (DeepEntity, _deep()),
+    "multiple": (MultipleEntity, _multiple()),
+}
+
+
+def _rate(func, number):
+    return number / min(timeit.repeat(func, number=number, repeat=5))
+
+
+def bench_models():
+    """Models per second of each shape, from a dict and from JSON bytes."""
+    ret = {}
+    for name, (model_cls, data) in sorted(SHAPES.items()):
+        payload = json.dumps(data).encode("utf8")
+        number = max(100, 200000 // len(payload))
+        ret["%s_models_per_sec" % name] = _rate(
+            lambda: model_cls(JSONAdapter(data)), number)
+        ret["%s_json_models_per_sec" % name] = _rate(
+            lambda: model_cls(JSONAdapter(payload)), number)
+    return ret
+
+
+def bench_model_memory():
+    """Average bytes allocated per instance of each shape, including the
+    converted values and the nested instances."""
+    ret = {}
+    for name, (model_cls, data) in sorted(SHAPES.items()):
+        adapter = JSONAdapter(data)
+        model_cls(adapter)
+        gc.collect()
+        tracemalloc.start()
+        instances = [model_cls(adapter) for _ in range(1000)]
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        ret["%s_instance_bytes" % name] = size / len(instances)
+    return ret
+
+
+if __name__ == "__main__":
+    for func in (bench_models, bench_model_memory):
+        for key, value in sorted(func().items()):
+            print("%-28s %.2f" % (key, value))
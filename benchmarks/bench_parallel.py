@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""Parallel validation with different numbers of workers."""
+from __future__ import print_function, division, unicode_literals
+
+import multiprocessing
+import timeit
+
+from parameter.parallel import validate_parallel
+
+from benchmarks.bench_batch import BatchEntity
+
+
+RECORDS = 100000
+WORKERS = (1, 2, 4, 8)
+
+
+def _records():
+    return [{"id": i, "name": "name%d" % i, "score": i / 3.0,
+             "tags": ["a", "b"]} for i in range(RECORDS)]
+
+
+def bench_validate_parallel():
+    """Records per second of ``validate_many`` and ``validate_parallel``
+    with the pools of :data:`WORKERS`."""
+    records = _records()
+    serial = min(timeit.repeat(
+        lambda: list(BatchEntity.validate_many(records)), number=1,
+        repeat=3))
+    ret = {
+        "cpus": multiprocessing.cpu_count(),
+        "serial_records_per_sec": RECORDS / serial,
+    }
+
+    for workers in WORKERS:
+        pool = multiprocessing.Pool(workers)
+        try:
+            # Starts the workers.
+            list(validate_parallel(BatchEntity, records[:workers],
+                                   chunk_size=1, pool=pool))
+            elapsed = min(timeit.repeat(
+                lambda: list(validate_parallel(
+                    BatchEntity, records, processes=workers, pool=pool)),
+                number=1, repeat=3))
+        finally:
+            pool.terminate()
+            pool.join()
+
+        ret["workers_%d_records_per_sec" % workers] = RECORDS / elapsed
+        ret["workers_%d_speedup" % workers] = serial / elapsed
+    return ret
+
+
+if __name__ == "__main__":
+    for key, value in sorted(bench_validate_parallel().items()):
+        print("%-32s %.2f" % (key, value))
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""Micro benchmarks of the types."""
+from __future__ import print_function, division, unicode_literals
+
+import timeit
+
+from parameter import types
+
+
+VALUES = 10000
+
+
+def _values(make):
+    return [make(i) for i in range(VALUES)]
+
+
+# Name to the type and the raw values, which are the common inputs of a
+# request.
+TYPES = {
+    "integer": (types.Integer(), _values(lambda i: i)),
+    "integer_text": (types.Integer(), _values(lambda i: "%d" % i)),
+    "integer_range": (types.Integer(min_value=0, max_value=VALUES),
+                      _values(lambda i: i)),
+    "double": (types.Double(), _values(lambda i: i / 3.0)),
+    "decimal": (types.Decimal(), _values(lambda i: "%d.99" % i)),
+    "unicode": (types.Unicode(max_len=16), _values(lambda i: "v%d" % i)),
+    "unicode_pattern": (types.Unicode(pattern="v[0-9]+"),
+                        _values(lambda i: "v%d" % i)),
+    "string": (types.String(), _values(lambda i: "v%d" % i)),
+    "datetime": (types.Datetime(), _values(
+        lambda i: "2017-01-%02d 08:%02d:00" % (1 + i % 28, i % 60))),
+    "datetime_iso8601": (types.Datetime(types.ISO8601), _values(
+        lambda i: "2017-01-%02dT08:%02d:00Z" % (1 + i % 28, i % 60))),
+    "date": (types.Date(), _values(lambda i: "2017-01-%02d" % (1 + i % 28))),
+    "choice": (types.Choice(["open", "closed", "pending"]),
+               _values(lambda i: ("open", "closed", "pending")[i % 3])),
+    "list": (types.List(types.Integer, max_items=10),
+             _values(lambda i: [i, i + 1, i + 2])),
+}
+
+
+def bench_types():
+    """Values per second of ``convert`` one by one and ``convert_many`` of
+    each type."""
+    ret = {}
+    for name, (type_, values) in sorted(TYPES.items()):
+        convert = type_.convert
+        one = min(timeit.repeat(lambda: [convert(val) for val in values],
+                                number=1, repeat=5))
+        many = min(timeit.repeat(lambda: type_.convert_many(values),
+                                 number=1, repeat=5))
+        ret["%s_convert_per_sec" % name] = VALUES / one
+        ret["%s_convert_many_per_sec" % name] = VALUES / many
+    return ret
+
+
+if __name__ == "__main__":
+    for key, value in sorted(bench_types().items()):
+        print("%-40s %.2f" % (key, value))
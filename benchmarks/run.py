@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""Run the benchmarks, save the results as a baseline, or compare them with
+a baseline and fail on regressions.
+
+Usage::
+
+    $ python -m benchmarks.run --save baseline.json
+    $ python -m benchmarks.run --compare baseline.json --threshold 0.2
+    $ python -m benchmarks.run bench_types bench_models --compare baseline.json
+
+The measurements are compared by the suffix of their names:
+
+- ``*_per_sec`` and ``*speedup`` are better if higher, it's a regression if
+  the value drops more than the threshold.
+- ``*_bytes`` are better if lower, it's a regression if the value grows more
+  than the threshold.
+- The others are informational.
+
+The baselines depend on the machine, compare the results on the same machine
+only. The process exits with status 1 if there is any regression.
+"""
+from __future__ import print_function, division, unicode_literals
+
+import argparse
+import importlib
+import inspect
+import json
+import pkgutil
+import platform
+import sys
+
+import benchmarks
+
+
+HIGHER_IS_BETTER = ("_per_sec", "speedup")
+LOWER_IS_BETTER = ("_bytes",)
+
+
+def discover():
+    """Returns the names of the benchmark modules."""
+    return sorted(name for _, name, _ in pkgutil.iter_modules(
+        benchmarks.__path__) if name.startswith("bench_"))
+
+
+def run(modules):
+    """Run the ``bench_*`` functions of ``modules``, returns a dict maps
+    ``module.function.measurement`` to the value."""
+    results = {}
+    for name in modules:
+        module = importlib.import_module("benchmarks.%s" % name)
+        for func_name, func in sorted(inspect.getmembers(
+                module, inspect.isfunction)):
+            if (not func_name.startswith("bench_") or
+                    func.__module__ != module.__name__):
+                continue
+            print("running %s.%s" % (name, func_name), file=sys.stderr)
+            for key, value in func().items():
+                results["%s.%s.%s" % (name, func_name, key)] = value
+    return results
+
+
+def direction(key):
+    """Returns 1 if the measurement is better if higher, -1 if lower, or 0
+    if it's informational."""
+    if key.endswith(HIGHER_IS_BETTER):
+        return 1
+    if key.endswith(LOWER_IS_BETTER):
+        return -1
+    return 0
+
+
+def compare(baseline, results, threshold):
+    """Returns a list of ``(key, baseline, current, change)`` of the
+    regressions, ``change`` is relative to the baseline."""
+    regressions = []
+    for key, current in sorted(results.items()):
+        sign = direction(key)
+        base = baseline.get(key)
+        if not sign or not base:
+            continue
+        change = (current - base) / base
+        if change * sign < -threshold:
+            regressions.append((key, base, current, change))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.run",
+        description="Run the benchmarks and gate the regressions.")
+    parser.add_argument("modules", nargs="*",
+                        help="benchmark modules, default all: %s" % ", ".join(
+                            discover()))
+    parser.add_argument("--save", metavar="FILE",
+                        help="save the results as a baseline")
+    parser.add_argument("--compare", metavar="FILE",
+                        help="compare the results with a baseline")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="relative change regarded as a regression, "
+                        "default 0.2")
+    args = parser.parse_args(argv)
+
+    results = run(args.modules or discover())
+    for key, value in sorted(results.items()):
+        print("%-60s %14.2f" % (key, value))
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({"python": platform.python_version(),
+                       "results": results}, f, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(baseline, results, args.threshold)
+        for key, base, current, change in regressions:
+            print("REGRESSION %s: %.2f -> %.2f (%+.1f%%)" % (
+                key, base, current, change * 100))
+        if regressions:
+            return 1
+        print("No regression beyond %.0f%%." % (args.threshold * 100))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
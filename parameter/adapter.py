@@ -3,12 +3,51 @@
 """This module provides predefined adapter."""
 from __future__ import print_function, division, unicode_literals
 
-import json
+import functools
+import re
 
 import six
 
+from six.moves.urllib.parse import unquote_to_bytes
+
+from . import binary
+from . import types
+from .decoder import get_decoder
 from .model import BaseAdapter
-from .exception import ArgumentInvalidError
+from .multipart import MultipartParser, UploadedFile, parse_options_header
+from .multipart import DEFAULT_SPOOL_SIZE
+from .scanner import JSONObjectScanner, DEFAULT_CHUNK_SIZE
+from .exception import ArgumentInvalidError, MaxlenExceedError
+from .exception import MaxsizeExceedError
+
+
+_json_string_types = (six.binary_type, six.text_type, bytearray, memoryview)
+
+# Same as what ``tornado.web.RequestHandler`` replaces in arguments.
+_remove_control_chars = re.compile(r"[\x00-\x08\x0e-\x1f]").sub
+
+
+def _spawn_limited(adapter, spawn, data):
+    depth = adapter.limits.check_depth(adapter.depth + 1)
+    child = spawn(data)
+    if isinstance(child, JSONAdapter):
+        child.limits = adapter.limits
+        child.depth = depth
+    return child
+
+
+class _spawnmethod(object):
+    """A :func:`staticmethod` of ``spawn``, but accessed on an adapter with
+    limits, it spawns the adapters which inherit the limits."""
+
+    def __init__(self, func):
+        self.__func__ = func
+        self.__doc__ = func.__doc__
+
+    def __get__(self, adapter, owner=None):
+        if adapter is None or adapter.limits is None:
+            return self.__func__
+        return functools.partial(_spawn_limited, adapter, self.__func__)
 
 
 class TornadoAdapter(BaseAdapter):
@@ -55,6 +94,182 @@ class TornadoAdapter(BaseAdapter):
         return self.handler.get_arguments(name, *args, **kwargs)
 
 
+class PrefetchTornadoAdapter(BaseAdapter):
+    """Tornado adapter which decodes the arguments once.
+
+    :class:`TornadoAdapter` calls ``handler.get_argument`` per argument,
+    which decodes and strips the values on every call. This adapter decodes
+    the values of the arguments that the model needs into a table at once,
+    with the same semantics of ``handler.get_argument``, includes the
+    overridden ``decode_argument``.
+
+    Usage::
+
+        class DemoHandler(web.RequestHandler):
+            def post(self):
+                entity = UserEntity(PrefetchTornadoAdapter(self, UserEntity))
+    """
+
+    def __init__(self, handler, model_cls=None, source="arguments",
+                 strip=True):
+        """Initialize
+
+        :param handler: Instance of Tornado RequestHandler.
+        :type handler: :class:`tornado.web.RequestHandler`
+        :param model_cls:
+            Subclass of :class:`~parameter.model.Model`, only the arguments
+            declared by it are decoded, all arguments are decoded if it's
+            ``None``.
+        :param source:
+            Attribute of the request to get the arguments from, it can be
+            ``"arguments"``, ``"query_arguments"`` or ``"body_arguments"``.
+        :param strip: Strip the whitespaces of the values.
+        """
+        self.handler = handler
+        arguments = getattr(handler.request, source)
+        if model_cls is None:
+            names = list(arguments)
+        else:
+            names = set(arg.name for _, arg in model_cls._meta_arguments)
+
+        decode = handler.decode_argument
+        self.arguments = table = {}
+        for name in names:
+            raw = arguments.get(name)
+            if not raw:
+                continue
+
+            values = []
+            for val in raw:
+                val = decode(val, name=name)
+                if isinstance(val, six.text_type):
+                    val = _remove_control_chars(" ", val)
+                values.append(val.strip() if strip else val)
+            table[name] = values
+
+    def get_argument(self, name, default):
+        values = self.arguments.get(name)
+        if not values:
+            return default
+        return values[-1]
+
+    def get_arguments(self, name):
+        return list(self.arguments.get(name, ()))
+
+
+class QueryStringAdapter(BaseAdapter):
+    """Adapter to get arguments from a query string or an
+    ``application/x-www-form-urlencoded`` body.
+
+    The pairs are indexed in one pass on the first access, only the offsets
+    of the values are kept, a value is percent-decoded when its argument is
+    requested. The semantics are the same as :func:`urllib.parse.parse_qs`,
+    except ``get_argument`` returns the last value of a repeated key, as
+    :class:`TornadoAdapter` does.
+
+    Usage::
+
+        def application(environ, start_response):
+            entity = UserEntity(QueryStringAdapter.from_environ(environ))
+    """
+
+    def __init__(self, data, encoding="utf8", keep_blank_values=False):
+        """Initialize
+
+        :param data:
+            The query string or the body, an instance of bytes, str,
+            bytearray or memoryview.
+        :param encoding: Encoding of the values.
+        :param keep_blank_values:
+            If ``True``, the blank values are kept as empty strings,
+            otherwise they are ignored.
+        """
+        if isinstance(data, six.text_type):
+            data = data.encode(encoding)
+        # ``bytes`` of a memoryview is its repr on Python 2.
+        self.data = (data.tobytes() if isinstance(data, memoryview)
+                     else bytes(data))
+        self.encoding = encoding
+        self.keep_blank_values = keep_blank_values
+        self._index = None
+        self._values = {}
+
+    @classmethod
+    def from_environ(cls, environ, source="query", **kwargs):
+        """Create from a WSGI environ.
+
+        :param environ: The WSGI environ.
+        :param source:
+            ``"query"`` to get the arguments from ``QUERY_STRING``,
+            ``"body"`` to read the form from ``wsgi.input``.
+        :param kwargs: See :meth:`__init__`.
+        """
+        if source == "query":
+            data = environ.get("QUERY_STRING", "")
+            if isinstance(data, six.text_type):
+                # Native strings of WSGI are decoded by latin-1.
+                data = data.encode("latin-1")
+        else:
+            length = int(environ.get("CONTENT_LENGTH") or 0)
+            data = environ["wsgi.input"].read(length) if length > 0 else b""
+        return cls(data, **kwargs)
+
+    def _build_index(self):
+        """Map the keys to the offsets of values."""
+        data = self.data
+        find = data.find
+        keep_blank_values = self.keep_blank_values
+        index = {}
+        start = 0
+        end = len(data)
+        while start < end:
+            stop = find(b"&", start)
+            if stop < 0:
+                stop = end
+
+            if stop > start:
+                equal = find(b"=", start, stop)
+                if equal < 0:
+                    key_stop = value_start = stop
+                else:
+                    key_stop, value_start = equal, equal + 1
+
+                if value_start < stop or keep_blank_values:
+                    key = data[start:key_stop]
+                    if b"%" in key or b"+" in key:
+                        key = self._decode(key).encode(self.encoding)
+                    index.setdefault(key, []).append((value_start, stop))
+            start = stop + 1
+        return index
+
+    def _decode(self, raw):
+        if b"%" in raw or b"+" in raw:
+            raw = unquote_to_bytes(raw.replace(b"+", b" "))
+        return raw.decode(self.encoding, "replace")
+
+    def _get_values(self, name):
+        values = self._values.get(name)
+        if values is None:
+            if self._index is None:
+                self._index = self._build_index()
+
+            data = self.data
+            values = self._values[name] = [
+                self._decode(data[start:stop])
+                for start, stop in self._index.get(
+                    name.encode(self.encoding), ())]
+        return values
+
+    def get_argument(self, name, default):
+        values = self._get_values(name)
+        if not values:
+            return default
+        return values[-1]
+
+    def get_arguments(self, name):
+        return list(self._get_values(name))
+
+
 class JSONAdapter(BaseAdapter):
     """JSON adapter to get arguments from a JSON object.
 
@@ -101,19 +316,40 @@ class JSONAdapter(BaseAdapter):
         print(entity.person.name)   # Gray
     """
 
-    def __init__(self, data):
+    #: The :class:`~parameter.limits.Limits` of the request, which is
+    #: inherited by the spawned adapters.
+    limits = None
+    #: Nesting depth of the object, the top-level object is at depth 1.
+    depth = 1
+
+    def __init__(self, data, decoder=None, limits=None):
         """Initialize
 
         :param data:
-            JSON Data, it can be an instance of str or dict,
-            if it is an instance of str it must be an json string.
+            JSON Data, it can be an instance of str, bytes, bytearray,
+            memoryview or dict, if it is not a dict it must be an json
+            string, which is passed to the decoder without copying.
+        :param decoder:
+            Name of the decoder or a decoder, see :mod:`parameter.decoder`.
+            Use the default decoder if it's ``None``.
+        :param limits:
+            A :class:`~parameter.limits.Limits`, which is checked before
+            decoding the JSON string.
+        :raises: :class:`~parameter.exception.LimitExceededError`
         """
+        if limits is not None:
+            self.limits = limits
 
-        if isinstance(data, six.binary_type):
-            data = data.decode("utf8")
+        if type(data) is dict:
+            self.data = data
+            return
 
-        if isinstance(data, six.text_type):
-            data = json.loads(data)
+        if isinstance(data, _json_string_types):
+            if limits is not None:
+                limits.check_json(data)
+            if not callable(decoder):
+                decoder = get_decoder(decoder)
+            data = decoder(data)
 
         if not isinstance(data, dict):
             raise TypeError("``data`` must be a json string or dict")
@@ -133,6 +369,313 @@ class JSONAdapter(BaseAdapter):
 
         return ret
 
-    @staticmethod
+    @_spawnmethod
     def spawn(data):
+        """Spawn an adapter for :class:`~parameter.types.Nested`, which
+        inherits the limits if it's called on an adapter with limits.
+
+        :raises: :class:`~parameter.exception.LimitExceededError` if the
+            nesting depth exceeds the limit.
+        """
         return JSONAdapter(data)
+
+
+class MessagePackAdapter(JSONAdapter):
+    """Adapter to get arguments from a MessagePack map.
+
+    The map is decoded by :func:`parameter.binary.unpackb`, the nested maps
+    are spawned as :class:`MessagePackAdapter` for
+    :class:`~parameter.types.Nested`.
+
+    Usage::
+
+        entity = DataEntity(MessagePackAdapter(request.body))
+    """
+
+    def __init__(self, data, decoder=None, limits=None):
+        """Initialize
+
+        :param data:
+            MessagePack data, it can be an instance of bytes, bytearray,
+            memoryview or dict.
+        :param decoder:
+            A callable to decode the data, defaults to
+            :func:`parameter.binary.unpackb`.
+        :param limits:
+            A :class:`~parameter.limits.Limits`, ``max_bytes`` is checked
+            before decoding, and the others are checked while decoding, or
+            on the decoded map if ``decoder`` is given.
+        :raises: :class:`~parameter.exception.LimitExceededError`
+        """
+        if limits is not None:
+            self.limits = limits
+
+        if type(data) is not dict and isinstance(
+                data, (six.binary_type, bytearray, memoryview)):
+            if limits is not None:
+                limits.check_size(data)
+            if decoder is None:
+                data = binary.unpackb(data, limits)
+            else:
+                data = decoder(data)
+                if limits is not None:
+                    limits.check_object(data)
+
+        if not isinstance(data, dict):
+            raise TypeError("``data`` must be a MessagePack map or dict")
+
+        self.data = data
+
+    @_spawnmethod
+    def spawn(data):
+        return MessagePackAdapter(data)
+
+
+def _columns_length(columns):
+    """Returns the number of rows of a dict of columns, the dicts of columns
+    of the nested models are counted too, or ``None`` if there is no list
+    column."""
+    lengths = set()
+    for column in columns.values():
+        if isinstance(column, (list, tuple)):
+            lengths.add(len(column))
+        elif isinstance(column, dict):
+            length = _columns_length(column)
+            if length is not None:
+                lengths.add(length)
+    if len(lengths) > 1:
+        raise ValueError("Columns have different lengths: %s."
+                         % sorted(lengths))
+    return lengths.pop() if lengths else None
+
+
+class ColumnarAdapter(JSONAdapter):
+    """Adapter of data in columns, e.g. ``{"ts": [...], "value": [...]}``,
+    see :meth:`~parameter.model.Model.validate_columns`.
+
+    The value of an argument is the list of its values of all rows, the
+    value of a nested model is a dict of columns.
+    """
+
+    def __init__(self, data, decoder=None):
+        """Initialize
+
+        :param data: A dict of columns, or a JSON string of it.
+        :param decoder:
+            Name of the decoder or a decoder, see :mod:`parameter.decoder`.
+        :raises: :class:`ValueError` if the columns have different lengths.
+        """
+        super(ColumnarAdapter, self).__init__(data, decoder)
+
+        for name, column in self.data.items():
+            if not isinstance(column, (list, tuple, dict)):
+                raise TypeError("Column ``%s`` must be a list, but got %s."
+                                % (name, type(column)))
+        #: Number of rows, ``None`` if there is no list column.
+        self.length = _columns_length(self.data)
+
+    @staticmethod
+    def spawn(data):
+        return ColumnarAdapter(data)
+
+
+class StreamingJSONAdapter(JSONAdapter):
+    """JSON adapter to get arguments from a stream of JSON object.
+
+    The stream is parsed incrementally, only the arguments declared by the
+    model are decoded, other keys are skipped without building any object,
+    so the memory doesn't grow with the size of unused values.
+
+    Usage::
+
+        from parameter import Model, Argument, types
+        from parameter.adapter import StreamingJSONAdapter
+
+        class DataEntity(Model):
+            a = Argument(types.Integer)
+            b = Argument(types.Integer)
+
+        with open("upload.json", "rb") as f:
+            entity = DataEntity(StreamingJSONAdapter(f, DataEntity))
+    """
+
+    def __init__(self, stream, model_cls, chunk_size=DEFAULT_CHUNK_SIZE,
+                 decoder=None):
+        """Initialize
+
+        :param stream:
+            A file-like object which has a ``read`` method, or an iterable
+            of bytes chunks.
+        :param model_cls:
+            Subclass of :class:`~parameter.model.Model`, the names of its
+            arguments are decoded.
+        :param chunk_size: Size to read from a file-like object at once.
+        :param decoder:
+            Name of the decoder or a decoder to decode the values, see
+            :mod:`parameter.decoder`.
+        """
+        names = set(arg.name for _, arg in model_cls._meta_arguments)
+        self.data = JSONObjectScanner(stream, chunk_size,
+                                      decoder).scan(names)
+
+
+class TornadoJSONAdapter(JSONAdapter):
+    """Tornado adapter to get arguments from the JSON body of the request.
+
+    The body is decoded once and cached on the handler, so the models created
+    in the same request share the decoded object.
+
+    Usage::
+
+        class DemoHandler(web.RequestHandler):
+            def post(self):
+                user = UserEntity(TornadoJSONAdapter(self))
+                address = AddressEntity(TornadoJSONAdapter(self))
+    """
+
+    #: Attribute of the handler to cache the decoded body.
+    cache_attr = "_parameter_json_body"
+
+    def __init__(self, handler, decoder=None, limits=None):
+        """Initialize
+
+        :param handler: Instance of Tornado RequestHandler.
+        :type handler: :class:`tornado.web.RequestHandler`
+        :param decoder:
+            Name of the decoder or a decoder, see :mod:`parameter.decoder`.
+        :param limits: A :class:`~parameter.limits.Limits`.
+        """
+        data = getattr(handler, self.cache_attr, None)
+        if data is None:
+            super(TornadoJSONAdapter, self).__init__(handler.request.body,
+                                                     decoder, limits)
+            setattr(handler, self.cache_attr, self.data)
+        else:
+            self.data = data
+            if limits is not None:
+                self.limits = limits
+        self.handler = handler
+
+
+class MultipartAdapter(BaseAdapter):
+    """Adapter to get arguments from a ``multipart/form-data`` body.
+
+    The body is parsed incrementally from a stream. The fields are kept in
+    memory as text, the files are spooled to temporary files when they are
+    larger than ``spool_size``, and the values are :class:`File
+    <parameter.types.File>`. Only the arguments declared by the model are
+    kept, the other parts are skipped.
+
+    The limits are enforced while streaming, the parsing is aborted as soon
+    as a file exceeds the ``max_size`` of :class:`~parameter.types.File`, or
+    a field exceeds the ``max_len`` of :class:`~parameter.types.String`.
+
+    Usage::
+
+        class UploadEntity(Model):
+            title = Argument(types.Unicode(max_len=100))
+            image = Argument(types.File(max_size=10 * 1024 * 1024))
+
+        adapter = MultipartAdapter(environ["wsgi.input"], UploadEntity,
+                                   environ["CONTENT_TYPE"])
+        try:
+            entity = UploadEntity(adapter)
+            save(entity.title, entity.image.file)
+        finally:
+            adapter.close()
+    """
+
+    def __init__(self, stream, model_cls, content_type,
+                 chunk_size=DEFAULT_CHUNK_SIZE, spool_size=DEFAULT_SPOOL_SIZE,
+                 encoding="utf8"):
+        """Initialize
+
+        :param stream:
+            A file-like object which has a ``read`` method, or an iterable
+            of bytes chunks.
+        :param model_cls: Subclass of :class:`~parameter.model.Model`.
+        :param content_type:
+            The ``Content-Type`` header which has the boundary.
+        :param chunk_size: Size to read from a file-like object at once.
+        :param spool_size:
+            Files larger than this size in bytes are spooled to temporary
+            files.
+        :param encoding: Encoding of the fields.
+        :raises: :class:`ValueError` if the body is malformed.
+        :raises:
+            :class:`~parameter.exception.ArgumentInvalidError` if a limit is
+            exceeded.
+        """
+        _, params = parse_options_header(content_type)
+        self.arguments = {}
+        self.encoding = encoding
+        self._spool_size = spool_size
+        self._limits = dict((arg.name, arg) for _, arg in
+                            model_cls._meta_arguments)
+        try:
+            MultipartParser(stream, params.get("boundary", ""),
+                            chunk_size).parse(self._open_part)
+        except Exception:
+            self.close()
+            raise
+
+        for values in self.arguments.values():
+            for i, val in enumerate(values):
+                if isinstance(val, UploadedFile):
+                    val.seek(0)
+                else:
+                    values[i] = bytes(val).decode(encoding, "replace")
+
+    def _open_part(self, name, filename, content_type):
+        arg = self._limits.get(name)
+        if arg is None:
+            return None
+
+        if filename is not None:
+            value = UploadedFile(name, filename, content_type,
+                                 self._spool_size)
+            append = value.write
+            limit = getattr(arg.type_, "max_size", None)
+            error = MaxsizeExceedError(limit)
+        else:
+            value = bytearray()
+            append = value.extend
+            limit = getattr(arg.type_, "max_len", None)
+            error = MaxlenExceedError(limit)
+            type_ = arg.type_
+            if isinstance(type_, types.Cached):
+                type_ = type_.type_
+            if limit is not None and isinstance(type_, types.Unicode):
+                # A character takes 4 bytes at most in UTF-8, the exact
+                # length is checked by the type.
+                limit *= 4
+        self.arguments.setdefault(name, []).append(value)
+
+        if limit is None:
+            return append
+
+        written = [0]
+
+        def write(data):
+            written[0] += len(data)
+            if written[0] > limit:
+                raise ArgumentInvalidError(arg.invalid_message, arg.name,
+                                           error)
+            append(data)
+        return write
+
+    def get_argument(self, name, default):
+        values = self.arguments.get(name)
+        if not values:
+            return default
+        return values[-1]
+
+    def get_arguments(self, name):
+        return list(self.arguments.get(name, ()))
+
+    def close(self):
+        """Close the spooled files."""
+        for values in self.arguments.values():
+            for val in values:
+                if isinstance(val, UploadedFile):
+                    val.close()
@@ -0,0 +1,257 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""Create models in asyncio applications, requires Python 3.5+.
+
+The methods of :class:`AsyncAdapter` are coroutines, so an adapter can wait
+for the request body without blocking the event loop. :func:`create` fetches
+all arguments from the adapter first, then converts them synchronously, in
+an executor if the payload is large, so a huge request doesn't hold the event
+loop while the other coroutines are waiting::
+
+    from aiohttp import web
+
+    from parameter.aio import AsyncJSONAdapter
+
+    async def handle(request):
+        entity = await UserEntity.create_async(
+            AsyncJSONAdapter(request.read()))
+        return web.json_response({"name": entity.name})
+"""
+from __future__ import print_function, division, unicode_literals
+
+import abc
+import asyncio
+import functools
+import inspect
+
+from .decoder import get_decoder
+from .exception import ArgumentInvalidError
+from .model import BaseAdapter, Argument
+from .types import Nested
+
+#: Payloads larger than this size in bytes are decoded and converted in an
+#: executor.
+DEFAULT_OFFLOAD_SIZE = 64 * 1024
+
+
+class AsyncAdapter(BaseAdapter):
+    """Base class of the asynchronous adapters.
+
+    Example::
+
+        from parameter.aio import AsyncAdapter
+
+
+        class DemoAdapter(AsyncAdapter):
+            def __init__(self, request):
+                self.request = request
+
+            async def prepare(self, offload):
+                self.form = await self.request.post()
+                self.size = self.request.content_length
+
+            async def get_argument(self, name, default):
+                return self.form.get(name, default)
+
+            async def get_arguments(self, name):
+                return self.form.getall(name, [])
+    """
+
+    #: Size of the payload in bytes, the conversion runs in an executor if
+    #: it's larger than the ``offload_size`` of :func:`create`. ``None``
+    #: means unknown.
+    size = None
+
+    async def prepare(self, offload):
+        """Wait for the payload to be available, it's called once before
+        fetching the arguments.
+
+        :param offload:
+            A coroutine function ``offload(func, *args)`` which calls
+            ``func(*args)`` in the executor if the payload is large, use it to
+            run the CPU-heavy work like decoding.
+        """
+
+    @abc.abstractmethod
+    async def get_argument(self, name, default):
+        """Returns the argument's value via ``name``.
+
+        :raises: :class:`~parameter.exception.ArgumentMissError`
+        :raises: :class:`~parameter.exception.ArgumentInvalidError`
+        """
+
+    @abc.abstractmethod
+    async def get_arguments(self, name):
+        """Returns the argument's values via ``name``.
+
+        :raises: :class:`~parameter.exception.ArgumentMissError`
+        :raises: :class:`~parameter.exception.ArgumentInvalidError`
+        """
+
+    async def spawn(self, val):
+        """Use the new value to spawn an new adapter of this adapter."""
+        raise NotImplementedError()
+
+
+class AsyncJSONAdapter(AsyncAdapter):
+    """Asynchronous adapter to get arguments from a JSON object.
+
+    Usage::
+
+        adapter = AsyncJSONAdapter(request.read())
+        entity = await DataEntity.create_async(adapter)
+    """
+
+    def __init__(self, data, decoder=None):
+        """Initialize
+
+        :param data:
+            A dict, a JSON string, or an awaitable returns one of them, e.g.
+            the body of a request which is being received.
+        :param decoder:
+            Name of the decoder or a decoder, see :mod:`parameter.decoder`.
+        """
+        self.data = data
+        self.decoder = decoder
+
+    async def prepare(self, offload):
+        data = self.data
+        if inspect.isawaitable(data):
+            data = await data
+
+        if type(data) is not dict:
+            if hasattr(data, "__len__"):
+                self.size = len(data)
+
+            decoder = self.decoder
+            if not callable(decoder):
+                decoder = get_decoder(decoder)
+            data = await offload(_decode_object, decoder, data)
+        self.data = data
+
+    async def get_argument(self, name, default):
+        return self.data.get(name, default)
+
+    async def get_arguments(self, name):
+        ret = self.data.get(name)
+
+        if not isinstance(ret, (list, tuple)):
+            raise ArgumentInvalidError(
+                "``%s`` except a sequence, but got %s." % (
+                    name, type(ret)), name, TypeError())
+
+        return ret
+
+    async def spawn(self, val):
+        if not isinstance(val, dict):
+            raise TypeError("``data`` must be a json string or dict")
+        return AsyncJSONAdapter(val)
+
+
+def _decode_object(decoder, data):
+    data = decoder(data)
+    if not isinstance(data, dict):
+        raise TypeError("``data`` must be a json string or dict")
+    return data
+
+
+class _Failure(object):
+    """The exception raised while fetching, which is re-raised when the model
+    gets the argument, so the model fails at the same argument as the
+    synchronous way."""
+    __slots__ = ("error",)
+
+    def __init__(self, error):
+        self.error = error
+
+
+class _PrefetchedAdapter(BaseAdapter):
+    """Synchronous adapter of the arguments fetched from an asynchronous
+    adapter."""
+
+    def __init__(self, values):
+        self.values = values
+
+    def get_argument(self, name, default):
+        ret = self.values.get(name, default)
+        if type(ret) is _Failure:
+            raise ret.error
+        return ret
+
+    def get_arguments(self, name):
+        ret = self.values.get(name, [])
+        if type(ret) is _Failure:
+            raise ret.error
+        return ret
+
+    @staticmethod
+    def spawn(val):
+        if type(val) is _Failure:
+            raise val.error
+        return val
+
+
+async def _spawn(model_cls, adapter, val):
+    if Argument.is_init_default(val):
+        return val
+
+    try:
+        child = await adapter.spawn(val)
+    except (TypeError, ValueError) as e:
+        return _Failure(e)
+    return await _prefetch(model_cls, child)
+
+
+async def _prefetch(model_cls, adapter):
+    """Fetch the arguments of ``model_cls`` and the nested models."""
+    values = {}
+    for _, arg in model_cls._meta_arguments:
+        nested = arg.type_.model_cls if isinstance(arg.type_, Nested) else None
+        try:
+            if arg.multiple:
+                val = arg.check_items(await adapter.get_arguments(arg.name))
+                if nested is not None:
+                    # ``await`` in comprehensions requires Python 3.6.
+                    spawned = []
+                    for v in val:
+                        spawned.append(await _spawn(nested, adapter, v))
+                    val = spawned
+            else:
+                val = await adapter.get_argument(arg.name, arg.default)
+                if nested is not None:
+                    val = await _spawn(nested, adapter, val)
+        except Exception as e:      # pylint: disable=broad-except
+            val = _Failure(e)
+        values[arg.name] = val
+    return _PrefetchedAdapter(values)
+
+
+async def create(model_cls, adapter, executor=None,
+                 offload_size=DEFAULT_OFFLOAD_SIZE):
+    """Create an instance of ``model_cls`` from an asynchronous adapter.
+
+    The ``adapter`` of the instance is a synchronous adapter which holds the
+    fetched arguments.
+
+    :param model_cls: Subclass of :class:`~parameter.model.Model`.
+    :param adapter: Instance of :class:`AsyncAdapter`.
+    :param executor:
+        The executor to offload, the default executor of the event loop is
+        used if it's ``None``.
+    :param offload_size:
+        Payloads larger than this size in bytes are decoded and converted in
+        the executor.
+    :raises: :class:`~parameter.exception.ArgumentMissError`
+    :raises: :class:`~parameter.exception.ArgumentInvalidError`
+    """
+    loop = asyncio.get_event_loop()
+
+    async def offload(func, *args):
+        if adapter.size is not None and adapter.size > offload_size:
+            return await loop.run_in_executor(
+                executor, functools.partial(func, *args))
+        return func(*args)
+
+    await adapter.prepare(offload)
+    prefetched = await _prefetch(model_cls, adapter)
+    return await offload(model_cls, prefetched)
@@ -0,0 +1,356 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""MessagePack codec.
+
+A pure Python implementation of `MessagePack <https://msgpack.org>`_ is
+provided, the `msgpack <https://pypi.org/project/msgpack/>`_ package is used
+instead if it's installed. See :class:`~parameter.adapter.MessagePackAdapter`.
+
+The strings are decoded as text and the binaries as bytes, the timestamps
+are decoded as :class:`~datetime.datetime` in UTC, and the other extension
+types are decoded as :class:`ExtType`.
+"""
+from __future__ import print_function, division, unicode_literals
+
+import collections
+import functools
+import itertools
+import struct
+
+from datetime import datetime, timedelta
+
+import six
+
+from .exception import LimitExceededError
+
+try:
+    import msgpack
+except ImportError:     # pragma: no cover
+    msgpack = None
+
+if msgpack is not None:     # pragma: no cover
+    ExtType = msgpack.ExtType
+else:
+    ExtType = collections.namedtuple("ExtType", ["code", "data"])
+
+_uint8 = struct.Struct(str(">B"))
+_uint16 = struct.Struct(str(">H"))
+_uint32 = struct.Struct(str(">I"))
+
+# Byte of the format to ``(struct, kind)`` for the formats whose length or
+# value is in the following bytes.
+_FORMATS = {
+    0xc4: (_uint8, "bin"),
+    0xc5: (_uint16, "bin"),
+    0xc6: (_uint32, "bin"),
+    0xc7: (_uint8, "ext"),
+    0xc8: (_uint16, "ext"),
+    0xc9: (_uint32, "ext"),
+    0xca: (struct.Struct(str(">f")), "value"),
+    0xcb: (struct.Struct(str(">d")), "value"),
+    0xcc: (_uint8, "value"),
+    0xcd: (_uint16, "value"),
+    0xce: (_uint32, "value"),
+    0xcf: (struct.Struct(str(">Q")), "value"),
+    0xd0: (struct.Struct(str(">b")), "value"),
+    0xd1: (struct.Struct(str(">h")), "value"),
+    0xd2: (struct.Struct(str(">i")), "value"),
+    0xd3: (struct.Struct(str(">q")), "value"),
+    0xd9: (_uint8, "str"),
+    0xda: (_uint16, "str"),
+    0xdb: (_uint32, "str"),
+    0xdc: (_uint16, "array"),
+    0xdd: (_uint32, "array"),
+    0xde: (_uint16, "map"),
+    0xdf: (_uint32, "map"),
+}
+_FIXEXT_SIZES = {0xd4: 1, 0xd5: 2, 0xd6: 4, 0xd7: 8, 0xd8: 16}
+_CONSTANTS = {0xc0: None, 0xc2: False, 0xc3: True}
+
+try:
+    from datetime import timezone
+    _EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+except ImportError:     # pragma: no cover
+    # Naive datetime in UTC on Python 2.
+    _EPOCH = datetime(1970, 1, 1)
+
+_TIMESTAMP = -1
+
+#: Maximum depth of the nested arrays and maps.
+MAX_DEPTH = 128
+
+
+class _Unpacker(object):
+    def __init__(self, data, limits=None):
+        # Indexing a bytearray returns integers on both Python 2 and 3.
+        self.data = data if isinstance(data, bytearray) else bytearray(data)
+        self.pos = 0
+        self.limits = limits
+        self.keys = 0
+
+    def check_string(self, size):
+        limits = self.limits
+        if (limits is not None and limits.max_string is not None and
+                size > limits.max_string):
+            raise LimitExceededError("max_string", limits.max_string)
+
+    def check_container(self, size, depth, is_map):
+        limits = self.limits
+        if limits is None:
+            return
+        limits.check_depth(depth)
+        if is_map and limits.max_keys is not None:
+            self.keys += size
+            if self.keys > limits.max_keys:
+                raise LimitExceededError("max_keys", limits.max_keys)
+
+    def take(self, size):
+        start = self.pos
+        end = start + size
+        if end > len(self.data):
+            raise ValueError("Unexpected end of MessagePack data")
+        self.pos = end
+        return self.data[start:end]
+
+    def text(self, size):
+        self.check_string(size)
+        try:
+            return self.take(size).decode("utf8")
+        except UnicodeDecodeError as e:
+            raise ValueError("Invalid string of MessagePack data: %s" % e)
+
+    def array(self, size, depth):
+        self.check_container(size, depth, False)
+        unpack = self.unpack
+        return [unpack(depth) for _ in six.moves.range(size)]
+
+    def map(self, size, depth):
+        self.check_container(size, depth, True)
+        unpack = self.unpack
+        ret = {}
+        try:
+            for _ in six.moves.range(size):
+                key = unpack(depth)
+                ret[key] = unpack(depth)
+        except TypeError:
+            raise ValueError("Unhashable key of MessagePack map")
+        return ret
+
+    def unpack(self, depth=0):
+        try:
+            byte = self.data[self.pos]
+        except IndexError:
+            raise ValueError("Unexpected end of MessagePack data")
+        self.pos += 1
+
+        if byte <= 0x7f:
+            return byte
+        if byte >= 0xe0:
+            return byte - 0x100
+        if 0xa0 <= byte <= 0xbf:
+            return self.text(byte & 0x1f)
+        if byte in _CONSTANTS:
+            return _CONSTANTS[byte]
+
+        depth += 1
+        if depth > MAX_DEPTH:
+            raise ValueError("MessagePack data is nested too deeply")
+        if byte <= 0x8f:
+            return self.map(byte & 0x0f, depth)
+        if byte <= 0x9f:
+            return self.array(byte & 0x0f, depth)
+
+        if byte in _FIXEXT_SIZES:
+            code = struct.unpack(str(">b"), self.take(1))[0]
+            return self.ext(code, self.take(_FIXEXT_SIZES[byte]))
+
+        try:
+            fmt, kind = _FORMATS[byte]
+        except KeyError:
+            raise ValueError("Invalid byte 0x%x of MessagePack data" % byte)
+
+        value = fmt.unpack(self.take(fmt.size))[0]
+        if kind == "value":
+            return value
+        if kind == "str":
+            return self.text(value)
+        if kind == "bin":
+            self.check_string(value)
+            return bytes(self.take(value))
+        if kind == "array":
+            return self.array(value, depth)
+        if kind == "map":
+            return self.map(value, depth)
+        code = struct.unpack(str(">b"), self.take(1))[0]
+        return self.ext(code, self.take(value))
+
+    @staticmethod
+    def ext(code, data):
+        if code >= 0:
+            return ExtType(code, bytes(data))
+        if code != _TIMESTAMP:
+            raise ValueError("Reserved extension type %d of MessagePack "
+                             "data" % code)
+
+        if len(data) == 4:
+            nanoseconds, seconds = 0, _uint32.unpack(data)[0]
+        elif len(data) == 8:
+            value = struct.unpack(str(">Q"), data)[0]
+            nanoseconds, seconds = value >> 34, value & 0x3ffffffff
+        elif len(data) == 12:
+            nanoseconds, seconds = struct.unpack(str(">Iq"), data)
+        else:
+            raise ValueError("Invalid timestamp of MessagePack data")
+        return _EPOCH + timedelta(seconds=seconds,
+                                  microseconds=nanoseconds // 1000)
+
+
+def py_unpackb(data, limits=None):
+    """Decode a MessagePack document in pure Python.
+
+    :param data: An instance of bytes, bytearray or memoryview.
+    :param limits:
+        A :class:`~parameter.limits.Limits`, the depth, the keys and the
+        strings are checked while decoding, ``max_bytes`` is not checked.
+    :raises: :class:`ValueError` if the data is invalid.
+    :raises: :class:`~parameter.exception.LimitExceededError`
+    """
+    unpacker = _Unpacker(data, limits)
+    ret = unpacker.unpack()
+    if unpacker.pos != len(unpacker.data):
+        raise ValueError("Extra data after MessagePack document")
+    return ret
+
+
+def _pack(obj, parts):
+    append = parts.append
+    if obj is None:
+        append(b"\xc0")
+    elif obj is True:
+        append(b"\xc3")
+    elif obj is False:
+        append(b"\xc2")
+    elif isinstance(obj, six.integer_types):
+        if 0 <= obj <= 0x7f:
+            append(_uint8.pack(obj))
+        elif -0x20 <= obj < 0:
+            append(_uint8.pack(obj + 0x100))
+        elif 0 <= obj < 2 ** 64:
+            append(struct.pack(str(">BQ"), 0xcf, obj))
+        elif -2 ** 63 <= obj < 0:
+            append(struct.pack(str(">Bq"), 0xd3, obj))
+        else:
+            raise OverflowError("Integer out of MessagePack range")
+    elif isinstance(obj, float):
+        append(struct.pack(str(">Bd"), 0xcb, obj))
+    elif isinstance(obj, six.text_type):
+        data = obj.encode("utf8")
+        if len(data) <= 0x1f:
+            append(_uint8.pack(0xa0 | len(data)))
+        else:
+            append(struct.pack(str(">BI"), 0xdb, len(data)))
+        append(data)
+    elif isinstance(obj, (six.binary_type, bytearray)):
+        append(struct.pack(str(">BI"), 0xc6, len(obj)))
+        append(bytes(obj))
+    elif isinstance(obj, ExtType):
+        append(struct.pack(str(">BIb"), 0xc9, len(obj.data), obj.code))
+        append(obj.data)
+    elif isinstance(obj, (list, tuple)):
+        if len(obj) <= 0x0f:
+            append(_uint8.pack(0x90 | len(obj)))
+        else:
+            append(struct.pack(str(">BI"), 0xdd, len(obj)))
+        for item in obj:
+            _pack(item, parts)
+    elif isinstance(obj, dict):
+        if len(obj) <= 0x0f:
+            append(_uint8.pack(0x80 | len(obj)))
+        else:
+            append(struct.pack(str(">BI"), 0xdf, len(obj)))
+        for key, val in obj.items():
+            _pack(key, parts)
+            _pack(val, parts)
+    else:
+        raise TypeError("Can't pack %r" % type(obj))
+
+
+def py_packb(obj):
+    """Encode an object to MessagePack in pure Python."""
+    parts = []
+    _pack(obj, parts)
+    return b"".join(parts)
+
+
+def _limit_hooks(limits):
+    """Returns the ``object_hook`` and ``list_hook`` of
+    :func:`msgpack.unpackb` which check ``limits`` on each container as soon
+    as it's decoded. The containers are decoded bottom up, so the height of
+    a container is checked instead of its depth."""
+    max_depth, max_keys = limits.max_depth, limits.max_keys
+    max_string = limits.max_string
+    heights = {}
+    keys = [0]
+
+    def check(container, items):
+        height = 1
+        for item in items:
+            if type(item) in (dict, list):
+                height = max(height, heights[id(item)] + 1)
+            elif max_string is not None:
+                # Measured in bytes, like the raw strings of py_unpackb.
+                if isinstance(item, six.text_type):
+                    size = len(item.encode("utf8"))
+                elif isinstance(item, six.binary_type):
+                    size = len(item)
+                else:
+                    continue
+                if size > max_string:
+                    raise LimitExceededError("max_string", max_string)
+        if max_depth is not None and height > max_depth:
+            raise LimitExceededError("max_depth", max_depth)
+        heights[id(container)] = height
+        return container
+
+    def object_hook(obj):
+        keys[0] += len(obj)
+        if max_keys is not None and keys[0] > max_keys:
+            raise LimitExceededError("max_keys", max_keys)
+        return check(obj, itertools.chain(obj, obj.values()))
+
+    def list_hook(obj):
+        return check(obj, obj)
+
+    return {"object_hook": object_hook, "list_hook": list_hook}
+
+
+_MSGPACK_OPTIONS = {"raw": False, "strict_map_key": False}
+if msgpack is not None:     # pragma: no cover
+    if msgpack.version >= (1, 0):
+        _MSGPACK_OPTIONS["timestamp"] = 3
+    else:
+        # The older versions, e.g. the last one of Python 2, decode the
+        # timestamps as extension types.
+        _MSGPACK_OPTIONS["ext_hook"] = _Unpacker.ext
+
+
+def _msgpack_unpackb(data, limits=None):
+    kwargs = _limit_hooks(limits) if limits is not None else {}
+    try:
+        return msgpack.unpackb(data, **dict(_MSGPACK_OPTIONS, **kwargs))
+    except TypeError as e:
+        # Unhashable keys.
+        raise ValueError(str(e))
+
+
+#: Decode a MessagePack document, by the ``msgpack`` package if it's
+#: installed, otherwise by :func:`py_unpackb`.
+unpackb = py_unpackb
+#: Encode an object to MessagePack, by the ``msgpack`` package if it's
+#: installed, otherwise by :func:`py_packb`.
+packb = py_packb
+
+if msgpack is not None:     # pragma: no cover
+    unpackb = _msgpack_unpackb
+    # The older versions pack bytes as strings by default.
+    packb = functools.partial(msgpack.packb, use_bin_type=True)
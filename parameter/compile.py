@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""Generate the specialized ``_init`` of models ahead of time.
+
+Every model compiles a specialized ``_init`` when it's defined, which takes
+most of the time to import a module of many models. Generate a module of
+them once, e.g. when building the package::
+
+    $ python -m parameter.compile mypkg.models -o mypkg/_models_compiled.py
+
+Then load the generated module before the models are defined::
+
+    from parameter import compile as precompile
+
+    precompile.load("mypkg._models_compiled")
+
+    from mypkg import models
+
+A model uses the generated code only if it's generated from the same
+definition, otherwise, e.g. the model is changed after generating or the
+generated module is missing, it compiles its ``_init`` as usual. So a stale
+generated module only loses the speed up.
+
+The generated module should be byte-compiled as the other modules, or
+compiling it takes longer than compiling the models.
+"""
+from __future__ import print_function, division, unicode_literals
+
+import argparse
+import importlib
+import sys
+
+from . import model
+
+# The coding line is written to the file only, Python 2 refuses to compile a
+# unicode source with it.
+_CODING = "# -*- coding:utf-8 -*-\n"
+
+_HEADER = '''\
+"""Generated by ``python -m parameter.compile %(modules)s``, do not edit."""
+from parameter.compile import register
+from parameter.exception import ArgumentInvalidError, ArgumentMissError
+from parameter.exception import ConvertError
+from parameter.model import Argument, _spawn
+from parameter.types import Invalid
+
+_DEFAULT = Argument._DEFAULT
+'''
+
+
+def register(factories):
+    """Register the factories of ``_init``, it's called by the generated
+    module.
+
+    :param factories:
+        A dict maps ``(module, qualname)`` of a model to ``(fingerprint,
+        factory)``.
+    """
+    model._precompiled.update(factories)
+
+
+def load(name):
+    """Import the generated module ``name``, the models defined after it
+    use the generated code.
+
+    :returns: ``False`` if the module doesn't exist, otherwise ``True``.
+    """
+    try:
+        importlib.import_module(name)
+    except ImportError:
+        return False
+    return True
+
+
+def _resolve(module, qualname):
+    """Returns the object of ``qualname`` in ``module``, or ``None``."""
+    obj = module
+    for name in qualname.split("."):
+        obj = getattr(obj, name, None)
+    return obj
+
+
+def _iter_models(modules):
+    """Iterate the models defined in ``modules`` which use a specialized
+    ``_init``, only the models can be found by their qualified names are
+    included."""
+    stack = [model.Model]
+    while stack:
+        model_cls = stack.pop()
+        stack.extend(model_cls.__subclasses__())
+        module = modules.get(model_cls.__module__)
+        qualname = getattr(model_cls, "__qualname__", model_cls.__name__)
+        if module is None or _resolve(module, qualname) is not model_cls:
+            continue
+
+        init = vars(model_cls).get("_init")
+        init = getattr(init, "_meta_original", init)
+        if getattr(init, "_meta_compiled", False):
+            yield (model_cls.__module__, qualname), model_cls
+
+
+def generate(modules):
+    """Import ``modules`` and returns the source of the generated module of
+    the models defined in them."""
+    imported = dict((name, importlib.import_module(name))
+                    for name in modules)
+
+    lines = [_HEADER % {"modules": " ".join(modules)}]
+    entries = []
+    models = sorted(_iter_models(imported), key=lambda item: item[0])
+    for index, (key, model_cls) in enumerate(models):
+        arguments = model_cls._meta_arguments
+        if model_cls._meta_options["lazy"]:
+            source = model._lazy_init_source(arguments)
+        else:
+            source = model._init_source(arguments,
+                                        vars(model_cls)["_meta_order"])
+
+        factory = "_make_init_%d" % index
+        lines.append("")
+        lines.append(source.replace("def _make_init(",
+                                    "def %s(" % factory, 1))
+        entries.append("    (%r, %r): (%r, %s)," % (
+            str(key[0]), str(key[1]), str(model._fingerprint(source)),
+            factory))
+
+    lines.append("")
+    lines.append("register({")
+    lines.extend(entries)
+    lines.append("})")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m parameter.compile",
+        description="Generate the specialized _init of models ahead of time.")
+    parser.add_argument("modules", nargs="+",
+                        help="modules which define the models")
+    parser.add_argument("-o", "--output", metavar="FILE",
+                        help="file to write, default to stdout")
+    args = parser.parse_args(argv)
+
+    source = generate(args.modules)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(_CODING + source)
+    else:
+        sys.stdout.write(source)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
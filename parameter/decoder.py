@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""JSON decoders.
+
+:class:`~parameter.adapter.JSONAdapter` decodes JSON by a decoder, which is a
+callable receives a ``str``, ``bytes``, ``bytearray`` or ``memoryview`` and
+returns the decoded object. The decoder should raise :class:`ValueError` on
+invalid documents.
+
+By default the fastest installed decoder is used, in order of
+`orjson <https://github.com/ijl/orjson>`_,
+`ujson <https://github.com/ultrajson/ultrajson>`_ and the standard library.
+Note that the third-party decoders may differ from the standard library on
+edge cases, e.g. ``orjson`` rejects ``NaN`` and integers exceed 64-bit.
+
+Use :func:`set_default_decoder` to choose one::
+
+    from parameter import decoder
+
+    decoder.set_default_decoder("json")
+
+Or register your own::
+
+    import rapidjson
+
+    decoder.register_decoder("rapidjson", rapidjson.loads)
+"""
+from __future__ import print_function, division, unicode_literals
+
+import json
+import sys
+
+import six
+
+
+def _to_bytes(data):
+    """Copy a ``memoryview`` or ``bytearray`` to ``bytes``."""
+    if isinstance(data, memoryview):
+        # ``bytes(view)`` is the repr of the view on Python 2.
+        return data.tobytes()
+    if isinstance(data, bytearray):
+        return bytes(data)
+    return data
+
+
+def _json_loads(data):
+    # The standard library only accepts ``str`` on Python 2, and ``str`` or
+    # ``bytes`` on Python 3.
+    data = _to_bytes(data)
+
+    # The standard library accepts bytes since Python 3.6.
+    if (isinstance(data, six.binary_type) and
+            not six.PY2 and sys.version_info < (3, 6)):    # pragma: no cover
+        data = data.decode("utf8")
+    return json.loads(data)
+
+
+def _orjson_loads():
+    import orjson
+    return orjson.loads
+
+
+def _ujson_loads():
+    import ujson
+
+    def loads(data):
+        return ujson.loads(_to_bytes(data))
+    return loads
+
+
+# Name to a function which returns the decoder, it raises ImportError if the
+# decoder is not installed.
+_factories = {
+    "orjson": _orjson_loads,
+    "ujson": _ujson_loads,
+    "json": lambda: _json_loads,
+}
+_preferences = ["orjson", "ujson", "json"]
+_decoders = {}
+_default = None
+
+
+def register_decoder(name, loads):
+    """Register a decoder.
+
+    :param name: Name of the decoder.
+    :param loads: The decoder.
+    """
+    _decoders[name] = loads
+
+
+def available_decoders():
+    """Returns names of the installed decoders, in order of preference."""
+    names = []
+    for name in _preferences + sorted(set(_decoders) - set(_preferences)):
+        try:
+            get_decoder(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def get_decoder(name=None):
+    """Returns the decoder of ``name``, or the default decoder if ``name`` is
+    ``None``.
+
+    :raises: :class:`KeyError` if the decoder is unknown.
+    :raises: :class:`ImportError` if the decoder is not installed.
+    """
+    if name is None:
+        if _default is None:
+            set_default_decoder(None)
+        return _default
+
+    loads = _decoders.get(name)
+    if loads is None:
+        loads = _decoders[name] = _factories[name]()
+    return loads
+
+
+def set_default_decoder(name):
+    """Set the default decoder, ``None`` to choose the fastest installed
+    one."""
+    global _default     # pylint: disable=global-statement
+
+    if name is not None:
+        _default = get_decoder(name)
+        return
+
+    for name in _preferences:
+        try:
+            _default = get_decoder(name)
+        except ImportError:
+            continue
+        return
@@ -10,20 +10,74 @@ class ParameterException(Exception):
 
 
 class ConvertError(ParameterException):
-    pass
+    #: Error code reported by the non-raising validation.
+    code = "invalid"
 
 
 class MismatchError(ConvertError):
     """Type mismatch."""
-    pass
+    code = "mismatch"
 
 
 class MaxlenExceedError(ConvertError):
-    pass
+    code = "max_len"
+
+
+class MaxitemsExceedError(ConvertError):
+    """Number of the items exceeds the limit."""
+    code = "max_items"
+
+
+class MinlenError(ConvertError):
+    """Length of the value is less than the minimum."""
+    code = "min_len"
+
+
+class PatternMismatchError(ConvertError):
+    """Value doesn't match the pattern."""
+    code = "pattern"
+
+
+class OutOfRangeError(ConvertError):
+    """Value is less than the minimum or greater than the maximum."""
+    code = "range"
+
+
+class ChoiceError(ConvertError):
+    """Value is not one of the choices."""
+    code = "choice"
+
+
+class MaxsizeExceedError(ConvertError):
+    """Size of the file exceeds the limit."""
+    code = "max_size"
+
+
+class LimitExceededError(ParameterException, ValueError):
+    """A resource limit of the request is exceeded, see
+    :class:`~parameter.limits.Limits`. It's a :class:`ValueError`, as what
+    the adapters raise on invalid data."""
+    code = "limit"
+
+    def __init__(self, limit, value):
+        """Initialize
+
+        :param limit: Name of the limit, e.g. ``max_bytes``.
+        :param value: Value of the limit.
+        """
+        super(LimitExceededError, self).__init__(
+            "Request exceeds the limit %s=%d" % (limit, value))
+        self.limit = limit
+        self.value = value
+
+    def __reduce__(self):
+        return (type(self), (self.limit, self.value))
 
 
 class ArgumentError(ParameterException):
     """Argument base Exception"""
+    code = "invalid"
+
     def __init__(self, message, name):
         """Initialize
 
@@ -33,9 +87,13 @@ class ArgumentError(ParameterException):
         super(ArgumentError, self).__init__(message)
         self.name = name
 
+    def __reduce__(self):
+        # Exceptions are pickled with ``args`` only, which misses ``name``.
+        return (type(self), self.args + (self.name,))
+
 
 class ArgumentMissError(ArgumentError):
-    pass
+    code = "missing"
 
 
 class ArgumentInvalidError(ArgumentError):
@@ -48,3 +106,11 @@ class ArgumentInvalidError(ArgumentError):
         """
         super(ArgumentInvalidError, self).__init__(message, name)
         self.source = source
+
+    def __reduce__(self):
+        return (type(self), self.args + (self.name, self.source))
+
+    @property
+    def code(self):
+        """Error code of the source exception."""
+        return getattr(self.source, "code", ConvertError.code)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""Resource limits of a request.
+
+The limits cap the worst-case cost of a single request, they are checked
+before the data is decoded, so a hostile request is rejected before it burns
+CPU and memory::
+
+    from parameter.adapter import JSONAdapter
+    from parameter.limits import Limits
+
+    LIMITS = Limits(max_bytes=1024 * 1024, max_depth=8, max_keys=1000,
+                    max_string=64 * 1024)
+
+    entity = DataEntity(JSONAdapter(request.body, limits=LIMITS))
+
+The adapter raises :class:`~parameter.exception.LimitExceededError` if a
+limit is exceeded, the nested depth is also checked when the adapter is
+spawned for :class:`~parameter.types.Nested`.
+"""
+from __future__ import print_function, division, unicode_literals
+
+import re
+
+import six
+
+from .exception import LimitExceededError
+
+# Groups: string, opening bracket, closing bracket and colon. The closing
+# quote is optional, so a string never fails to match and the scan is linear,
+# otherwise an unterminated string is scanned again from each escaped quote.
+_TOKENS = re.compile(
+    b'("[^"\\\\]*(?:\\\\.[^"\\\\]*)*"?)|([\\[{])|([\\]}])|(:)', re.S)
+_TEXT_TOKENS = re.compile(
+    '("[^"\\\\]*(?:\\\\.[^"\\\\]*)*"?)|([\\[{])|([\\]}])|(:)', re.S)
+
+_STRING, _OPEN, _CLOSE = 1, 2, 3
+
+
+class Limits(object):
+    """Limits of a request, ``None`` means unlimited.
+
+    :ivar max_bytes: Maximum size of the raw data in bytes.
+    :ivar max_depth:
+        Maximum nesting depth of the arrays and objects, the top-level
+        object is at depth 1.
+    :ivar max_keys: Maximum number of the keys of all objects.
+    :ivar max_string:
+        Maximum length of a string, measured on the raw data, which is not
+        less than the length of the decoded string.
+    """
+
+    def __init__(self, max_bytes=None, max_depth=None, max_keys=None,
+                 max_string=None):
+        self.max_bytes = max_bytes
+        self.max_depth = max_depth
+        self.max_keys = max_keys
+        self.max_string = max_string
+
+    def check_size(self, data):
+        """Check the size of the raw data.
+
+        :raises: :class:`~parameter.exception.LimitExceededError`
+        """
+        if self.max_bytes is not None:
+            size = (len(data.encode("utf8"))
+                    if isinstance(data, six.text_type) else len(data))
+            if size > self.max_bytes:
+                raise LimitExceededError("max_bytes", self.max_bytes)
+
+    def check_depth(self, depth):
+        """Check the depth of a spawned adapter, returns the depth.
+
+        :raises: :class:`~parameter.exception.LimitExceededError`
+        """
+        if self.max_depth is not None and depth > self.max_depth:
+            raise LimitExceededError("max_depth", self.max_depth)
+        return depth
+
+    def check_json(self, data):
+        """Check a JSON document before decoding it, by scanning the strings
+        and the brackets only.
+
+        A malformed document may fail here or in the decoder. The scan is
+        linear in the size of the document whatever it is.
+
+        :raises: :class:`~parameter.exception.LimitExceededError`
+        """
+        self.check_size(data)
+
+        max_depth, max_keys = self.max_depth, self.max_keys
+        max_string = self.max_string
+        if max_depth is None and max_keys is None and max_string is None:
+            return
+
+        if isinstance(data, six.text_type):
+            tokens = _TEXT_TOKENS
+        else:
+            if six.PY2 and isinstance(data, memoryview):  # pragma: no cover
+                data = data.tobytes()
+            tokens = _TOKENS
+
+        depth = keys = 0
+        for match in tokens.finditer(data):
+            kind = match.lastindex
+            if kind == _STRING:
+                if (max_string is not None and
+                        match.end() - match.start() - 2 > max_string):
+                    raise LimitExceededError("max_string", max_string)
+            elif kind == _OPEN:
+                depth += 1
+                if max_depth is not None and depth > max_depth:
+                    raise LimitExceededError("max_depth", max_depth)
+            elif kind == _CLOSE:
+                depth -= 1
+            else:
+                keys += 1
+                if max_keys is not None and keys > max_keys:
+                    raise LimitExceededError("max_keys", max_keys)
+
+    def check_object(self, obj):
+        """Check a decoded object, for the decoders which can't check the
+        limits while decoding.
+
+        :raises: :class:`~parameter.exception.LimitExceededError`
+        """
+        max_keys, max_string = self.max_keys, self.max_string
+        keys = 0
+        stack = [(obj, 1)]
+        while stack:
+            obj, depth = stack.pop()
+            if isinstance(obj, dict):
+                keys += len(obj)
+                if max_keys is not None and keys > max_keys:
+                    raise LimitExceededError("max_keys", max_keys)
+                items = list(obj)
+                items.extend(obj.values())
+            elif isinstance(obj, (list, tuple)):
+                items = obj
+            else:
+                if (max_string is not None and
+                        isinstance(obj, (six.text_type, six.binary_type)) and
+                        len(obj) > max_string):
+                    raise LimitExceededError("max_string", max_string)
+                continue
+
+            self.check_depth(depth)
+            stack.extend((item, depth + 1) for item in items)
@@ -0,0 +1,238 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""Timing hooks of model creation.
+
+A hook is a callable ``hook(model_cls, field, duration, outcome)``, which is
+called after each argument is converted, and once more after the whole
+model with ``field`` as ``None``. ``duration`` is in seconds, ``outcome`` is
+``None`` on success, otherwise the exception raised::
+
+    from parameter import metrics
+
+    recorder = metrics.MetricsRecorder()
+    metrics.add_hook(recorder)
+
+    ...
+
+    stats = recorder.stats(UserEntity)
+    print(stats.calls, stats.failures, stats.p50(), stats.p99("name"))
+    print(stats.failures_by_field)  # {("age", MismatchError): 3}
+
+While any hook is installed, the models are created by an instrumented
+``_init`` which converts the arguments one by one. When the last hook is
+removed the specialized ``_init`` is restored, so there is no overhead at all
+without hooks.
+
+Only the models created by ``Model(adapter)`` are measured, the lazy models,
+the models customize ``_init``, and the batch validation are not.
+"""
+from __future__ import print_function, division, unicode_literals
+
+import collections
+import threading
+import timeit
+
+from . import model
+from .exception import ArgumentInvalidError, ArgumentMissError
+
+_timer = timeit.default_timer
+_hooks = []
+_lock = threading.Lock()
+
+
+def _emit(model_cls, field, duration, outcome):
+    for hook in _hooks:
+        hook(model_cls, field, duration, outcome)
+
+
+def _fail(model_cls, name, field_start, start, error):
+    now = _timer()
+    _emit(model_cls, name, now - field_start, error)
+    _emit(model_cls, None, now - start, error)
+
+
+def _make_init(model_cls, arguments, order=None):
+    convert_row = model._convert_row
+    ahead = []
+    if order is not None:
+        # The same as the specialized ``_init``, the required arguments are
+        # checked for missing first, then converted in order.
+        ahead = [arg for _, arg in arguments if model._missing_first(arg)]
+        arguments = [arguments[index] for index in order]
+    default = model.Argument._DEFAULT
+
+    def _init(self):
+        adapter = self.adapter
+        start = _timer()
+        for arg in ahead:
+            field_start = _timer()
+            try:
+                if adapter.get_argument(arg.name, arg.default) is default:
+                    raise ArgumentMissError(arg.miss_message, arg.name)
+            except Exception as e:
+                _fail(model_cls, arg.name, field_start, start, e)
+                raise
+
+        for attr, arg in arguments:
+            field_start = _timer()
+            try:
+                value = convert_row(arg, adapter)
+            except Exception as e:
+                _fail(model_cls, arg.name, field_start, start, e)
+                raise
+            _emit(model_cls, arg.name, _timer() - field_start, None)
+            setattr(self, attr, value)
+        _emit(model_cls, None, _timer() - start, None)
+
+    return _init
+
+
+def _instrument(model_cls):
+    """Replace the specialized ``_init`` of ``model_cls``."""
+    init = vars(model_cls).get("_init")
+    if (init is None or not getattr(init, "_meta_compiled", False) or
+            hasattr(init, "_meta_original") or
+            model_cls._meta_options["lazy"]):
+        return
+
+    instrumented = _make_init(model_cls, model_cls._meta_arguments,
+                              model_cls._meta_order)
+    instrumented._meta_compiled = True
+    instrumented._meta_original = init
+    model_cls._init = instrumented
+
+
+def _restore(model_cls):
+    init = vars(model_cls).get("_init")
+    original = getattr(init, "_meta_original", None)
+    if original is not None:
+        model_cls._init = original
+
+
+def _iter_models():
+    stack = [model.Model]
+    while stack:
+        model_cls = stack.pop()
+        yield model_cls
+        stack.extend(model_cls.__subclasses__())
+
+
+def add_hook(hook):
+    """Install a hook, see the module's document."""
+    with _lock:
+        if hook in _hooks:
+            return
+        _hooks.append(hook)
+        if model._instrument is None:
+            model._instrument = _instrument
+            for model_cls in _iter_models():
+                _instrument(model_cls)
+
+
+def remove_hook(hook):
+    """Remove a hook, the models are restored if it's the last one.
+
+    :raises: :class:`ValueError` if the hook is not installed.
+    """
+    with _lock:
+        _hooks.remove(hook)
+        if not _hooks:
+            model._instrument = None
+            for model_cls in _iter_models():
+                _restore(model_cls)
+
+
+def _error_class(error):
+    """The class of the source exception is more specific for the invalid
+    arguments, e.g. :class:`~parameter.exception.MismatchError`."""
+    if isinstance(error, ArgumentInvalidError):
+        return type(error.source)
+    return type(error)
+
+
+def _percentile(samples, percent):
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    index = int(round(percent / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+class ModelStats(object):
+    """Statistics of a model, see :class:`MetricsRecorder`.
+
+    :ivar calls: Number of the models created.
+    :ivar failures: Number of the models failed.
+    :ivar failures_by_field:
+        A :class:`collections.Counter` maps ``(field, error_class)`` to the
+        number of the failures. For the invalid arguments, the class is the
+        class of the source exception.
+    """
+
+    def __init__(self, sample_size):
+        self.calls = 0
+        self.failures = 0
+        self.failures_by_field = collections.Counter()
+        self._sample_size = sample_size
+        self._durations = collections.defaultdict(self._new_samples)
+
+    def _new_samples(self):
+        return collections.deque(maxlen=self._sample_size)
+
+    def record(self, field, duration, outcome):
+        self._durations[field].append(duration)
+        if field is None:
+            self.calls += 1
+            if outcome is not None:
+                self.failures += 1
+        elif outcome is not None:
+            self.failures_by_field[field, _error_class(outcome)] += 1
+
+    def percentile(self, percent, field=None):
+        """Returns the percentile of the recent durations in seconds, of the
+        model or a field. Returns ``None`` if there is no sample."""
+        return _percentile(self._durations.get(field, ()), percent)
+
+    def p50(self, field=None):
+        return self.percentile(50, field)
+
+    def p99(self, field=None):
+        return self.percentile(99, field)
+
+    def costs(self):
+        """Returns a dict maps the fields to the medians of their durations,
+        see :meth:`parameter.model.Model.reorder`."""
+        return dict((field, self.p50(field)) for field in self._durations
+                    if field is not None and self._durations[field])
+
+
+class MetricsRecorder(object):
+    """A hook which aggregates the statistics of each model.
+
+    :param sample_size:
+        Number of the recent durations kept to calculate the percentiles, per
+        model and per field.
+    """
+
+    def __init__(self, sample_size=1024):
+        self.sample_size = sample_size
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, model_cls, field, duration, outcome):
+        stats = self._stats.get(model_cls)
+        if stats is None:
+            with self._lock:
+                stats = self._stats.setdefault(
+                    model_cls, ModelStats(self.sample_size))
+        stats.record(field, duration, outcome)
+
+    def stats(self, model_cls):
+        """Returns the :class:`ModelStats` of ``model_cls``, or ``None`` if
+        it's never created."""
+        return self._stats.get(model_cls)
+
+    def reset(self):
+        """Discard all statistics."""
+        with self._lock:
+            self._stats.clear()
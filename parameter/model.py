@@ -4,12 +4,17 @@
 from __future__ import print_function, division, unicode_literals
 
 import abc
+import hashlib
 import inspect
 
+from itertools import chain, islice, repeat
+
 import six
 
-from .types import Nested
-from .exception import ConvertError, ArgumentMissError, ArgumentInvalidError
+from .types import Nested, Invalid, Cached
+from .exception import ConvertError, ArgumentError, ArgumentMissError
+from .exception import ArgumentInvalidError, MaxitemsExceedError
+from .exception import LimitExceededError
 
 
 @six.add_metaclass(abc.ABCMeta)
@@ -84,7 +89,8 @@ class Argument(object):
     _DEFAULT = []       # type: list
 
     def __init__(self, type_, default=_DEFAULT, alias=None, multiple=False,
-                 miss_message=None, invalid_message=None):
+                 miss_message=None, invalid_message=None, max_items=None,
+                 cache_size=None):
         """Initialize
 
         :param type_:
@@ -101,14 +107,23 @@ class Argument(object):
         :param invalid_message:
             The message of
             :class:`~parameter.exception.ArgumentInvalidError`
+        :param max_items:
+            Maximum number of the values of a multiple argument, it's checked
+            before converting any of them.
+        :param cache_size:
+            If it's given, the conversions of the type are memoized in an LRU
+            cache of this size, see :class:`~parameter.types.Cached`.
         """
         self.name = None
         self.alias = alias
         self.type_ = type_() if inspect.isclass(type_) else type_
+        if cache_size is not None:
+            self.type_ = Cached(self.type_, cache_size)
         self.default = default
         self.multiple = multiple
         self.miss_message = miss_message
         self.invalid_message = invalid_message
+        self.max_items = max_items
 
     @classmethod
     def is_init_default(cls, value):
@@ -129,9 +144,937 @@ class Argument(object):
         except ConvertError as e:
             raise ArgumentInvalidError(self.invalid_message, self.name, e)
 
+    def check_items(self, values):
+        """Check the number of the values of a multiple argument, returns
+        the values. An iterator is consumed into a list, but no more than
+        ``max_items + 1`` values are read.
+
+        :raises: :class:`~parameter.exception.ArgumentInvalidError`
+        """
+        if self.max_items is None:
+            return values
+
+        if not hasattr(values, "__len__"):
+            values = list(islice(values, self.max_items + 1))
+        if len(values) > self.max_items:
+            raise ArgumentInvalidError(self.invalid_message, self.name,
+                                       MaxitemsExceedError(self.max_items))
+        return values
+
+
+def _defined_by(cls, name, default_owner):
+    """Returns ``True`` if ``name`` of ``cls`` resolves to the attribute
+    defined by ``default_owner`` in the MRO."""
+    for klass in inspect.getmro(cls):
+        if name in vars(klass):
+            # Compiled ``_init`` of the bases is not a customization.
+            return (klass is default_owner or
+                    getattr(vars(klass)[name], "_meta_compiled", False))
+    return False
+
+
+def _missing_first(arg):
+    """Returns ``True`` if ``arg`` is checked for missing ahead of the
+    conversions by an ordered ``_init``."""
+    return (not arg.multiple and not isinstance(arg.type_, Nested) and
+            Argument.is_init_default(arg.default) and
+            _defined_by(type(arg), "convert", Argument) and
+            _defined_by(type(arg), "is_init_default", Argument))
+
+
+def _init_source(arguments, order=None):
+    """Generate the source of a factory which returns a specialized
+    ``_init`` for ``arguments``.
+
+    The factory is called with the model's ``_meta_arguments``, and binds the
+    argument names, defaults, messages and converters as closure variables,
+    so the generated ``_init`` only does the work that depends on the
+    request.
+
+    If ``order``, a list of the indexes of ``arguments``, is given, the
+    required arguments are checked for missing first in order of
+    declaration, then the arguments are converted in ``order``.
+    """
+    header = ["def _make_init(_meta_arguments):"]
+    body = ["    def _init(self):",
+            "        adapter = self.adapter"]
+    blocks = []
+
+    for index, (attr, arg) in enumerate(arguments):
+        header.extend(line % {"i": index} for line in (
+            "    _arg_%(i)d = _meta_arguments[%(i)d][1]",
+            "    _name_%(i)d = _arg_%(i)d.name",
+            "    _default_%(i)d = _arg_%(i)d.default",
+            "    _miss_%(i)d = _arg_%(i)d.miss_message",
+            "    _invalid_%(i)d = _arg_%(i)d.invalid_message",
+        ))
+
+        # A subclass of ``Argument`` may customize how a value is checked,
+        # in that case delegate to its ``convert``.
+        custom = not (_defined_by(type(arg), "convert", Argument) and
+                      _defined_by(type(arg), "is_init_default", Argument))
+        if custom:
+            header.append("    _convert_%d = _arg_%d.convert" % (index, index))
+        else:
+            header.append("    _convert_%d = _arg_%d.type_.try_convert" % (
+                index, index))
+
+        if arg.multiple and not custom and not isinstance(arg.type_, Nested):
+            # Convert all values at once, and check whether there is a value
+            # is the initial default, which is the same as what
+            # ``Argument.convert`` does.
+            header.append(
+                "    _convert_many_%d = _arg_%d.type_.convert_many" % (
+                    index, index))
+            lines = [
+                "        values = adapter.get_arguments(_name_%(i)d)",
+            ]
+            if arg.max_items is not None:
+                lines.append("        values = _arg_%(i)d.check_items(values)")
+            lines += [
+                "        if type(values) is not list:",
+                "            values = list(values)",
+                "        if _DEFAULT in values and any(",
+                "                value is _DEFAULT for value in values):",
+                "            raise ArgumentMissError(_miss_%(i)d, "
+                "_name_%(i)d)",
+                "        try:",
+                "            value = _convert_many_%(i)d(values)",
+                "        except ConvertError as e:",
+                "            raise ArgumentInvalidError(_invalid_%(i)d, "
+                "_name_%(i)d, e)",
+                "        self.%s = value" % attr,
+            ]
+            blocks.append([line % {"i": index} for line in lines])
+            continue
+
+        if arg.multiple:
+            fetch = "adapter.get_arguments(_name_%(i)d)"
+            if arg.max_items is not None:
+                fetch = "_arg_%(i)d.check_items(" + fetch + ")"
+            lines = [
+                "        converted = []",
+                "        for value in %s:" % fetch,
+            ]
+            indent = "            "
+        elif order is not None and _missing_first(arg):
+            # Fetched and checked for missing ahead.
+            body.extend(line % {"i": index} for line in (
+                "        value_%(i)d = adapter.get_argument(_name_%(i)d, "
+                "_default_%(i)d)",
+                "        if value_%(i)d is _DEFAULT:",
+                "            raise ArgumentMissError(_miss_%(i)d, "
+                "_name_%(i)d)",
+            ))
+            blocks.append([line % {"i": index} for line in (
+                "        value = _convert_%(i)d(value_%(i)d)",
+                "        if type(value) is Invalid:",
+                "            raise ArgumentInvalidError(_invalid_%(i)d, "
+                "_name_%(i)d, value.error())",
+                "        self.%s = value" % attr,
+            )])
+            continue
+        else:
+            lines = [
+                "        value = adapter.get_argument(_name_%(i)d, "
+                "_default_%(i)d)",
+            ]
+            indent = "        "
+
+        if isinstance(arg.type_, Nested):
+            lines.append(indent + "value = _spawn(_arg_%(i)d, adapter, value)")
+
+        if custom:
+            lines.append(indent + "value = _convert_%(i)d(value)")
+        else:
+            lines.extend(indent + line for line in (
+                "if value is _DEFAULT:",
+                "    raise ArgumentMissError(_miss_%(i)d, _name_%(i)d)",
+                "value = _convert_%(i)d(value)",
+                "if type(value) is Invalid:",
+                "    raise ArgumentInvalidError(_invalid_%(i)d, _name_%(i)d, "
+                "value.error())",
+            ))
+
+        if arg.multiple:
+            lines.append(indent + "converted.append(value)")
+            lines.append("        value = converted")
+
+        lines.append("        self.%s = value" % attr)
+        blocks.append([line % {"i": index} for line in lines])
+
+    for index in range(len(blocks)) if order is None else order:
+        body.extend(blocks[index])
+
+    if not arguments:
+        body.append("        pass")
+
+    return "\n".join(header + body + ["    return _init", ""])
+
+
+def _lazy_init_source(arguments):
+    """Generate the source of a factory which returns an ``_init`` that only
+    captures the raw values of ``arguments`` for lazy models."""
+    header = ["def _make_init(_meta_arguments):"]
+    body = ["    def _init(self):",
+            "        adapter = self.adapter",
+            "        self._meta_raw = ("]
+
+    for index, (_, arg) in enumerate(arguments):
+        header.extend(line % {"i": index} for line in (
+            "    _name_%(i)d = _meta_arguments[%(i)d][1].name",
+            "    _default_%(i)d = _meta_arguments[%(i)d][1].default",
+        ))
+        if arg.multiple:
+            body.append("            adapter.get_arguments(_name_%d)," % index)
+        else:
+            body.append("            adapter.get_argument(_name_%d, "
+                        "_default_%d)," % (index, index))
+
+    body.append("        )")
+    return "\n".join(header + body + ["    return _init", ""])
+
+
+# Factories of ``_init`` generated ahead of time, which are registered by
+# :func:`parameter.compile.register`. Maps ``(module, qualname)`` of a model
+# to ``(fingerprint, factory)``.
+_precompiled = {}
+
+
+def _fingerprint(source):
+    """Returns the fingerprint of the generated source of ``_init``."""
+    return hashlib.sha1(source.encode("utf8")).hexdigest()
+
+
+def _compile_init(name, arguments, lazy=False, key=None, order=None):
+    """Compile a specialized ``_init`` for ``arguments``, see
+    :func:`_init_source` for ``order``.
+
+    If a factory generated ahead of time is registered for ``key``, and it's
+    generated from the same source, it's used instead of compiling.
+    """
+    if lazy:
+        source = _lazy_init_source(arguments)
+    else:
+        source = _init_source(arguments, order)
+    entry = _precompiled.get(key)
+    if entry is not None and entry[0] == _fingerprint(source):
+        init = entry[1](arguments)
+        init._meta_precompiled = True
+        return init
+
+    namespace = {
+        "_DEFAULT": Argument._DEFAULT,
+        "_spawn": _spawn,
+        "Invalid": Invalid,
+        "ConvertError": ConvertError,
+        "ArgumentMissError": ArgumentMissError,
+        "ArgumentInvalidError": ArgumentInvalidError,
+    }
+    code = compile(source, "<parameter %s>" % name, "exec")
+    exec(code, namespace)
+    return namespace["_make_init"](arguments)
+
+
+def _estimate_cost(arg):
+    """Returns the estimated cost of converting ``arg``, see
+    :attr:`parameter.types.BaseType.cost`."""
+    if isinstance(arg.type_, Nested):
+        cost = 1 + sum(_estimate_cost(nested)
+                       for _, nested in arg.type_.model_cls._meta_arguments)
+    else:
+        cost = arg.type_.cost
+    # A multiple argument counts as several values.
+    return cost * 8 if arg.multiple else cost
+
+
+def _cost_order(arguments, costs=None):
+    """Returns the indexes of ``arguments`` in order of the costs.
+
+    :param costs:
+        A dict maps the names of the arguments to the measured costs, the
+        arguments without measured costs are ordered after the others by the
+        estimated costs.
+    """
+    costs = costs or {}
+
+    def key(index):
+        arg = arguments[index][1]
+        if arg.name in costs:
+            return (0, costs[arg.name], index)
+        return (1, _estimate_cost(arg), index)
+
+    return sorted(range(len(arguments)), key=key)
+
+
+def _pack(arg, values):
+    """Pack the converted values of a multiple argument if its type is
+    configured to, see :class:`parameter.types.Integer`."""
+    if getattr(arg.type_, "packed", False):
+        return arg.type_.convert_many(values)
+    return values
+
+
+def _spawn(arg, adapter, value):
+    """Spawn the adapter of a nested model from ``value``. The missing value
+    is returned as it is, so it's reported as missing.
+
+    :raises: :class:`~parameter.exception.ArgumentInvalidError` if the
+        adapter can't be spawned from the value, e.g. it's not an object.
+    :raises: :class:`~parameter.exception.LimitExceededError`
+    """
+    if arg.is_init_default(value):
+        return value
+    try:
+        return adapter.spawn(value)
+    except LimitExceededError:
+        raise
+    except (TypeError, ValueError) as e:
+        raise ArgumentInvalidError(arg.invalid_message, arg.name, e)
+
+
+class _LazyArgument(object):
+    """Descriptor of an argument of lazy model, it converts the raw value on
+    first access and caches the result in the instance's ``__dict__``."""
+
+    def __init__(self, attr, index, arg):
+        self.attr = attr
+        self.index = index
+        self.arg = arg
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        arg = self.arg
+        raw = instance._meta_raw[self.index]
+        if arg.multiple:
+            value = _pack(arg, [
+                arg.convert(instance._attempt_construct_adapter(arg, v))
+                for v in arg.check_items(raw)])
+        else:
+            value = arg.convert(instance._attempt_construct_adapter(arg, raw))
+
+        # The instance's ``__dict__`` takes precedence over this non-data
+        # descriptor, so the following accesses are plain lookups.
+        instance.__dict__[self.attr] = value
+        return value
+
+
+def _convert_row(arg, adapter):
+    """Check and convert the value of ``arg`` from ``adapter``, it's the same
+    as what ``Model._init`` does for a single argument."""
+    nested = isinstance(arg.type_, Nested)
+    if arg.multiple:
+        return _pack(arg, [arg.convert(_spawn(arg, adapter, v) if nested
+                                       else v)
+                           for v in arg.check_items(
+                               adapter.get_arguments(arg.name))])
+
+    value = adapter.get_argument(arg.name, arg.default)
+    return arg.convert(_spawn(arg, adapter, value) if nested else value)
+
+
+class _Chunk(object):
+    """A chunk of records that validated field by field.
+
+    If all records are dicts, values are fetched from the dicts directly with
+    the semantics of :class:`~parameter.adapter.JSONAdapter`, the adapters
+    are only created if necessary.
+    """
+
+    def __init__(self, records, adapter_cls):
+        self.adapter_cls = adapter_cls
+        self.rows = list(range(len(records)))
+        self.errors = {}
+        self.columns = []
+
+        if set(map(type, records)) == {dict}:
+            self.records = records
+            self._adapters = None
+        else:
+            self.records = None
+            self._adapters = []
+            for row, record in enumerate(records):
+                if not isinstance(record, BaseAdapter):
+                    try:
+                        record = adapter_cls(record)
+                    except (TypeError, ValueError) as e:
+                        self.errors[row] = e
+                self._adapters.append(record)
+            if self.errors:
+                self.drop()
+
+    @property
+    def adapters(self):
+        if self._adapters is None:
+            self._adapters = list(map(self.adapter_cls, self.records))
+        return self._adapters
+
+    def convert_column(self, arg):
+        """Attempt to convert the whole column at once, which is the common
+        case that all values are valid. Returns ``None`` if it failed, then
+        the column must be checked row by row to find out the errors.
+        """
+        if arg.multiple:
+            return self.convert_multiple_column(arg)
+
+        name = arg.name
+        default = arg.default
+        if self._adapters is None:
+            # The builtin ``map`` of Python 2 doesn't stop at the shortest.
+            values = list(six.moves.map(dict.get, self.records,
+                                        repeat(name), repeat(default)))
+        else:
+            try:
+                values = [adapter.get_argument(name, default)
+                          for adapter in self._adapters]
+            except ArgumentError:
+                return None
+
+        # Use ``in`` to detect the missing values, this may report false
+        # positive on values equal to the initial default, but they are
+        # rechecked row by row.
+        if Argument.is_init_default(default) and default in values:
+            return None
+
+        if isinstance(arg.type_, Nested):
+            try:
+                values = [adapter.spawn(value)
+                          for adapter, value in zip(self.adapters, values)]
+            except (TypeError, ValueError):
+                return None
+
+        try:
+            if not _defined_by(type(arg), "convert", Argument):
+                return list(map(arg.convert, values))
+            if getattr(arg.type_, "packed", False):
+                # The packed values are only for multiple arguments.
+                return list(map(arg.type_.convert, values))
+            return arg.type_.convert_many(values)
+        except (ConvertError, ArgumentError, TypeError, ValueError):
+            # Any failure is rechecked row by row, e.g. a custom type which
+            # raises ``TypeError`` for ``None``.
+            return None
+
+    def convert_multiple_column(self, arg):
+        """Convert the values of all rows of a multiple argument at once."""
+        if (isinstance(arg.type_, Nested) or
+                not _defined_by(type(arg), "convert", Argument)):
+            return None
+
+        name = arg.name
+        check_items = arg.check_items
+        try:
+            values = [check_items(adapter.get_arguments(name))
+                      for adapter in self.adapters]
+        except ArgumentError:
+            return None
+
+        values = [value if isinstance(value, (list, tuple)) else list(value)
+                  for value in values]
+        flat = list(chain.from_iterable(values))
+        if Argument._DEFAULT in flat:
+            return None
+
+        convert_many = arg.type_.convert_many
+        try:
+            if getattr(arg.type_, "packed", False):
+                return [convert_many(value) for value in values]
+            flat = iter(convert_many(flat))
+        except (ConvertError, TypeError, ValueError):
+            return None
+        return [list(islice(flat, len(value))) for value in values]
+
+    def convert_rows(self, arg):
+        """Convert the column row by row, and record the errors."""
+        column = []
+        for row, adapter in zip(self.rows, self.adapters):
+            try:
+                column.append(_convert_row(arg, adapter))
+            except (ArgumentError, LimitExceededError) as e:
+                self.errors[row] = e
+                column.append(None)
+            except (TypeError, ValueError) as e:
+                # Raised by a custom type, the same as a batch of models
+                # created one by one doesn't abort.
+                self.errors[row] = ArgumentInvalidError(arg.invalid_message,
+                                                        arg.name, e)
+                column.append(None)
+        return column
+
+    def drop(self):
+        """Drop the rows which failed from the chunk."""
+        keep = [i for i, row in enumerate(self.rows) if row not in self.errors]
+        self.rows = [self.rows[i] for i in keep]
+        if self.records is not None:
+            self.records = [self.records[i] for i in keep]
+        if self._adapters is not None:
+            self._adapters = [self._adapters[i] for i in keep]
+        self.columns = [(attr, [column[i] for i in keep])
+                        for attr, column in self.columns]
+
+    def validate(self, model_cls):
+        """Returns a list of ``(instance, error)`` in order of records."""
+        for attr, arg in model_cls._meta_arguments:
+            column = self.convert_column(arg)
+            if column is None:
+                errors = len(self.errors)
+                column = self.convert_rows(arg)
+                self.columns.append((attr, column))
+                if len(self.errors) > errors:
+                    self.drop()
+            else:
+                self.columns.append((attr, column))
+
+        build = _compile_build(model_cls)
+        rows = zip(*(column for _, column in self.columns))
+        if not self.columns:
+            rows = repeat((), len(self.rows))
+        instances = list(map(build, self.adapters, rows))
+
+        results = [None] * (len(self.rows) + len(self.errors))
+        for row, instance in zip(self.rows, instances):
+            results[row] = (instance, None)
+        for row, error in self.errors.items():
+            results[row] = (None, error)
+        return results
+
+
+def _compile_build(model_cls):
+    """Returns a function which creates an instance of ``model_cls`` from an
+    adapter and a tuple of the converted values, without checking."""
+    build = vars(model_cls).get("_meta_build")
+    if build is not None:
+        return build
+
+    lines = ["def _make_build(_new, _cls):",
+             "    def _build(adapter, values):",
+             "        self = _new(_cls)",
+             "        self.adapter = adapter"]
+    for index, (attr, _) in enumerate(model_cls._meta_arguments):
+        lines.append("        self.%s = values[%d]" % (attr, index))
+    lines.extend(["        return self", "    return _build", ""])
+
+    namespace = {}
+    code = compile("\n".join(lines), "<parameter %s>" % model_cls.__name__,
+                   "exec")
+    exec(code, namespace)
+    build = namespace["_make_build"](object.__new__, model_cls)
+    model_cls._meta_build = build
+    return build
+
+
+def _compile_check(model_cls):
+    """Returns a function which checks the arguments of ``model_cls`` from an
+    adapter, and returns ``(values, errors)``."""
+    check = vars(model_cls).get("_meta_check")
+    if check is not None:
+        return check
+
+    header = ["def _make_check(_meta_arguments):"]
+    body = ["    def _check(adapter):",
+            "        values = {}",
+            "        errors = []"]
+
+    for index, (attr, arg) in enumerate(model_cls._meta_arguments):
+        header.append("    _arg_%d = _meta_arguments[%d][1]" % (index, index))
+        if (arg.multiple or isinstance(arg.type_, Nested) or
+                not _defined_by(type(arg), "convert", Argument)):
+            lines = [
+                "        value = _check_argument(_arg_%(i)d, adapter, errors)",
+                "        if value is not _FAILED:",
+                "            values[%(attr)r] = value",
+            ]
+        else:
+            header.extend(line % {"i": index} for line in (
+                "    _name_%(i)d = _arg_%(i)d.name",
+                "    _default_%(i)d = _arg_%(i)d.default",
+                "    _convert_%(i)d = _arg_%(i)d.type_.try_convert",
+            ))
+            lines = [
+                "        try:",
+                "            value = adapter.get_argument(_name_%(i)d, "
+                "_default_%(i)d)",
+                "        except ArgumentError as e:",
+                "            errors.append((e.name, e.code))",
+                "        else:",
+                "            if value is _DEFAULT:",
+                "                errors.append((_name_%(i)d, _MISSING))",
+                "            else:",
+                "                value = _convert_%(i)d(value)",
+                "                if type(value) is Invalid:",
+                "                    errors.append((_name_%(i)d, value.code))",
+                "                else:",
+                "                    values[%(attr)r] = value",
+            ]
+        body.extend(line % {"i": index, "attr": str(attr)} for line in lines)
+
+    body.append("        return values, errors")
+    namespace = {
+        "_DEFAULT": Argument._DEFAULT,
+        "_FAILED": _FAILED,
+        "_MISSING": ArgumentMissError.code,
+        "_check_argument": _check_argument,
+        "Invalid": Invalid,
+        "ArgumentError": ArgumentError,
+    }
+    code = compile("\n".join(header + body + ["    return _check", ""]),
+                   "<parameter %s>" % model_cls.__name__, "exec")
+    exec(code, namespace)
+    check = namespace["_make_check"](model_cls._meta_arguments)
+    model_cls._meta_check = check
+    return check
+
+
+def _validate_chunk(model_cls, records, adapter_cls):
+    """Validate a chunk of records, returns a list of ``(instance, error)``.
+    """
+    if (model_cls._meta_options["lazy"] or model_cls._meta_order or
+            not getattr(model_cls._init, "_meta_compiled", False)):
+        # The way of initializing is customized, or the arguments are
+        # ordered, create the models one by one.
+        results = []
+        for record in records:
+            try:
+                if not isinstance(record, BaseAdapter):
+                    record = adapter_cls(record)
+                results.append((model_cls(record).validate(), None))
+            except (ArgumentError, TypeError, ValueError) as e:
+                results.append((None, e))
+        return results
+
+    return _Chunk(records, adapter_cls).validate(model_cls)
+
+
+class ValidationResult(object):
+    """Result of :meth:`Model.check`.
+
+    :ivar values: A dict maps attribute name to the converted value.
+    :ivar errors:
+        A list of ``(name, code)`` for all failures, ``name`` is the name of
+        the argument in request, the arguments of nested models and the
+        items of multiple arguments are joined by dot, e.g. ``person.age``,
+        ``badges.1``.
+    """
+    __slots__ = ("model_cls", "adapter", "values", "errors", "_instance")
+
+    def __init__(self, model_cls, adapter, values, errors):
+        self.model_cls = model_cls
+        self.adapter = adapter
+        self.values = values
+        self.errors = errors
+        self._instance = None
+
+    @property
+    def ok(self):
+        """``True`` if all arguments are valid."""
+        return not self.errors
+
+    @property
+    def instance(self):
+        """The model created by the converted values, ``None`` if the result
+        is not ok."""
+        if self._instance is None and self.ok:
+            build = _compile_build(self.model_cls)
+            self._instance = build(self.adapter, tuple(
+                self.values[attr]
+                for attr, _ in self.model_cls._meta_arguments))
+        return self._instance
+
+    def __repr__(self):
+        return "<ValidationResult %s %r>" % (self.model_cls.__name__,
+                                             self.errors)
+
+
+# Marks a value which failed in ``_check_value``.
+_FAILED = object()
+
+
+def _check_value(arg, adapter, value, name, errors):
+    """Check and convert a single value of ``arg``, the failures are appended
+    to ``errors``. Returns ``_FAILED`` if the value is invalid."""
+    nested = isinstance(arg.type_, Nested)
+    try:
+        if nested:
+            value = _spawn(arg, adapter, value)
+        if not _defined_by(type(arg), "convert", Argument):
+            return arg.convert(value)
+    except (ArgumentError, LimitExceededError) as e:
+        errors.append((name, e.code))
+        return _FAILED
+
+    if Argument.is_init_default(value):
+        errors.append((name, ArgumentMissError.code))
+        return _FAILED
+
+    if nested:
+        result = arg.type_.model_cls.check(value)
+        if result.ok:
+            return result.instance
+        errors.extend(("%s.%s" % (name, key), code)
+                      for key, code in result.errors)
+        return _FAILED
+
+    value = arg.type_.try_convert(value)
+    if type(value) is Invalid:
+        errors.append((name, value.code))
+        return _FAILED
+    return value
+
+
+def _check_argument(arg, adapter, errors):
+    """Check and convert ``arg`` from ``adapter``, the failures are appended
+    to ``errors``. Returns ``_FAILED`` if the argument is invalid."""
+    try:
+        if arg.multiple:
+            raw = arg.check_items(adapter.get_arguments(arg.name))
+        else:
+            raw = adapter.get_argument(arg.name, arg.default)
+    except ArgumentError as e:
+        errors.append((e.name, e.code))
+        return _FAILED
+
+    if not arg.multiple:
+        return _check_value(arg, adapter, raw, arg.name, errors)
+
+    values = [_check_value(arg, adapter, value, "%s.%d" % (arg.name, index),
+                           errors)
+              for index, value in enumerate(raw)]
+    if _FAILED in values:
+        return _FAILED
+    return _pack(arg, values)
+
+
+class ColumnarResult(object):
+    """Result of :meth:`Model.validate_columns`.
+
+    :ivar columns:
+        A dict maps attribute name to the converted values of all rows, the
+        values of invalid rows are ``None``, or ``0`` in the packed arrays.
+        The column of a nested model is a :class:`ColumnarResult`.
+    :ivar valid: A list of bool, ``True`` if the row is valid.
+    :ivar errors:
+        A dict maps the index of invalid row to a list of ``(name, code)``,
+        see :attr:`ValidationResult.errors`.
+    """
+    __slots__ = ("model_cls", "columns", "valid", "errors")
+
+    def __init__(self, model_cls, columns, valid, errors):
+        self.model_cls = model_cls
+        self.columns = columns
+        self.valid = valid
+        self.errors = errors
+
+    def __len__(self):
+        return len(self.valid)
+
+    @property
+    def ok(self):
+        """``True`` if all rows are valid."""
+        return not self.errors
+
+    def __repr__(self):
+        return "<ColumnarResult %s rows=%d invalid=%d>" % (
+            self.model_cls.__name__, len(self), len(self.errors))
+
+
+def _try_convert_column(arg, column, name, errors):
+    """Convert a column value by value, the failures are collected into
+    ``errors`` which maps row to a list of ``(name, code)``."""
+    values = []
+    append = values.append
+    if not _defined_by(type(arg), "convert", Argument):
+        for row, value in enumerate(column):
+            try:
+                append(arg.convert(value))
+            except ArgumentError as e:
+                errors.setdefault(row, []).append((name, e.code))
+                append(None)
+        return values
+
+    try_convert = arg.type_.try_convert
+    for row, value in enumerate(column):
+        value = try_convert(value)
+        if type(value) is Invalid:
+            errors.setdefault(row, []).append((name, value.code))
+            value = None
+        append(value)
+    return values
+
+
+def _convert_column(arg, column, errors):
+    """Convert a column of single values."""
+    if not _defined_by(type(arg), "convert", Argument):
+        return _try_convert_column(arg, column, arg.name, errors)
+
+    try:
+        return arg.type_.convert_many(column)
+    except ConvertError:
+        values = _try_convert_column(arg, column, arg.name, errors)
+    if getattr(arg.type_, "packed", False):
+        return arg.type_.convert_many(
+            [0 if value is None else value for value in values])
+    return values
+
+
+def _convert_multiple_column(arg, column, errors):
+    """Convert a column of which each row is a list of values."""
+    values = []
+    for row, items in enumerate(column):
+        if not isinstance(items, (list, tuple)):
+            errors.setdefault(row, []).append((arg.name, ConvertError.code))
+            values.append(None)
+            continue
+        if arg.max_items is not None and len(items) > arg.max_items:
+            errors.setdefault(row, []).append(
+                (arg.name, MaxitemsExceedError.code))
+            values.append(None)
+            continue
+
+        try:
+            if not _defined_by(type(arg), "convert", Argument):
+                raise ConvertError()
+            values.append(arg.type_.convert_many(items))
+            continue
+        except ConvertError:
+            pass
+
+        item_errors = {}
+        items = _try_convert_column(arg, items, None, item_errors)
+        if item_errors:
+            errors.setdefault(row, []).extend(
+                ("%s.%d" % (arg.name, index), code)
+                for index, failures in sorted(item_errors.items())
+                for _, code in failures)
+            values.append(None)
+        else:
+            values.append(_pack(arg, items))
+    return values
+
+
+def _validate_columns(model_cls, adapter):
+    """Validate a :class:`~parameter.adapter.ColumnarAdapter`, returns a
+    :class:`ColumnarResult`."""
+    if not getattr(model_cls._init, "_meta_compiled", False):
+        raise TypeError("%s customizes the initialization, which can't be "
+                        "validated by columns." % model_cls.__name__)
+
+    for attr, arg in model_cls._meta_arguments:
+        if (not isinstance(arg.type_, Nested) and
+                isinstance(adapter.get_argument(arg.name, None), dict)):
+            raise ValueError("Column ``%s`` must be a list, but got a dict."
+                             % arg.name)
+
+    length = adapter.length
+    nested = {}
+    for attr, arg in model_cls._meta_arguments:
+        if not isinstance(arg.type_, Nested):
+            continue
+        if arg.multiple:
+            raise TypeError("Multiple nested argument ``%s`` can't be "
+                            "validated by columns." % arg.name)
+
+        value = adapter.get_argument(arg.name, None)
+        if value is not None:
+            if not isinstance(value, dict):
+                raise ValueError("Column ``%s`` of a nested model must be a "
+                                 "dict of columns, but got %s."
+                                 % (arg.name, type(value)))
+            value = _validate_columns(arg.type_.model_cls,
+                                      adapter.spawn(value))
+            if length is None:
+                length = len(value)
+            elif len(value) != length:
+                raise ValueError("Columns of ``%s`` have %d rows, expect %d."
+                                 % (arg.name, len(value), length))
+        nested[attr] = value
+    length = length or 0
+
+    columns = {}
+    errors = {}
+    for attr, arg in model_cls._meta_arguments:
+        if attr in nested:
+            result = nested[attr]
+            if result is None:
+                code = (ArgumentMissError.code
+                        if Argument.is_init_default(arg.default)
+                        else ConvertError.code)
+                for row in range(length):
+                    errors.setdefault(row, []).append((arg.name, code))
+                result = [None] * length
+            else:
+                for row, failures in result.errors.items():
+                    errors.setdefault(row, []).extend(
+                        ("%s.%s" % (arg.name, name), code)
+                        for name, code in failures)
+            columns[attr] = result
+            continue
+
+        if arg.multiple:
+            column = adapter.get_argument(arg.name, None)
+            if column is None:
+                column = [None] * length
+            columns[attr] = _convert_multiple_column(arg, column, errors)
+            continue
+
+        column = adapter.get_argument(arg.name, arg.default)
+        if column is not arg.default:
+            columns[attr] = _convert_column(arg, column, errors)
+        elif Argument.is_init_default(column):
+            for row in range(length):
+                errors.setdefault(row, []).append(
+                    (arg.name, ArgumentMissError.code))
+            columns[attr] = [None] * length
+        else:
+            columns[attr] = _convert_column(arg, [column] * length, errors)
+
+    valid = [True] * length
+    for row in errors:
+        valid[row] = False
+        for attr, arg in model_cls._meta_arguments:
+            column = columns[attr]
+            if type(column) is list:
+                column[row] = None
+            elif not isinstance(column, ColumnarResult):
+                # Packed array.
+                column[row] = 0
+    return ColumnarResult(model_cls, columns, valid, errors)
+
+
+# Set by :mod:`parameter.metrics` while any hook is installed, it's called
+# with the models created then.
+_instrument = None
+
 
 class ModelMeta(type):
+    _default_options = {
+        "lazy": False,
+        "order": None,
+    }
+
     def __new__(cls, name, base, __dict__):
+        options = dict(cls._default_options)
+        for klass in reversed(base):
+            options.update(getattr(klass, "_meta_options", None) or {})
+
+        meta = __dict__.pop("Meta", None)
+        if meta is not None:
+            for key, val in vars(meta).items():
+                if key.startswith("_"):
+                    continue
+                if key not in cls._default_options:
+                    raise TypeError(
+                        "'class Meta' got invalid attribute: %s" % key)
+                options[key] = val
+        if options["order"] not in (None, "cost"):
+            raise TypeError(
+                "'class Meta' got invalid order: %r" % options["order"])
+        if options["order"] and options["lazy"]:
+            raise TypeError("Lazy model converts the arguments on access, "
+                            "it can't be ordered.")
+        __dict__["_meta_options"] = options
+
         arguments = []
 
         for attr, val in __dict__.items():
@@ -148,16 +1091,75 @@ class ModelMeta(type):
 
             arguments.append((attr, val))
         __dict__["_meta_arguments"] = arguments
+        __dict__["_meta_order"] = (_cost_order(arguments)
+                                   if options["order"] else None)
 
         for key, _ in arguments:
             __dict__.pop(key)
 
-        return type.__new__(cls, name, base, __dict__)
+        # Store the values of arguments in slots, the slots that user
+        # declared are kept.
+        slots = __dict__.get("__slots__", ())
+        if isinstance(slots, six.string_types):
+            slots = (slots,)
+        if options["lazy"]:
+            # Raw values are kept in ``_meta_raw`` and converted values are
+            # cached in ``__dict__`` by the descriptors.
+            lazy_slots = []
+            if not any(hasattr(klass, "_meta_raw") for klass in base):
+                lazy_slots.append("_meta_raw")
+            if not any(klass.__dictoffset__ for klass in base):
+                lazy_slots.append("__dict__")
+            __dict__["__slots__"] = tuple(slots) + tuple(
+                key for key in lazy_slots if key not in slots)
+            for index, (key, val) in enumerate(arguments):
+                __dict__[key] = _LazyArgument(key, index, val)
+        else:
+            __dict__["__slots__"] = tuple(slots) + tuple(
+                key for key, _ in arguments if key not in slots)
+
+        model_cls = type.__new__(cls, name, base, __dict__)
+
+        # Unless the way of initializing is customized, replace ``_init``
+        # with a function specialized for the declared arguments.
+        # ``Model`` itself keeps the generic one.
+        model_base = globals().get("Model")
+        if model_base is not None and (
+                _defined_by(model_cls, "_init", model_base) and
+                _defined_by(model_cls, "_attempt_construct_adapter",
+                            model_base)):
+            key = (model_cls.__module__,
+                   getattr(model_cls, "__qualname__", name))
+            init = _compile_init(name, arguments, options["lazy"], key,
+                                 model_cls._meta_order)
+            # Mark the function, the unbound method of Python 2 doesn't
+            # accept attributes.
+            init._meta_compiled = True
+            model_cls._init = init
+            if _instrument is not None:
+                _instrument(model_cls)
+
+        return model_cls
 
 
 @six.add_metaclass(ModelMeta)
 class Model(object):
+    """Base class of models.
+
+    The values of arguments are stored in ``__slots__`` which generated by
+    the metaclass, so instances don't have a ``__dict__``. If you need to
+    set other attributes on the instance, declare them in ``__slots__``::
+
+        class DemoEntity(Model):
+            __slots__ = ("extra",)
+
+            a = Argument(types.Integer)
+    """
+    __slots__ = ("adapter",)
+
     _meta_arguments = None       # type: list
+    _meta_options = None         # type: dict
+    _meta_order = None           # type: list
 
     def __init__(self, adapter):
         """Initialize
@@ -169,7 +1171,6 @@ class Model(object):
         :type adapter: :class:`BaseAdapter`
         """
         self.adapter = adapter
-        self._arguments = {}
         self._init()
 
     def _attempt_construct_adapter(self, arg, val):
@@ -177,24 +1178,209 @@ class Model(object):
         if the type of arg's is :class:`~parameter.types.Nested`.
         """
         if isinstance(arg.type_, Nested):
-            return self.adapter.spawn(val)
+            return _spawn(arg, self.adapter, val)
         return val
 
     def _init(self):
         """Initialize arguments"""
+        if self._meta_options["lazy"]:
+            self._meta_raw = tuple(
+                self.adapter.get_arguments(arg.name) if arg.multiple else
+                self.adapter.get_argument(arg.name, arg.default)
+                for _, arg in self._meta_arguments)
+            return
+
         for attr, arg in self._meta_arguments:
             if arg.multiple:
-                val = self.adapter.get_arguments(arg.name)
-                val = [arg.convert(self._attempt_construct_adapter(arg, v))
-                       for v in val]
+                val = arg.check_items(self.adapter.get_arguments(arg.name))
+                val = _pack(arg, [
+                    arg.convert(self._attempt_construct_adapter(arg, v))
+                    for v in val])
             else:
                 val = self.adapter.get_argument(arg.name, arg.default)
                 val = arg.convert(self._attempt_construct_adapter(arg, val))
 
-            self._arguments[attr] = val
+            setattr(self, attr, val)
+
+    def validate(self):
+        """Check and convert all arguments.
+
+        Arguments of a lazy model are converted on first access, use this
+        method to force a full check. It's a no-op on other models.
+
+        :raises: :class:`~parameter.exception.ArgumentMissError`
+        :raises: :class:`~parameter.exception.ArgumentInvalidError`
+        """
+        if self._meta_options["lazy"]:
+            for attr, _ in self._meta_arguments:
+                getattr(self, attr)
+        return self
+
+    @classmethod
+    def reorder(cls, costs=None):
+        """Order the conversions of the arguments by costs, cheap ones first,
+        so an invalid request fails fast. It's the same as declaring
+        ``order = "cost"`` in ``class Meta`` if ``costs`` is ``None``.
+
+        The required arguments are always checked for missing first, in
+        order of declaration. The order is kept until this method is called
+        again, so the same request always fails at the same argument.
+
+        Usage::
+
+            stats = recorder.stats(DemoEntity)
+            DemoEntity.reorder(stats.costs())
+
+        :param costs:
+            A dict maps the names of the arguments to the measured costs, e.g.
+            :meth:`parameter.metrics.ModelStats.costs`. The arguments without
+            measured costs are converted after the others, by the estimated
+            costs.
+        :raises: :class:`TypeError` if the model is lazy or customizes the way
+            of initializing.
+        """
+        init = vars(cls).get("_init")
+        original = getattr(init, "_meta_original", init)
+        if (cls._meta_options["lazy"] or
+                not getattr(original, "_meta_compiled", False)):
+            raise TypeError("Only the models initialized by the specialized "
+                            "``_init`` can be ordered.")
+
+        cls._meta_options["order"] = "cost"
+        cls._meta_order = _cost_order(cls._meta_arguments, costs)
+        reordered = _compile_init(
+            cls.__name__, cls._meta_arguments, order=cls._meta_order,
+            key=(cls.__module__, getattr(cls, "__qualname__", cls.__name__)))
+        reordered._meta_compiled = True
+        cls._init = reordered
+        if _instrument is not None:
+            # Instrumented by :mod:`parameter.metrics` in the new order.
+            _instrument(cls)
+
+    @classmethod
+    def create_async(cls, adapter, **kwargs):
+        """Returns an awaitable which creates the model from an
+        asynchronous adapter, requires Python 3.5+.
+
+        Usage::
+
+            entity = await DemoEntity.create_async(adapter)
+
+        :param adapter: Instance of :class:`~parameter.aio.AsyncAdapter`.
+        :param kwargs: See :func:`parameter.aio.create`.
+        """
+        from .aio import create
+        return create(cls, adapter, **kwargs)
+
+    @classmethod
+    def check(cls, adapter):
+        """Check the arguments from ``adapter`` without raising exceptions,
+        all failures are collected.
+
+        Usage::
+
+            result = DemoEntity.check(adapter)
+            if result.ok:
+                entity = result.instance
+            else:
+                for name, code in result.errors:
+                    print(name, code)   # e.g. "age", "mismatch"
+
+        :param adapter: The adapter to get argument.
+        :type adapter: :class:`BaseAdapter`
+        :rtype: :class:`ValidationResult`
+        """
+        if not getattr(cls._init, "_meta_compiled", False):
+            # The way of initializing is customized.
+            try:
+                instance = cls(adapter).validate()
+            except ArgumentError as e:
+                return ValidationResult(cls, adapter, {}, [(e.name, e.code)])
+
+            result = ValidationResult(cls, adapter, instance._arguments, [])
+            result._instance = instance
+            return result
+
+        values, errors = _compile_check(cls)(adapter)
+        return ValidationResult(cls, adapter, values, errors)
+
+    @classmethod
+    def validate_columns(cls, columns):
+        """Validate the data in columns, each argument's type converts its
+        column at once, no instance is created.
+
+        Usage::
+
+            result = DemoEntity.validate_columns({
+                "ts": ["2017-01-01", "2017-01-02"],
+                "value": [1.5, "x"],
+            })
+            result.columns["value"]     # [1.5, None]
+            result.valid                # [True, False]
+            result.errors               # {1: [("value", "mismatch")]}
+
+        The arguments which are not multiple read the values of the rows from
+        a list. The multiple arguments read a list of lists, and the nested
+        models read a dict of columns. The multiple nested arguments are not
+        supported.
+
+        :param columns:
+            Instance of :class:`~parameter.adapter.ColumnarAdapter`, or the
+            data to create it.
+        :rtype: :class:`ColumnarResult`
+        :raises: :class:`ValueError` if the columns have different lengths,
+            or a column doesn't match its argument, e.g. a dict for an
+            argument which is not a nested model.
+        """
+        from .adapter import ColumnarAdapter
+
+        if not isinstance(columns, ColumnarAdapter):
+            columns = ColumnarAdapter(columns)
+        return _validate_columns(cls, columns)
+
+    @classmethod
+    def validate_many(cls, records, chunk_size=1000):
+        """Validate a batch of records.
+
+        The records are validated in chunks, each chunk is checked field by
+        field across all records in it, which is faster than creating the
+        model one by one. An invalid record doesn't stop the batch.
+
+        Usage::
+
+            for index, entity, error in DemoEntity.validate_many(records):
+                if error is not None:
+                    print(index, error.name)
+
+        :param records:
+            An iterable of adapters, the items that are not adapter are
+            wrapped by :class:`~parameter.adapter.JSONAdapter`.
+        :param chunk_size: Number of records to validate at once.
+        :returns:
+            A generator yields ``(index, instance, error)`` in order of
+            ``records``. ``instance`` is ``None`` if the record is invalid,
+            and ``error`` is the exception that creating the model would
+            raise, otherwise ``error`` is ``None``.
+        """
+        from .adapter import JSONAdapter
+
+        offset = 0
+        records = iter(records)
+        while True:
+            chunk = list(islice(records, chunk_size))
+            if not chunk:
+                return
+
+            for index, (instance, error) in enumerate(
+                    _validate_chunk(cls, chunk, JSONAdapter), offset):
+                yield index, instance, error
+            offset += len(chunk)
 
-    def __getattr__(self, key):
-        return self._arguments[key]
+    @property
+    def _arguments(self):
+        """Returns a dict that maps attribute name to the value."""
+        return dict((attr, getattr(self, attr))
+                    for attr, _ in self._meta_arguments)
 
     def __repr__(self):
         args = " ".join("<%s: %s>" % (attr, arg.type_.__class__.__name__)
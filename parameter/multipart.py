@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""Incremental parser of ``multipart/form-data`` bodies.
+
+The parser reads the body from a stream chunk by chunk, and hands the data of
+each part to a writer as soon as it's read, so the body never stays in memory
+as a whole. See :class:`~parameter.adapter.MultipartAdapter`.
+"""
+from __future__ import print_function, division, unicode_literals
+
+import re
+import tempfile
+
+from .scanner import DEFAULT_CHUNK_SIZE, _iter_chunks
+
+#: Files larger than this size in bytes are spooled to a temporary file.
+DEFAULT_SPOOL_SIZE = 1024 * 1024
+#: Maximum size in bytes of the headers of a part.
+MAX_HEADER_SIZE = 16 * 1024
+
+_PARAM = re.compile(r';\s*([^\s=;]+)\s*=\s*("(?:[^"\\]|\\.)*"|[^;]*)')
+
+
+def parse_options_header(value):
+    """Parse a header like ``Content-Disposition`` and ``Content-Type``,
+    returns the value and a dict of the parameters."""
+    value = value.strip()
+    index = value.find(";")
+    if index < 0:
+        return value.lower(), {}
+
+    params = {}
+    for key, val in _PARAM.findall(value[index:]):
+        val = val.strip()
+        if val[:1] == '"' and val[-1:] == '"':
+            val = re.sub(r'\\(.)', r'\1', val[1:-1])
+        params[key.lower()] = val
+    return value[:index].strip().lower(), params
+
+
+class UploadedFile(object):
+    """A file of the multipart body.
+
+    :ivar name: Name of the field.
+    :ivar filename: Name of the file that the client sent.
+    :ivar content_type: Content type of the file.
+    :ivar size: Size of the file in bytes.
+    :ivar file:
+        A :class:`tempfile.SpooledTemporaryFile` which holds the content,
+        positioned at the start.
+    """
+
+    def __init__(self, name, filename, content_type,
+                 spool_size=DEFAULT_SPOOL_SIZE):
+        self.name = name
+        self.filename = filename
+        self.content_type = content_type
+        self.size = 0
+        self.file = tempfile.SpooledTemporaryFile(max_size=spool_size)
+
+    def write(self, data):
+        self.file.write(data)
+        self.size += len(data)
+
+    def read(self, *args):
+        return self.file.read(*args)
+
+    def seek(self, *args):
+        return self.file.seek(*args)
+
+    def close(self):
+        self.file.close()
+
+    def __repr__(self):
+        return "<UploadedFile %s: %r (%d bytes)>" % (self.name, self.filename,
+                                                     self.size)
+
+
+class MultipartParser(object):
+    """Parse a ``multipart/form-data`` body from a stream.
+
+    :param stream:
+        A file-like object which has a ``read`` method, or an iterable of
+        bytes chunks.
+    :param boundary: The boundary from the ``Content-Type`` header.
+    :param chunk_size: Size to read from a file-like object at once.
+    """
+
+    def __init__(self, stream, boundary, chunk_size=DEFAULT_CHUNK_SIZE):
+        if not isinstance(boundary, bytes):
+            boundary = boundary.encode("latin-1")
+        if not boundary:
+            raise ValueError("Missing boundary of multipart body")
+
+        self._chunks = _iter_chunks(stream, chunk_size)
+        self._delimiter = b"\r\n--" + boundary
+        self._buf = b""
+        self._pos = 0
+
+    def _more(self):
+        """Read the next chunk and discard the consumed bytes, returns
+        ``False`` on the end of the stream."""
+        for chunk in self._chunks:
+            if chunk:
+                break
+        else:
+            return False
+
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _find(self, sep, limit=None):
+        """Returns the index of ``sep`` from the current position, reads more
+        as necessary.
+
+        :param limit: Maximum number of bytes to search.
+        """
+        while True:
+            index = self._buf.find(sep, self._pos)
+            if index >= 0:
+                return index
+            if limit is not None and len(self._buf) - self._pos > limit:
+                raise ValueError("Headers of multipart body are too large")
+            if not self._more():
+                raise ValueError("Unexpected end of multipart body")
+
+    def _read(self, size):
+        while len(self._buf) - self._pos < size:
+            if not self._more():
+                raise ValueError("Unexpected end of multipart body")
+        data = self._buf[self._pos:self._pos + size]
+        self._pos += size
+        return data
+
+    def _skip_preamble(self):
+        # The first boundary may be at the start, which has no CRLF ahead.
+        self._buf = b"\r\n"
+        while True:
+            index = self._buf.find(self._delimiter, self._pos)
+            if index >= 0:
+                self._pos = index + len(self._delimiter)
+                return
+            self._pos = max(self._pos,
+                            len(self._buf) - len(self._delimiter) + 1)
+            if not self._more():
+                raise ValueError("Missing boundary of multipart body")
+
+    def _read_headers(self):
+        """Read the headers of a part, the position is at the end of the
+        boundary line."""
+        index = self._find(b"\r\n\r\n", MAX_HEADER_SIZE)
+        raw = self._buf[self._pos + 2:index]
+        self._pos = index + 4
+
+        headers = {}
+        for line in raw.decode("utf8", "replace").split("\r\n"):
+            if not line:
+                continue
+            key, sep, value = line.partition(":")
+            if not sep:
+                raise ValueError("Invalid header of multipart body")
+            headers[key.strip().lower()] = value.strip()
+        return headers
+
+    def _read_body(self, write):
+        """Read the body of a part to ``write``, until the next boundary."""
+        delimiter = self._delimiter
+        keep = len(delimiter) - 1
+        while True:
+            index = self._buf.find(delimiter, self._pos)
+            if index >= 0:
+                if write is not None and index > self._pos:
+                    write(self._buf[self._pos:index])
+                self._pos = index + len(delimiter)
+                return
+
+            # Keep the tail which may be the start of the delimiter.
+            stop = len(self._buf) - keep
+            if stop > self._pos:
+                if write is not None:
+                    write(self._buf[self._pos:stop])
+                self._pos = stop
+            if not self._more():
+                raise ValueError("Unexpected end of multipart body")
+
+    def parse(self, open_part):
+        """Parse the body.
+
+        :param open_part:
+            A callable ``open_part(name, filename, content_type)`` which
+            returns a callable to write the data of the part, or ``None`` to
+            discard the part. ``filename`` is ``None`` if the part is not a
+            file. Exceptions raised by it or the writer abort the parsing.
+        :raises: :class:`ValueError` if the body is malformed.
+        """
+        self._skip_preamble()
+        while True:
+            end = self._read(2)
+            if end == b"--":
+                return
+            if end != b"\r\n":
+                raise ValueError("Invalid boundary of multipart body")
+            self._pos -= 2
+
+            headers = self._read_headers()
+            disposition, params = parse_options_header(
+                headers.get("content-disposition", ""))
+            if disposition != "form-data" or "name" not in params:
+                raise ValueError("Invalid Content-Disposition of multipart "
+                                 "body")
+
+            write = open_part(params["name"], params.get("filename"),
+                              headers.get("content-type"))
+            self._read_body(write)
@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""Validate large batches in a pool of processes.
+
+Converting the arguments is pure Python, so a single process validates on
+one core only. :func:`validate_parallel` sends chunks of records to a
+:class:`multiprocessing.pool.Pool`, the workers validate them by
+:meth:`~parameter.model.Model.validate_many` and send back the results::
+
+    from parameter.parallel import validate_parallel
+
+    for index, entity, error in validate_parallel(EventEntity, records):
+        if error is not None:
+            print(index, error.name)
+
+The model class is pickled by reference, so it must be importable by its
+qualified name, i.e. defined at the top level of a module. The records, the
+instances and the errors are pickled, so the records should be plain data
+like the dicts decoded from JSON.
+
+Each chunk costs a round trip of pickling, the larger the chunks are the less
+the cost is, but the longer a worker may stay idle at the end of the batch.
+The default ``chunk_size`` of 1000 keeps the pickling cost low for the
+models with a few arguments.
+"""
+from __future__ import print_function, division, unicode_literals
+
+import multiprocessing
+
+from collections import OrderedDict
+from itertools import count, islice, repeat
+
+import six
+
+from six.moves import cPickle as pickle
+from six.moves import queue
+
+from .adapter import JSONAdapter
+from .model import _compile_build
+
+
+def _compact(model_cls):
+    """Returns ``True`` if the instances of ``model_cls`` can be rebuilt
+    from the converted values, see :func:`parameter.model._compile_build`."""
+    return (not model_cls._meta_options["lazy"] and
+            getattr(model_cls._init, "_meta_compiled", False))
+
+
+def _dumps(obj):
+    return pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+
+
+def _failed(error, size):
+    """Returns the results of a chunk of which all records failed."""
+    return list(repeat((None, error), size))
+
+
+def _validate_chunk(model_cls, start, data):
+    """Validate a pickled chunk in a worker, returns ``(start, data)``,
+    ``data`` is the pickled list of ``(instance, error)``.
+
+    The chunk and the results are pickled here rather than by the pool, so
+    a failure of pickling is sent back as the errors of the records, instead
+    of losing the chunk in the pool, which hangs on Python 2.
+
+    The valid instances created from dicts are sent back as the tuples of
+    the converted values, which are much cheaper to pickle than the
+    instances, the instances are rebuilt with the dicts we already have.
+    """
+    records = pickle.loads(data)
+    try:
+        attrs = [attr for attr, _ in model_cls._meta_arguments]
+        compact = _compact(model_cls)
+        results = []
+        for record, (_, instance, error) in zip(records, (
+                model_cls.validate_many(records, chunk_size=len(records)))):
+            if compact and instance is not None and type(record) is dict:
+                instance = tuple([getattr(instance, attr) for attr in attrs])
+            results.append((instance, error))
+    except Exception as e:      # pylint: disable=broad-except
+        results = _failed(e, len(records))
+
+    try:
+        return start, _dumps(results)
+    except Exception as e:      # pylint: disable=broad-except
+        # The exception may refer to the object that can't be pickled.
+        return start, _dumps(_failed(
+            TypeError("Can't send the results back: %s" % e), len(records)))
+
+
+def _iter_chunks(records, chunk_size):
+    """Iterate ``(start, chunk)`` of ``records``."""
+    records = iter(records)
+    start = 0
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+
+def _iter_results(model_cls, start, chunk, results):
+    """Iterate ``(index, instance, error)`` of the results of a chunk."""
+    build = _compile_build(model_cls)
+    for index, record, (instance, error) in zip(count(start), chunk,
+                                                results):
+        if type(instance) is tuple:
+            instance = build(JSONAdapter(record), instance)
+        yield index, instance, error
+
+
+def validate_parallel(model_cls, records, processes=None, chunk_size=1000,
+                      ordered=True, pool=None, max_pending=None,
+                      timeout=None):
+    """Validate ``records`` by ``model_cls`` in a pool of processes.
+
+    :param model_cls: Subclass of :class:`~parameter.model.Model`.
+    :param records:
+        An iterable of records, see
+        :meth:`~parameter.model.Model.validate_many`. It's read lazily,
+        so a large stream never stays in memory as a whole.
+    :param processes:
+        Number of worker processes, defaults to the number of CPUs.
+    :param chunk_size: Number of records sent to a worker at once.
+    :param ordered:
+        If ``True`` the results are yielded in order of ``records``,
+        otherwise the results of a chunk are yielded as soon as it's
+        completed.
+    :param pool:
+        A :class:`multiprocessing.pool.Pool` to use, a pool is created and
+        terminated after the batch if it's ``None``.
+    :param max_pending:
+        Maximum number of chunks sent to the workers but not yielded yet,
+        defaults to twice the ``processes``.
+    :param timeout:
+        Seconds to wait for the results of a chunk, ``None`` means forever.
+    :returns:
+        A generator yields ``(index, instance, error)``, see
+        :meth:`~parameter.model.Model.validate_many`. The records which
+        can't be sent to the workers, or whose results can't be sent back,
+        fail with the exception of pickling.
+    :raises: :class:`multiprocessing.TimeoutError` if it waits longer than
+        ``timeout``.
+    """
+    processes = processes or multiprocessing.cpu_count()
+    max_pending = max_pending or processes * 2
+    own_pool = pool is None
+    if own_pool:
+        pool = multiprocessing.Pool(processes)
+
+    chunks = _iter_chunks(records, chunk_size)
+    # The callbacks run in a thread of the pool.
+    completed = queue.Queue()
+    callbacks = {}
+    if not ordered:
+        callbacks["callback"] = completed.put
+        if not six.PY2:
+            # The worker failed unexpectedly, e.g. it's killed.
+            callbacks["error_callback"] = completed.put
+    # Chunks that are sent, maps the start to the chunk and the async result,
+    # which is ``None`` if the chunk can't be pickled.
+    pending = OrderedDict()
+    # Results of the chunks that can't be pickled.
+    failed = {}
+
+    def submit(item):
+        start, chunk = item
+        try:
+            data = _dumps(chunk)
+        except Exception as e:      # pylint: disable=broad-except
+            failed[start] = _failed(e, len(chunk))
+            pending[start] = chunk, None
+            if not ordered:
+                completed.put((start, None))
+            return
+        pending[start] = chunk, pool.apply_async(
+            _validate_chunk, (model_cls, start, data), **callbacks)
+
+    def wait():
+        if ordered:
+            start, (_, result) = next(iter(pending.items()))
+            if result is None:
+                return start, None
+            return result.get(timeout)
+
+        try:
+            ret = completed.get(timeout=timeout)
+        except queue.Empty:
+            raise multiprocessing.TimeoutError()
+        if isinstance(ret, BaseException):
+            raise ret
+        return ret
+
+    try:
+        for item in islice(chunks, max_pending):
+            submit(item)
+
+        while pending:
+            start, data = wait()
+            chunk, _ = pending.pop(start)
+            if data is None:
+                results = failed.pop(start)
+            else:
+                results = pickle.loads(data)
+
+            for item in islice(chunks, 1):
+                submit(item)
+
+            for item in _iter_results(model_cls, start, chunk, results):
+                yield item
+    finally:
+        if own_pool:
+            pool.terminate()
+            pool.join()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""Bulk ingestion of newline-delimited JSON (NDJSON).
+
+Usage::
+
+    import mmap
+
+    from parameter.pipeline import validate_ndjson
+
+    with open("events.ndjson", "rb") as f:
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        for lineno, event, error in validate_ndjson(EventEntity, buf):
+            if error is None:
+                handle(event)
+            else:
+                print("line %d: %r" % (lineno, error))
+
+The lines of a buffer are sliced as :class:`memoryview` without copying and
+passed to the decoder directly, the decoded records are validated in chunks
+by :meth:`~parameter.model.Model.validate_many`. Nothing is read ahead more
+than a chunk, so the consumer controls the pace.
+"""
+from __future__ import print_function, division, unicode_literals
+
+from itertools import islice
+from operator import itemgetter
+
+import six
+
+from .decoder import get_decoder
+from .scanner import DEFAULT_CHUNK_SIZE
+
+if six.PY2:     # pragma: no cover
+    # Python 2 can't make a memoryview of mmap, and the views are rejected
+    # by most functions, so the lines are sliced as copies.
+    def _view(buf):
+        return buf
+else:
+    _view = memoryview
+
+
+def _iter_buffer_lines(buf):
+    """Iterate the lines of a buffer which has a ``find`` method, e.g.
+    bytes, bytearray and mmap."""
+    view = _view(buf)
+    start = 0
+    end = len(buf)
+    while start < end:
+        stop = buf.find(b"\n", start)
+        if stop < 0:
+            stop = end
+        yield view[start:stop]
+        start = stop + 1
+
+
+def _iter_stream_lines(stream, chunk_size):
+    """Iterate the lines of a file-like object, only the lines across chunks
+    are copied."""
+    rest = b""
+    for chunk in iter(lambda: stream.read(chunk_size), b""):
+        if rest:
+            stop = chunk.find(b"\n")
+            if stop < 0:
+                rest += chunk
+                continue
+            yield _view(rest + chunk[:stop])
+            chunk = chunk[stop + 1:]
+
+        stop = chunk.rfind(b"\n")
+        if stop < 0:
+            rest = chunk
+            continue
+        # Keep the newline so an empty line at the start is not lost.
+        for line in _iter_buffer_lines(chunk[:stop + 1]):
+            yield line
+        rest = chunk[stop + 1:]
+
+    if rest:
+        yield _view(rest)
+
+
+def iter_lines(source, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Iterate the lines of ``source`` as :class:`memoryview`, or as copies
+    on Python 2.
+
+    :param source:
+        A file-like object opened in binary mode, or a buffer which has a
+        ``find`` method, e.g. bytes, bytearray and mmap.
+    :param chunk_size: Size to read from a file-like object at once.
+    """
+    if hasattr(source, "find"):
+        return _iter_buffer_lines(source)
+    return _iter_stream_lines(source, chunk_size)
+
+
+def _drop_tracebacks(error):
+    """Drop the tracebacks of ``error`` and the exceptions it refers to. The
+    frames of a traceback refer to their callers, which refer to the views
+    of the buffer, so the buffer couldn't be closed."""
+    stack = [error]
+    seen = set()
+    while stack:
+        error = stack.pop()
+        if error is None or id(error) in seen:
+            continue
+        seen.add(id(error))
+        error.__traceback__ = None
+        stack.extend((getattr(error, "__cause__", None),
+                      getattr(error, "__context__", None),
+                      getattr(error, "source", None)))
+
+
+def validate_ndjson(model_cls, source, decoder=None, chunk_size=1000,
+                    read_size=DEFAULT_CHUNK_SIZE):
+    """Validate each line of NDJSON by ``model_cls``.
+
+    Blank lines are skipped. A line which is not a valid JSON or not an
+    object is reported as an error, as what
+    :class:`~parameter.adapter.JSONAdapter` raises.
+
+    :param model_cls: Subclass of :class:`~parameter.model.Model`.
+    :param source: See :func:`iter_lines`.
+    :param decoder:
+        Name of the decoder or a decoder, see :mod:`parameter.decoder`.
+    :param chunk_size: Number of lines to validate at once.
+    :param read_size: Size to read from a file-like object at once.
+    :returns:
+        A generator yields ``(lineno, instance, error)``, ``lineno`` starts
+        from 1, see :meth:`~parameter.model.Model.validate_many`.
+    """
+    loads = decoder if callable(decoder) else get_decoder(decoder)
+    lines = enumerate(iter_lines(source, read_size), 1)
+
+    while True:
+        chunk = list(islice(lines, chunk_size))
+        if not chunk:
+            return
+
+        linenos = []
+        records = []
+        output = []
+        for lineno, line in chunk:
+            if line[-1:] == b"\r":
+                line = line[:-1]
+            if not line:
+                continue
+
+            try:
+                records.append(loads(line))
+            except ValueError as e:
+                if bytes(line).strip():
+                    output.append((lineno, None, e))
+                continue
+            linenos.append(lineno)
+
+        results = model_cls.validate_many(records,
+                                          chunk_size=max(1, len(records)))
+        output.extend((lineno, instance, error) for lineno, (
+            _, instance, error) in zip(linenos, results))
+        output.sort(key=itemgetter(0))
+
+        for _, _, error in output:
+            if error is not None:
+                _drop_tracebacks(error)
+        for item in output:
+            yield item
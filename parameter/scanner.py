@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""Incremental scanner of JSON documents.
+
+The scanner reads a JSON object from a stream chunk by chunk, only the values
+of the wanted keys are materialized, the others are skipped by matching the
+brackets and strings without building any object.
+"""
+from __future__ import print_function, division, unicode_literals
+
+import re
+
+import six
+
+from .decoder import get_decoder
+
+
+_WHITESPACE = re.compile(b"[ \t\n\r]*")
+# Content of a string, stops before the closing quote.
+_STRING_BODY = re.compile(b'[^"\\\\]*(?:\\\\.[^"\\\\]*)*')
+# Content of a container until the next bracket, strings are included.
+_CONTAINER_RUN = re.compile(
+    b'(?:[^"\\[\\]{}]+|"[^"\\\\]*(?:\\\\.[^"\\\\]*)*")*')
+# Characters of a number or a literal.
+_SCALAR = re.compile(b"[^,}\\] \t\n\r]*")
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def _iter_chunks(stream, chunk_size):
+    """Iterate the chunks of bytes from ``stream``."""
+    if isinstance(stream, (six.binary_type, six.text_type)):
+        stream = [stream]
+
+    read = getattr(stream, "read", None)
+    if read is not None:
+        stream = iter(lambda: read(chunk_size), b"")
+
+    for chunk in stream:
+        if isinstance(chunk, six.text_type):
+            if not chunk:
+                # The sentinel of text file.
+                return
+            chunk = chunk.encode("utf8")
+        yield bytes(chunk)
+
+
+class JSONObjectScanner(object):
+    """Scan a JSON object from a stream.
+
+    Usage::
+
+        with open("upload.json", "rb") as f:
+            data = JSONObjectScanner(f).scan({"name", "age"})
+
+    :param stream:
+        A file-like object which has a ``read`` method, or an iterable of
+        bytes chunks, or a single bytes.
+    :param chunk_size: Size to read from a file-like object at once.
+    :param decoder:
+        Name of the decoder or a decoder to decode the values, see
+        :mod:`parameter.decoder`.
+    """
+
+    def __init__(self, stream, chunk_size=DEFAULT_CHUNK_SIZE, decoder=None):
+        self._chunks = _iter_chunks(stream, chunk_size)
+        self._decoder = decoder if callable(decoder) else get_decoder(decoder)
+        self._buf = b""
+        self._pos = 0
+        self._eof = False
+        # Parts of the value which is capturing.
+        self._parts = None
+        self._capture_start = 0
+
+    def _more(self):
+        """Read the next chunk and discard the consumed bytes, returns
+        ``False`` on the end of the stream."""
+        if self._eof:
+            return False
+
+        for chunk in self._chunks:
+            if chunk:
+                break
+        else:
+            self._eof = True
+            return False
+
+        if self._parts is not None:
+            self._parts.append(self._buf[self._capture_start:self._pos])
+            self._capture_start = 0
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _error(self, message):
+        return ValueError("%s: at offset %d of buffer" % (message, self._pos))
+
+    def _peek(self):
+        """Skip whitespaces and returns the next byte, returns ``b""`` on the
+        end of the stream."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos:self._pos + 1]
+            if not self._more():
+                return b""
+
+    def _expect(self, expected):
+        char = self._peek()
+        if char not in expected:
+            raise self._error("Expecting %s" % " or ".join(
+                repr(c.decode("ascii")) for c in expected))
+        self._pos += 1
+        return char
+
+    def _skip_string(self):
+        """Skip a string, the current position is the opening quote."""
+        self._pos += 1
+        while True:
+            self._pos = _STRING_BODY.match(self._buf, self._pos).end()
+            if self._buf[self._pos:self._pos + 1] == b'"':
+                self._pos += 1
+                return
+
+            # The string or an escape sequence is not completed.
+            if not self._more():
+                raise self._error("Unterminated string")
+
+    def _skip_container(self):
+        """Skip an array or object, the current position is the opening
+        bracket."""
+        depth = 0
+        while True:
+            self._pos = _CONTAINER_RUN.match(self._buf, self._pos).end()
+            char = self._buf[self._pos:self._pos + 1]
+            if not char:
+                if not self._more():
+                    raise self._error("Unterminated array or object")
+            elif char == b'"':
+                # A string which is not completed in the buffer.
+                self._skip_string()
+            else:
+                self._pos += 1
+                if char in b"[{":
+                    depth += 1
+                else:
+                    depth -= 1
+                    if depth == 0:
+                        return
+
+    def _skip_scalar(self):
+        """Skip a number or a literal."""
+        while True:
+            self._pos = _SCALAR.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf) or not self._more():
+                return
+
+    def _skip_value(self):
+        char = self._peek()
+        if char == b'"':
+            self._skip_string()
+        elif char in (b"[", b"{"):
+            self._skip_container()
+        elif char:
+            self._skip_scalar()
+        else:
+            raise self._error("Expecting value")
+
+    def _read_value(self):
+        """Read a value and decode it."""
+        self._peek()
+        self._parts = []
+        self._capture_start = self._pos
+        try:
+            self._skip_value()
+            self._parts.append(self._buf[self._capture_start:self._pos])
+            raw = b"".join(self._parts)
+        finally:
+            self._parts = None
+        return self._decoder(raw)
+
+    def scan(self, wanted=None):
+        """Scan the object, and returns a dict of the values of ``wanted``
+        keys.
+
+        :param wanted: A container of keys, ``None`` means all keys.
+        :raises: :class:`TypeError` if the document is not a JSON object.
+        :raises: :class:`ValueError` if the document is not a valid JSON.
+        """
+        if self._peek() != b"{":
+            raise TypeError("``data`` must be a json object")
+        self._pos += 1
+
+        data = {}
+        if self._peek() == b"}":
+            self._pos += 1
+            return data
+
+        while True:
+            if self._peek() != b'"':
+                raise self._error("Expecting property name")
+            key = self._read_value()
+            self._expect((b":",))
+
+            if wanted is None or key in wanted:
+                data[key] = self._read_value()
+            else:
+                self._skip_value()
+
+            if self._expect((b",", b"}")) == b"}":
+                return data
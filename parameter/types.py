@@ -59,20 +59,135 @@ The you can define a different separator.
 from __future__ import print_function, division, unicode_literals
 
 import abc
+import array
+import collections
 import decimal
 import inspect
+import re
 
-from datetime import datetime
+from datetime import date, datetime, time, timedelta
 
 import six
 
-from .exception import MismatchError, MaxlenExceedError
+try:
+    import enum
+except ImportError:     # pragma: no cover
+    enum = None
+
+try:
+    import numpy
+except ImportError:     # pragma: no cover
+    numpy = None
+
+from .exception import ConvertError, MismatchError, MaxlenExceedError
+from .exception import MaxsizeExceedError, MinlenError, PatternMismatchError
+from .exception import OutOfRangeError, ChoiceError, MaxitemsExceedError
+from .multipart import UploadedFile
 
 
 _all_string_types = six.string_types + (six.binary_type, six.text_type)
+_integer_types = frozenset(six.integer_types + (bool,))
+
+
+class Invalid(object):
+    """Returned by ``try_convert`` instead of raising an exception when the
+    value can't be converted."""
+    __slots__ = ("error_cls", "args", "_error")
+
+    def __init__(self, error_cls, *args):
+        """Initialize
+
+        :param error_cls:
+            Subclass of :class:`~parameter.exception.ConvertError` which
+            represents the failure.
+        :param args: Arguments to create the exception.
+        """
+        self.error_cls = error_cls
+        self.args = args
+        self._error = None
+
+    @classmethod
+    def from_error(cls, error):
+        """Create from an exception that has been raised."""
+        invalid = cls(type(error), *error.args)
+        invalid._error = error
+        return invalid
+
+    @property
+    def code(self):
+        """Error code of the failure."""
+        return self.error_cls.code
+
+    def error(self):
+        """Returns the exception that represents the failure."""
+        if self._error is None:
+            self._error = self.error_cls(*self.args)
+        return self._error
+
+    def __repr__(self):
+        return "<Invalid %s%r>" % (self.error_cls.__name__, self.args)
+
+
+def _try_convert(self, val):
+    """Convert a value to this type, returns an instance of
+    :class:`Invalid` if failed instead of raising exception."""
+    try:
+        return self.convert(val)
+    except ConvertError as e:
+        return Invalid.from_error(e)
+
+
+def _derive_try_convert(convert):
+    """Derive ``try_convert`` from the ``convert`` of a class."""
+    def try_convert(self, val):
+        try:
+            return convert(self, val)
+        except ConvertError as e:
+            return Invalid.from_error(e)
+
+    try_convert.__doc__ = _try_convert.__doc__
+    return try_convert
+
+
+def _derive_convert(try_convert):
+    """Derive ``convert`` from the ``try_convert`` of a class."""
+    def convert(self, val):
+        """Convert a value to this type.
+
+        :raises: :class:`parameter.exception.ConvertError`
+        """
+        ret = try_convert(self, val)
+        if type(ret) is Invalid:
+            raise ret.error()
+        return ret
+
+    return convert
+
 
+class TypeMeta(abc.ABCMeta):
+    """Metaclass of the types.
 
-@six.add_metaclass(abc.ABCMeta)
+    A type may implement either ``convert`` or ``try_convert``, the other
+    one is derived from it. A subclass which only overrides ``convert`` also
+    gets a ``try_convert`` uses it.
+    """
+    def __new__(mcs, name, bases, namespace):
+        if "convert" in namespace and "try_convert" not in namespace:
+            namespace["try_convert"] = _derive_try_convert(
+                namespace["convert"])
+        elif "try_convert" in namespace and "convert" not in namespace:
+            namespace["convert"] = _derive_convert(namespace["try_convert"])
+        return super(TypeMeta, mcs).__new__(mcs, name, bases, namespace)
+
+
+def _uses_try_convert_of(type_, cls):
+    """Returns ``True`` if ``type_`` converts values with ``cls``, so the fast
+    path of ``cls`` is valid for it."""
+    return (six.get_method_function(type_.try_convert) is
+            six.get_unbound_function(cls.try_convert))
+
+
+@six.add_metaclass(TypeMeta)
 class BaseType(object):
     """Base class of the types."""
     @abc.abstractmethod
@@ -83,101 +198,941 @@ class BaseType(object):
         """
         pass    # pragma: no cover
 
+    try_convert = _try_convert
+
+    #: Relative cost of converting a value, the models which declare
+    #: ``order = "cost"`` convert the cheap arguments first. The cost of
+    #: :class:`Nested` is estimated by the arguments of the model.
+    cost = 1
+
+    def cached(self, maxsize=1024):
+        """Returns this type with an LRU cache, see :class:`Cached`."""
+        return Cached(self, maxsize)
+
+    def convert_many(self, values):
+        """Convert a sequence of values to this type, returns a list.
+
+        The subclasses may override this method to convert the values in a
+        faster way than converting one by one.
+
+        :raises: :class:`parameter.exception.ConvertError`
+        """
+        try_convert = self.try_convert
+        ret = []
+        append = ret.append
+        for val in values:
+            val = try_convert(val)
+            if type(val) is Invalid:
+                raise val.error()
+            append(val)
+        return ret
+
+
+def _compile_pattern(pattern, encoding=None):
+    """Compile a pattern which must match the whole value. The text pattern
+    is encoded if ``encoding`` is given."""
+    flags = 0
+    if hasattr(pattern, "pattern"):
+        flags = pattern.flags
+        pattern = pattern.pattern
+
+    if encoding is not None and isinstance(pattern, six.text_type):
+        pattern = pattern.encode(encoding)
+        # The text patterns are compiled with it implicitly.
+        flags &= ~re.UNICODE
+    elif encoding is None and isinstance(pattern, six.binary_type):
+        pattern = pattern.decode("utf8")
+
+    if isinstance(pattern, six.binary_type):
+        return re.compile(b"(?:" + pattern + br")\Z", flags).match
+    return re.compile("(?:" + pattern + r")\Z", flags).match
+
 
 class String(BaseType):
     """String type. This is str in Python2 and bytes in Python3."""
-    def __init__(self, max_len=None, encoding="utf8"):
+    def __init__(self, max_len=None, encoding="utf8", min_len=None,
+                 pattern=None):
         """Initialize
 
         :param max_len:
             Maximum length of the string.
         :param encoding:
             Encoding of the string.
+        :param min_len:
+            Minimum length of the string.
+        :param pattern:
+            A regex string or a compiled regex that the whole string must
+            match, it's compiled once here.
         """
 
         self.max_len = max_len
         self.encoding = encoding
+        self.min_len = min_len
+        self.pattern = pattern
+        self._match = None
+        if pattern is not None:
+            self._match = self._compile_pattern(pattern)
+        self._constrained = (max_len is not None or min_len is not None or
+                             pattern is not None)
+
+    def _compile_pattern(self, pattern):
+        return _compile_pattern(pattern, self.encoding)
 
     def _check_max_len(self, val):
         if self.max_len is not None and len(val) > self.max_len:
             raise MaxlenExceedError(self.max_len)
 
-    def convert(self, val):
-        if isinstance(val, six.text_type):
-            val = val.encode(self.encoding)
-        else:
-            val = six.binary_type(val)
-        self._check_max_len(val)
+    def _check(self, val):
+        """Check the constraints, returns the value or an :class:`Invalid`."""
+        if self.max_len is not None and len(val) > self.max_len:
+            return Invalid(MaxlenExceedError, self.max_len)
+        if self.min_len is not None and len(val) < self.min_len:
+            return Invalid(MinlenError, self.min_len)
+        if self._match is not None and self._match(val) is None:
+            return Invalid(PatternMismatchError, val)
+        return val
+
+    def try_convert(self, val):
+        try:
+            if isinstance(val, six.text_type):
+                val = val.encode(self.encoding)
+            else:
+                val = six.binary_type(val)
+        except (TypeError, ValueError) as e:
+            # E.g. ``None`` of JSON.
+            return Invalid(MismatchError, e.args[0])
+
+        if self._constrained:
+            return self._check(val)
         return val
 
+    def _check_many(self, values):
+        if not self._constrained or not values:
+            return
+
+        self._check_max_len_many(values)
+        if self.min_len is not None and min(map(len, values)) < self.min_len:
+            raise MinlenError(self.min_len)
+
+        match = self._match
+        if match is not None:
+            for val in values:
+                if match(val) is None:
+                    raise PatternMismatchError(val)
+
+    def _check_max_len_many(self, values):
+        if (self.max_len is not None and values and
+                max(map(len, values)) > self.max_len):
+            raise MaxlenExceedError(self.max_len)
+
+    def convert_many(self, values):
+        if (_uses_try_convert_of(self, String) and
+                set(map(type, values)) <= {six.binary_type}):
+            self._check_many(values)
+            return list(values)
+        return super(String, self).convert_many(values)
+
 
 class Unicode(String):
     """Unicode type. This is unicode in Python2 and str in Python3."""
-    def convert(self, val):
-        if isinstance(val, six.binary_type):
-            val = val.decode("utf8")
-        else:
-            val = six.text_type(val)
-        self._check_max_len(val)
+    def _compile_pattern(self, pattern):
+        return _compile_pattern(pattern)
+
+    def try_convert(self, val):
+        try:
+            if isinstance(val, six.binary_type):
+                val = val.decode("utf8")
+            else:
+                val = six.text_type(val)
+        except ValueError as e:
+            # Invalid UTF-8.
+            return Invalid(MismatchError, e.args[0])
+
+        if self._constrained:
+            return self._check(val)
         return val
 
+    def convert_many(self, values):
+        if (_uses_try_convert_of(self, Unicode) and
+                set(map(type, values)) <= {six.text_type}):
+            self._check_many(values)
+            return list(values)
+        return BaseType.convert_many(self, values)
+
+
+def _range_checker(min_value, max_value):
+    """Returns a function which returns ``True`` if a value is in the range,
+    or ``None`` if there is no limit."""
+    if min_value is None and max_value is None:
+        return None
+
+    # ``not`` rejects NaN, which is neither less nor greater than the limits.
+    if max_value is None:
+        def check(val):
+            return not val < min_value and val == val
+    elif min_value is None:
+        def check(val):
+            return not val > max_value and val == val
+    else:
+        def check(val):
+            return min_value <= val <= max_value
+
+    def in_range(val):
+        try:
+            return check(val)
+        except decimal.InvalidOperation:
+            return False
 
-class Integer(BaseType):
-    """Integer type."""
-    def convert(self, val):
-        if isinstance(val, six.integer_types):
-            return val
+    return in_range
 
-        if isinstance(val, _all_string_types) and val.isdigit():
-            return int(val)
-        raise MismatchError(val)
 
+class _Ranged(BaseType):
+    """Numeric type which has an optional range."""
 
-class Double(BaseType):
-    def convert(self, val):
-        if isinstance(val, float):
-            return val
+    min_value = None
+    max_value = None
+    _in_range = None
+
+    def _set_range(self, min_value, max_value):
+        self.min_value = min_value
+        self.max_value = max_value
+        self._in_range = _range_checker(min_value, max_value)
+
+    def _check_range_many(self, values):
+        in_range = self._in_range
+        if in_range is None:
+            return
+        for val in values:
+            if not in_range(val):
+                raise OutOfRangeError(val, self.min_value, self.max_value)
+
+
+def _int64_typecode():
+    """Returns the typecode of 64-bit integers, Python 2 doesn't have "q",
+    "l" is 64-bit on the most 64-bit platforms except Windows."""
+    try:
+        array.array(str("q"))
+    except ValueError:
+        return str("l")
+    return str("q")
 
+
+class _Packable(_Ranged):
+    """Numeric type which can pack multiple values into an array."""
+
+    #: Typecode of :class:`array.array`.
+    typecode = None
+    #: Dtype of :class:`numpy.ndarray`.
+    dtype = None
+
+    packed = False
+
+    def __init__(self, packed=False, min_value=None, max_value=None):
+        """Initialize
+
+        :param packed:
+            If ``True``, :meth:`convert_many` returns a
+            :class:`numpy.ndarray` when NumPy is installed, otherwise an
+            :class:`array.array`, instead of a list.
+        :param min_value: Minimum value, inclusive.
+        :param max_value: Maximum value, inclusive.
+        """
+        self.packed = packed
+        self._set_range(min_value, max_value)
+
+    def _pack(self, values):
         try:
-            return float(val)
-        except ValueError as e:
+            if numpy is not None:
+                return numpy.array(values, dtype=self.dtype)
+            return array.array(self.typecode, values)
+        except OverflowError as e:
             raise MismatchError(e.args[0])
 
 
-class Decimal(BaseType):
-    def __init__(self, context=None):
+class Integer(_Packable):
+    """Integer type."""
+    typecode = _int64_typecode()
+    dtype = "int64"
+
+    def try_convert(self, val):
+        if not isinstance(val, six.integer_types):
+            if not (isinstance(val, _all_string_types) and val.isdigit()):
+                return Invalid(MismatchError, val)
+            val = int(val)
+
+        if self._in_range is not None and not self._in_range(val):
+            return Invalid(OutOfRangeError, val, self.min_value,
+                           self.max_value)
+        return val
+
+    def convert_many(self, values):
+        if (_uses_try_convert_of(self, Integer) and
+                set(map(type, values)) <= _integer_types):
+            # Integers are totally ordered, the extremes are enough.
+            if values:
+                self._check_range_many((min(values), max(values)))
+            values = list(values)
+        else:
+            values = super(Integer, self).convert_many(values)
+        return self._pack(values) if self.packed else values
+
+
+class Double(_Packable):
+    typecode = str("d")
+    dtype = "float64"
+
+    def try_convert(self, val):
+        if not isinstance(val, float):
+            try:
+                val = float(val)
+            except (TypeError, ValueError) as e:
+                # E.g. ``None`` of JSON.
+                return Invalid(MismatchError, e.args[0])
+
+        if self._in_range is not None and not self._in_range(val):
+            return Invalid(OutOfRangeError, val, self.min_value,
+                           self.max_value)
+        return val
+
+    def convert_many(self, values):
+        if (_uses_try_convert_of(self, Double) and
+                set(map(type, values)) <= {float}):
+            self._check_range_many(values)
+            values = list(values)
+        else:
+            values = super(Double, self).convert_many(values)
+        return self._pack(values) if self.packed else values
+
+
+class Decimal(_Ranged):
+    cost = 2
+
+    def __init__(self, context=None, min_value=None, max_value=None):
+        """Initialize
+
+        :param context: A :class:`decimal.Context` to create the values.
+        :param min_value: Minimum value, inclusive.
+        :param max_value: Maximum value, inclusive.
+        """
         self.context = context
+        self._set_range(min_value, max_value)
 
-    def convert(self, val):
-        if isinstance(val, six.binary_type):
-            val = val.decode("utf8")
+    def try_convert(self, val):
+        try:
+            if isinstance(val, six.binary_type):
+                val = val.decode("utf8")
+            val = decimal.Decimal(val, context=self.context)
+        except (TypeError, ValueError, decimal.InvalidOperation) as e:
+            # ``ValueError`` is raised for a list, e.g. ``[1]`` of JSON.
+            return Invalid(MismatchError, e.args[0])
+
+        if self._in_range is not None and not self._in_range(val):
+            return Invalid(OutOfRangeError, val, self.min_value,
+                           self.max_value)
+        return val
+
+    def convert_many(self, values):
+        if not _uses_try_convert_of(self, Decimal):
+            return super(Decimal, self).convert_many(values)
 
+        new, context = decimal.Decimal, self.context
+        ret = []
+        append = ret.append
         try:
-            return decimal.Decimal(val, context=self.context)
-        except decimal.InvalidOperation as e:
+            for val in values:
+                if isinstance(val, six.binary_type):
+                    val = val.decode("utf8")
+                append(new(val, context=context))
+        except (TypeError, ValueError, decimal.InvalidOperation) as e:
             raise MismatchError(e.args[0])
+        self._check_range_many(ret)
+        return ret
+
+
+#: Format of :class:`Datetime` and :class:`Date` to parse ISO 8601, e.g.
+#: ``2017-01-01``, ``2017-01-01T08:00:00.123+08:00`` and
+#: ``2017-01-01 08:00Z``.
+ISO8601 = "iso8601"
+
+_ISO8601 = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})"
+    r"(?:[T ](\d{2})(?::(\d{2})(?::(\d{2})(?:[.,](\d{1,6})\d*)?)?)?)?"
+    r"(Z|[+-]\d{2}(?::?\d{2})?)?\Z")
+
+# Directives of strptime that the fast path handles, to the pattern and the
+# field of datetime.
+_DIRECTIVES = {
+    "Y": (r"(\d{4})", "year"),
+    "m": (r"(\d{2})", "month"),
+    "d": (r"(\d{2})", "day"),
+    "H": (r"(\d{2})", "hour"),
+    "M": (r"(\d{2})", "minute"),
+    "S": (r"(\d{2})", "second"),
+    "f": (r"(\d{1,6})", "microsecond"),
+    "z": (r"(Z|[+-]\d{2}:?\d{2})", "tzinfo"),
+}
+_FIELDS = ("year", "month", "day", "hour", "minute", "second")
+
+try:
+    from datetime import timezone
+    _UTC = timezone.utc
+except ImportError:     # pragma: no cover
+    from datetime import tzinfo
+
+    class timezone(tzinfo):
+        """Fixed offset timezone of Python 2."""
+
+        def __init__(self, offset):
+            self._offset = offset
+
+        def utcoffset(self, dt):
+            return self._offset
+
+        def dst(self, dt):
+            return timedelta(0)
+
+        def tzname(self, dt):
+            return None
+
+    _UTC = timezone(timedelta(0))
+
+    # %z is not supported by strptime of Python 2.
+    del _DIRECTIVES["z"]
+
+_timezones = {"Z": _UTC}
+
+
+def _timezone(offset):
+    """Returns the timezone of an offset like ``Z``, ``+08``, ``+0800`` and
+    ``+08:00``."""
+    try:
+        return _timezones[offset]
+    except KeyError:
+        pass
+
+    digits = offset[1:].replace(":", "")
+    minutes = int(digits[:2]) * 60 + int(digits[2:] or 0)
+    ret = _timezones[offset] = timezone(timedelta(
+        minutes=minutes if offset[0] == "+" else -minutes))
+    return ret
+
+
+_fromisoformat = getattr(datetime, "fromisoformat", None)
+
+
+def _parse_iso8601(val):
+    """Parse ISO 8601, returns ``None`` if failed. Only the values
+    :data:`_ISO8601` matches are accepted whatever the Python version is,
+    the C implementation of :meth:`datetime.fromisoformat` builds them if
+    it's available and accepts the value."""
+    match = _ISO8601.match(val)
+    if match is None:
+        return None
+
+    # The newer fromisoformat takes the hour 24 as the next day.
+    if _fromisoformat is not None and match.group(4) != "24":
+        try:
+            return _fromisoformat(val)
+        except ValueError:
+            pass
+
+    (year, month, day, hour, minute, second, microsecond,
+     offset) = match.groups()
+    try:
+        return datetime(int(year), int(month), int(day), int(hour or 0),
+                        int(minute or 0), int(second or 0),
+                        int(microsecond.ljust(6, "0")) if microsecond else 0,
+                        _timezone(offset) if offset else None)
+    except ValueError:
+        return None
+
+
+class _Parser(object):
+    """Parse the values of a format by a precompiled regex, it's built once
+    per format when the type is created."""
+
+    def __init__(self, regex, fields, cls=datetime):
+        self.match = regex.match
+        self.fields = fields
+        self.cls = cls
+        # The fields are the leading positional arguments of ``cls``.
+        self.positional = fields == _FIELDS[:len(fields)] and len(fields) >= 3
+
+    @classmethod
+    def from_format(cls, format_, date_only=False):
+        """Returns a parser of a format of strptime or :data:`ISO8601`,
+        returns ``None`` if the format has any directive that the fast path
+        doesn't handle."""
+        if format_ == ISO8601:
+            return _parse_iso8601
+
+        pattern = []
+        fields = []
+        pos = 0
+        for match in re.finditer(r"%(.)", format_):
+            try:
+                regex, field = _DIRECTIVES[match.group(1)]
+            except KeyError:
+                return None
+            if field in fields:
+                return None
+            pattern.append(re.escape(format_[pos:match.start()]))
+            pattern.append(regex)
+            fields.append(field)
+            pos = match.end()
+        pattern.append(re.escape(format_[pos:]))
+
+        fields = tuple(fields)
+        if date_only and set(fields) <= set(_FIELDS[:3]):
+            klass = date
+        else:
+            klass = datetime
+        return cls(re.compile("".join(pattern) + r"\Z"), fields, klass)
+
+    def __call__(self, val):
+        """Returns ``None`` if the value doesn't match or is out of range."""
+        match = self.match(val)
+        if match is None:
+            return None
+
+        try:
+            if self.positional:
+                return self.cls(*map(int, match.groups()))
+
+            kwargs = {"year": 1900, "month": 1, "day": 1}
+            for field, value in zip(self.fields, match.groups()):
+                if value is None:
+                    continue
+                if field == "microsecond":
+                    kwargs[field] = int(value.ljust(6, "0"))
+                elif field == "tzinfo":
+                    kwargs[field] = _timezone(value)
+                else:
+                    kwargs[field] = int(value)
+            return self.cls(**kwargs)
+        except ValueError:
+            return None
 
 
 class Datetime(BaseType):
-    def __init__(self, format="%Y-%m-%d %H:%M:%S"):
+    """Datetime type.
+
+    The common formats, which only have the numeric directives ``%Y``,
+    ``%m``, ``%d``, ``%H``, ``%M``, ``%S``, ``%f`` and ``%z``, are parsed by a
+    regex compiled once instead of :meth:`datetime.strptime`, the values
+    that the fast path can't handle still go to ``strptime``.
+    """
+    cost = 4
+
+    def __init__(self, format="%Y-%m-%d %H:%M:%S", tz=None):
+        """Initialize
+
+        :param format:
+            Format of :meth:`datetime.strptime`, or :data:`ISO8601`.
+        :param tz:
+            A :class:`datetime.tzinfo`. If it's given, the naive datetimes
+            are assumed in this timezone, and the aware datetimes are
+            converted to this timezone.
+        """
         self.format = format
+        self.tz = tz
+        self._parser = _Parser.from_format(format, isinstance(self, Date))
 
-    def convert(self, val):
+    def _localize(self, val):
+        if self.tz is None or type(val) is date:
+            return val
+        if val.tzinfo is None:
+            return val.replace(tzinfo=self.tz)
+        return val.astimezone(self.tz)
+
+    def _parse(self, val):
+        """Parse a value, raises :class:`ValueError` or :class:`TypeError`,
+        e.g. of ``None``, if failed."""
         if isinstance(val, six.binary_type):
             val = val.decode("utf8")
 
+        if self._parser is not None:
+            ret = self._parser(val)
+            if ret is not None:
+                return self._localize(ret)
+            if self.format == ISO8601:
+                raise ValueError("time data %r does not match ISO 8601"
+                                 % val)
+        return self._localize(datetime.strptime(val, self.format))
+
+    def try_convert(self, val):
         try:
-            return datetime.strptime(val, self.format)
-        except ValueError as e:
+            return self._parse(val)
+        except (TypeError, ValueError) as e:
+            return Invalid(MismatchError, e.args[0])
+
+    def _parse_many(self, values):
+        parse = self._parse
+        try:
+            return [parse(val) for val in values]
+        except (TypeError, ValueError) as e:
             raise MismatchError(e.args[0])
 
+    def convert_many(self, values):
+        if _uses_try_convert_of(self, Datetime):
+            return self._parse_many(values)
+        return super(Datetime, self).convert_many(values)
+
 
 class Date(Datetime):
-    def __init__(self, format="%Y-%m-%d"):
-        super(Date, self).__init__(format)
+    """Date type, the formats which only have ``%Y``, ``%m`` and ``%d`` are
+    parsed to :class:`datetime.date` directly. The datetimes are converted
+    to ``tz`` before taking the date if it's given."""
+    def __init__(self, format="%Y-%m-%d", tz=None):
+        super(Date, self).__init__(format, tz)
 
-    def convert(self, val):
-        return super(Date, self).convert(val).date()
+    def try_convert(self, val):
+        ret = super(Date, self).try_convert(val)
+        if type(ret) is datetime:
+            return ret.date()
+        return ret
+
+    def convert_many(self, values):
+        if _uses_try_convert_of(self, Date):
+            return [val.date() if type(val) is datetime else val
+                    for val in self._parse_many(values)]
+        return BaseType.convert_many(self, values)
+
+
+# Marks a value which is not one of the choices.
+_NOT_CHOSEN = object()
+
+
+class Choice(BaseType):
+    """Value must be one of the choices, the canonical choice is returned.
+
+    Usage::
+
+        class OrderEntity(Model):
+            status = Argument(types.Choice(["open", "closed"]))
+            level = Argument(types.Choice(Level, type_=types.Integer))
+
+    The choices are looked up from a hash table, so an accepted value is
+    always the same object of the choice, the text choices are interned.
+    """
+    def __init__(self, choices, type_=None):
+        """Initialize
+
+        :param choices:
+            An iterable of the choices, or a subclass of :class:`enum.Enum`
+            whose values are the choices, and the members are returned.
+        :param type_:
+            A type to convert the values before looking up, e.g.
+            :class:`Integer` for the choices of integers from a query string.
+            Otherwise the bytes values are decoded as UTF-8 if they are not
+            choices.
+        """
+        members = getattr(choices, "__members__", None)
+        if members is not None:
+            lookup = {member.value: member for member in members.values()}
+        else:
+            lookup = {}
+            for choice in choices:
+                if type(choice) is str:
+                    choice = six.moves.intern(choice)
+                lookup[choice] = choice
+
+        self.choices = frozenset(lookup)
+        self.type_ = type_() if inspect.isclass(type_) else type_
+        self._lookup = lookup
+
+    def try_convert(self, val):
+        if self.type_ is not None:
+            val = self.type_.try_convert(val)
+            if type(val) is Invalid:
+                return val
+
+        try:
+            ret = self._lookup.get(val, _NOT_CHOSEN)
+            if ret is _NOT_CHOSEN and isinstance(val, six.binary_type):
+                ret = self._lookup.get(val.decode("utf8"), _NOT_CHOSEN)
+        except (TypeError, UnicodeDecodeError):
+            # Unhashable value or invalid bytes.
+            ret = _NOT_CHOSEN
+
+        if ret is _NOT_CHOSEN:
+            return Invalid(ChoiceError, val)
+        return ret
+
+    def convert_many(self, values):
+        if self.type_ is not None or not _uses_try_convert_of(self, Choice):
+            return super(Choice, self).convert_many(values)
+
+        get = self._lookup.get
+        try:
+            ret = [get(val, _NOT_CHOSEN) for val in values]
+        except TypeError:
+            ret = [_NOT_CHOSEN]
+        if _NOT_CHOSEN in ret:
+            return super(Choice, self).convert_many(values)
+        return ret
+
+
+def _item_type(type_):
+    type_ = type_() if inspect.isclass(type_) else type_
+    if isinstance(type_, Nested):
+        raise TypeError("Nested model can't be an item, use ``Argument("
+                        "Nested(...), multiple=True)`` instead.")
+    return type_
+
+
+class List(BaseType):
+    """List of the values of a type.
+
+    Usage::
+
+        class PathEntity(Model):
+            points = Argument(types.List(types.Double, max_items=1000))
+
+    The number of the items is checked before converting any of them, and
+    the items are converted at once by the ``convert_many`` of the item type,
+    so a packed item type returns an array.
+    """
+    cost = 8
+
+    def __init__(self, item_type, max_items=None):
+        """Initialize
+
+        :param item_type: Type of the items, which can't be :class:`Nested`.
+        :param max_items: Maximum number of the items.
+        """
+        self.item_type = _item_type(item_type)
+        self.max_items = max_items
+
+    def try_convert(self, val):
+        if not isinstance(val, (list, tuple)):
+            return Invalid(MismatchError, val)
+        if self.max_items is not None and len(val) > self.max_items:
+            return Invalid(MaxitemsExceedError, self.max_items)
+
+        try:
+            return self.item_type.convert_many(val)
+        except ConvertError as e:
+            return Invalid.from_error(e)
+
+
+class Tuple(BaseType):
+    """Tuple of a fixed number of values, each of them has its own type.
+
+    Usage::
+
+        class PlaceEntity(Model):
+            location = Argument(types.Tuple(types.Double, types.Double))
+    """
+    cost = 4
+
+    def __init__(self, *item_types):
+        """Initialize
+
+        :param item_types: Types of the items, which can't be :class:`Nested`.
+        """
+        self.item_types = tuple(map(_item_type, item_types))
+        self._converts = tuple(type_.try_convert for type_ in self.item_types)
+
+    def try_convert(self, val):
+        if (not isinstance(val, (list, tuple)) or
+                len(val) != len(self._converts)):
+            return Invalid(MismatchError, val)
+
+        ret = tuple(convert(item) for convert, item in zip(self._converts,
+                                                           val))
+        for item in ret:
+            if type(item) is Invalid:
+                return item
+        return ret
+
+
+class Mapping(BaseType):
+    """Dict of which the keys and values have the types.
+
+    Usage::
+
+        class MetricsEntity(Model):
+            counters = Argument(types.Mapping(types.Unicode(max_len=64),
+                                              types.Integer, max_items=100))
+
+    The number of the items is checked before converting any of them, the
+    keys and the values are converted at once by ``convert_many``.
+    """
+    cost = 8
+
+    def __init__(self, key_type=None, value_type=None, max_items=None):
+        """Initialize
+
+        :param key_type:
+            Type of the keys, the keys are kept as it is if it's ``None``.
+        :param value_type:
+            Type of the values, which can't be :class:`Nested`. The values are
+            kept as it is if it's ``None``.
+        :param max_items: Maximum number of the items.
+        """
+        self.key_type = None if key_type is None else _item_type(key_type)
+        self.value_type = (None if value_type is None else
+                           _item_type(value_type))
+        self.max_items = max_items
+
+    def try_convert(self, val):
+        if not isinstance(val, dict):
+            return Invalid(MismatchError, val)
+        if self.max_items is not None and len(val) > self.max_items:
+            return Invalid(MaxitemsExceedError, self.max_items)
+
+        keys = list(val)
+        values = [val[key] for key in keys]
+        try:
+            if self.key_type is not None:
+                keys = self.key_type.convert_many(keys)
+            if self.value_type is not None:
+                values = self.value_type.convert_many(values)
+        except ConvertError as e:
+            return Invalid.from_error(e)
+        return dict(zip(keys, values))
+
+
+# Types of which the instances are immutable, so the converted values can be
+# shared by the requests.
+_IMMUTABLE_TYPES = frozenset(six.integer_types + six.string_types + (
+    type(None), bool, float, complex, six.binary_type, six.text_type,
+    decimal.Decimal, datetime, date, time, timedelta, frozenset))
+
+CacheInfo = collections.namedtuple("CacheInfo",
+                                   ["hits", "misses", "maxsize", "currsize"])
+
+
+if hasattr(collections.OrderedDict, "move_to_end"):
+    _move_to_end = collections.OrderedDict.move_to_end
+else:   # pragma: no cover
+    def _move_to_end(cache, key):
+        cache[key] = cache.pop(key)
+
+
+def _is_immutable(val):
+    if type(val) in _IMMUTABLE_TYPES:
+        return True
+    if type(val) is tuple:
+        return all(map(_is_immutable, val))
+    # The members of enums are singletons.
+    return enum is not None and isinstance(val, enum.Enum)
+
+
+class Cached(BaseType):
+    """Memoize the conversions of a type in a bounded LRU cache, keyed by the
+    type and the value of the raw input.
+
+    Usage::
+
+        class PriceEntity(Model):
+            day = Argument(types.Cached(types.Date(), maxsize=256))
+            time = Argument(types.Datetime("%d/%m/%Y %H:%M").cached())
+            currency = Argument(types.Unicode, cache_size=64)
+
+    It pays off for the types of costly conversions, e.g. parsing dates,
+    the cheap ones, e.g. numbers, are about as fast as looking up the cache.
+    Only the results of the immutable types, e.g. numbers, strings,
+    datetimes and the tuples of them, are cached, since the cached result is
+    shared by all requests. The failures and the unhashable inputs are not
+    cached. The other attributes are delegated to the wrapped type.
+    """
+    def __init__(self, type_, maxsize=1024):
+        """Initialize
+
+        :param type_: The type to cache, which can't be :class:`Nested`.
+        :param maxsize:
+            Maximum number of the cached results, the least recently used
+            one is evicted when it's full.
+        """
+        type_ = type_() if inspect.isclass(type_) else type_
+        if isinstance(type_, Nested):
+            raise TypeError("Nested model can't be cached.")
+        if maxsize <= 0:
+            raise ValueError("``maxsize`` must be positive.")
+
+        self.type_ = type_
+        self.maxsize = maxsize
+        #: Number of the conversions returned from the cache.
+        self.hits = 0
+        #: Number of the conversions not in the cache.
+        self.misses = 0
+        self._cache = collections.OrderedDict()
+
+    @property
+    def cost(self):
+        return self.type_.cost
+
+    def __getattr__(self, name):
+        # Only called for the attributes that are not found, e.g. ``packed``
+        # and ``max_len`` of the wrapped type.
+        if name == "type_":
+            raise AttributeError(name)
+        return getattr(self.type_, name)
+
+    def try_convert(self, val):
+        cache = self._cache
+        key = (type(val), val)
+        try:
+            ret = cache[key]
+            # Raises KeyError too if another thread has evicted it.
+            _move_to_end(cache, key)
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable.
+            return self.type_.try_convert(val)
+        else:
+            self.hits += 1
+            return ret
+
+        self.misses += 1
+        ret = self.type_.try_convert(val)
+        if type(ret) is not Invalid and _is_immutable(ret):
+            cache[key] = ret
+            if len(cache) > self.maxsize:
+                cache.popitem(last=False)
+        return ret
+
+    def convert_many(self, values):
+        ret = super(Cached, self).convert_many(values)
+        if getattr(self.type_, "packed", False):
+            return self.type_._pack(ret)
+        return ret
+
+    def cache_info(self):
+        """Returns the statistics of the cache, like
+        :func:`functools.lru_cache`."""
+        return CacheInfo(self.hits, self.misses, self.maxsize,
+                         len(self._cache))
+
+    def cache_clear(self):
+        """Clear the cache and the statistics."""
+        self._cache.clear()
+        self.hits = self.misses = 0
+
+
+class File(BaseType):
+    """File type, the value is an instance of
+    :class:`~parameter.multipart.UploadedFile` from
+    :class:`~parameter.adapter.MultipartAdapter`."""
+    def __init__(self, max_size=None):
+        """Initialize
+
+        :param max_size:
+            Maximum size of the file in bytes, the adapter aborts the upload
+            as soon as it's exceeded.
+        """
+        self.max_size = max_size
+
+    def try_convert(self, val):
+        if not isinstance(val, UploadedFile):
+            return Invalid(MismatchError, val)
+
+        if self.max_size is not None and val.size > self.max_size:
+            return Invalid(MaxsizeExceedError, self.max_size)
+        return val
 
 
 class Nested(BaseType):
@@ -3,13 +3,17 @@
 """This module tests adapters."""
 from __future__ import print_function, division, unicode_literals
 
+import io
 import json
 import unittest
 
+import six
+
 try:
     from urllib import urlencode
+    from urlparse import parse_qs
 except ImportError:
-    from urllib.parse import urlencode
+    from urllib.parse import urlencode, parse_qs
 
 from tornado import testing
 from tornado import web
@@ -17,6 +21,10 @@ from tornado import web
 from parameter import Model, Argument, types
 from parameter import ArgumentMissError, ArgumentInvalidError
 from parameter.adapter import TornadoAdapter, JSONAdapter
+from parameter.adapter import StreamingJSONAdapter, PrefetchTornadoAdapter
+from parameter.adapter import TornadoJSONAdapter, QueryStringAdapter
+from parameter.adapter import MultipartAdapter, MessagePackAdapter
+from parameter.binary import py_packb, py_unpackb
 
 
 class UserEntity(Model):
@@ -33,12 +41,17 @@ class SingleArgEntity(Model):
 
 
 class DemoHandler(web.RequestHandler):
+    adapter_cls = TornadoAdapter
+
+    def get_adapter(self, model_cls):
+        return self.adapter_cls(self)
+
     def get(self):
         try:
             if self.request.path == "/":
-                entity = UserEntity(TornadoAdapter(self))
+                entity = UserEntity(self.get_adapter(UserEntity))
             else:
-                entity = SingleArgEntity(TornadoAdapter(self))
+                entity = SingleArgEntity(self.get_adapter(SingleArgEntity))
         except ArgumentMissError as e:
             self.write({
                 "missing": True,
@@ -60,11 +73,25 @@ class DemoHandler(web.RequestHandler):
         })
 
 
+class PrefetchHandler(DemoHandler):
+    def get_adapter(self, model_cls):
+        return PrefetchTornadoAdapter(self, model_cls)
+
+
+class JSONBodyHandler(web.RequestHandler):
+    def post(self):
+        entity = DemoEntity(TornadoJSONAdapter(self))
+        cached = DemoEntity(TornadoJSONAdapter(self, decoder=ValueError))
+        self.write({"a": entity.a, "b": cached.b})
+
+
 class TornadoAdapterTestCase(testing.AsyncHTTPTestCase):
+    handler_cls = DemoHandler
+
     def get_app(self):
         return web.Application([
-            (r'/', DemoHandler),
-            (r'/1', DemoHandler),
+            (r'/', self.handler_cls),
+            (r'/1', self.handler_cls),
         ])
 
     def _fetch_json(self, path, params=None):
@@ -111,6 +138,32 @@ class TornadoAdapterTestCase(testing.AsyncHTTPTestCase):
         })
 
 
+class PrefetchTornadoAdapterTestCase(TornadoAdapterTestCase):
+    handler_cls = PrefetchHandler
+
+    def test_decode(self):
+        data = self._fetch_json("/", {
+            "username": " un ",
+            "password": "pw\x01",
+            # urlencode of Python 2 doesn't encode unicode.
+            "name": "\u00fc".encode("utf8"),
+        })
+        self.assertEqual(data["username"], "un")
+        self.assertEqual(data["password"], "pw")
+        self.assertEqual(data["name"], "\u00fc")
+
+
+class TornadoJSONAdapterTestCase(testing.AsyncHTTPTestCase):
+    def get_app(self):
+        return web.Application([(r'/', JSONBodyHandler)])
+
+    def test_body(self):
+        resp = self.fetch("/", method="POST", body=b'{"a": 1, "b": 2}')
+        self.assertEqual(resp.code, 200)
+        self.assertDictEqual(json.loads(resp.body.decode("utf8")),
+                             {"a": 1, "b": 2})
+
+
 class DemoEntity(Model):
     a = Argument(types.Integer)
     b = Argument(types.Integer)
@@ -133,6 +186,21 @@ class JSONAdapterTestCase(unittest.TestCase):
         self.assertEqual(entity.a, 1)
         self.assertEqual(entity.b, 2)
 
+    def test_buffer(self):
+        for data in (bytearray(b'{"a": 1, "b": 2}'),
+                     memoryview(b'{"a": 1, "b": 2}')):
+            entity = DemoEntity(JSONAdapter(data))
+
+            self.assertEqual(entity.a, 1)
+            self.assertEqual(entity.b, 2)
+
+    def test_decoder(self):
+        adapter = JSONAdapter(b'{"a": 1, "b": 2}', decoder="json")
+        self.assertDictEqual(adapter.data, {"a": 1, "b": 2})
+
+        adapter = JSONAdapter(b'{"a": 1}', decoder=lambda data: {"b": 2})
+        self.assertDictEqual(adapter.data, {"b": 2})
+
     def test_dict(self):
         adapter = JSONAdapter({"a": 1, "b": 2})
 
@@ -200,3 +268,243 @@ class JSONAdapterTestCase(unittest.TestCase):
             class NestedEntity(Model):
                 demos = Argument(types.Nested(T), alias="demo", multiple=True)
                 c = Argument(types.Integer)
+
+
+class StreamingJSONAdapterTestCase(unittest.TestCase):
+    def _chunks(self, data, size=3):
+        raw = json.dumps(data).encode("utf8")
+        return [raw[i:i + size] for i in range(0, len(raw), size)]
+
+    def test_stream(self):
+        data = {
+            "a": 1,
+            "skip": {"nested": [1, "]}\\\"", {"x": None}]},
+            "b": 2,
+        }
+        adapter = StreamingJSONAdapter(self._chunks(data), DemoEntity)
+
+        self.assertDictEqual(adapter.data, {"a": 1, "b": 2})
+
+        entity = DemoEntity(adapter)
+        self.assertEqual(entity.a, 1)
+        self.assertEqual(entity.b, 2)
+
+    def test_file(self):
+        f = io.BytesIO(b'{"b": 2, "a": 1, "c": "unused"}')
+        entity = DemoEntity(StreamingJSONAdapter(f, DemoEntity, chunk_size=4))
+
+        self.assertEqual(entity.a, 1)
+        self.assertEqual(entity.b, 2)
+
+    def test_nested(self):
+        class NestedEntity(Model):
+            demos = Argument(types.Nested(DemoEntity), multiple=True,
+                             alias="demo")
+            c = Argument(types.Integer)
+
+        data = {"demo": [{"a": 1, "b": 2}], "c": 3, "d": [4]}
+        entity = NestedEntity(StreamingJSONAdapter(self._chunks(data),
+                                                   NestedEntity))
+
+        self.assertEqual(entity.c, 3)
+        self.assertEqual(entity.demos[0].b, 2)
+
+    def test_not_object(self):
+        with self.assertRaises(TypeError):
+            StreamingJSONAdapter([b"[1, 2]"], DemoEntity)
+
+    def test_invalid(self):
+        for raw in (b'{"a": 1', b'{"a" 1}', b'{"a": "1}', b'{"a": [1}',
+                    b'{1: 2}', b'{"a": }'):
+            with self.assertRaises(ValueError):
+                StreamingJSONAdapter([raw], DemoEntity)
+
+
+def _parse_qs(query, keep_blank_values):
+    if six.PY3:
+        return parse_qs(query, keep_blank_values=keep_blank_values)
+
+    # parse_qs of Python 2 doesn't decode UTF-8.
+    return dict((name.decode("utf8", "replace"),
+                 [value.decode("utf8", "replace") for value in values])
+                for name, values in parse_qs(
+                    query.encode("ascii"),
+                    keep_blank_values=keep_blank_values).items())
+
+
+class QueryStringAdapterTestCase(unittest.TestCase):
+    def test_parse(self):
+        adapter = QueryStringAdapter(
+            b"username=u%20n&password=p+w&name=%C3%BC&badge=1&badge=2"
+            b"&&age=&x")
+        entity = UserEntity(adapter)
+
+        self.assertEqual(entity.username, b"u n")
+        self.assertEqual(entity.password, b"p w")
+        self.assertEqual(entity.name, "ü")
+        self.assertEqual(entity.age, 18)
+        self.assertListEqual(entity.badges, ["1", "2"])
+        self.assertEqual(adapter.get_argument("badge", None), "2")
+        self.assertIsNone(adapter.get_argument("x", None))
+
+    def test_keep_blank_values(self):
+        adapter = QueryStringAdapter("a=&b&a%20b=1", keep_blank_values=True)
+        self.assertListEqual(adapter.get_arguments("a"), [""])
+        self.assertListEqual(adapter.get_arguments("b"), [""])
+        self.assertListEqual(adapter.get_arguments("a b"), ["1"])
+
+    def test_same_as_parse_qs(self):
+        for query in ("a=1&a=2&b=%zz&c=%E4%B8%AD", "=1&a==2&&+=3",
+                      "a%3Db=1&c=2", "a=%ff"):
+            for keep_blank_values in (True, False):
+                expected = _parse_qs(query, keep_blank_values)
+                for data in (query, memoryview(query.encode("ascii"))):
+                    adapter = QueryStringAdapter(
+                        data, keep_blank_values=keep_blank_values)
+                    for name, values in expected.items():
+                        self.assertListEqual(adapter.get_arguments(name),
+                                             values)
+
+    def test_environ(self):
+        environ = {"QUERY_STRING": "a=1&b=%C3%BC"}
+        adapter = QueryStringAdapter.from_environ(environ)
+        self.assertEqual(adapter.get_argument("b", None), "ü")
+
+        environ = {"CONTENT_LENGTH": "7",
+                   "wsgi.input": io.BytesIO(b"a=1&b=2&c=3")}
+        entity = DemoEntity(QueryStringAdapter.from_environ(environ,
+                                                            source="body"))
+        self.assertEqual(entity.a, 1)
+        self.assertEqual(entity.b, 2)
+
+        adapter = QueryStringAdapter.from_environ({}, source="body")
+        self.assertListEqual(adapter.get_arguments("a"), [])
+
+
+class UploadEntity(Model):
+    title = Argument(types.Unicode(max_len=10))
+    image = Argument(types.File(max_size=16))
+    tags = Argument(types.Unicode, multiple=True, alias="tag")
+
+
+def _multipart(*parts):
+    body = [b"preamble"]
+    for headers, content in parts:
+        body.append(b"\r\n--XyZ\r\n" + headers + b"\r\n\r\n" + content)
+    body.append(b"\r\n--XyZ--\r\n")
+    return b"".join(body)
+
+
+def _field(name, content, filename=None):
+    headers = 'Content-Disposition: form-data; name="%s"' % name
+    if filename is not None:
+        headers += '; filename="%s"\r\nContent-Type: image/png' % filename
+    return headers.encode("utf8"), content
+
+
+class MultipartAdapterTestCase(unittest.TestCase):
+    content_type = 'multipart/form-data; boundary="XyZ"'
+
+    def test_parse(self):
+        body = _multipart(_field("title", "hello ü".encode("utf8")),
+                          _field("skip", b"x" * 1000),
+                          _field("tag", b"a"),
+                          _field("tag", b""),
+                          _field("image", b"\x00\r\n--Xy\r\n", "a.png"))
+        for chunk_size in (1, 2, 7, 1024):
+            adapter = MultipartAdapter(io.BytesIO(body), UploadEntity,
+                                       self.content_type, chunk_size)
+            entity = UploadEntity(adapter)
+
+            self.assertEqual(entity.title, "hello ü")
+            self.assertListEqual(entity.tags, ["a", ""])
+            self.assertEqual(entity.image.filename, "a.png")
+            self.assertEqual(entity.image.content_type, "image/png")
+            self.assertEqual(entity.image.size, 9)
+            self.assertEqual(entity.image.read(), b"\x00\r\n--Xy\r\n")
+            self.assertNotIn("skip", adapter.arguments)
+            adapter.close()
+
+    def test_spool(self):
+        body = _multipart(_field("title", b"t"),
+                          _field("image", b"x" * 16, "a.png"))
+        adapter = MultipartAdapter([body], UploadEntity, self.content_type,
+                                   spool_size=8)
+        image = UploadEntity(adapter).image
+        self.assertTrue(image.file._rolled)
+        self.assertEqual(image.read(), b"x" * 16)
+        adapter.close()
+
+    def test_limits(self):
+        for field, code in ((_field("image", b"x" * 17, "a.png"), "max_size"),
+                            (_field("title", b"x" * 41), "max_len")):
+            body = _multipart(field, _field("tag", b"a"))
+            chunks = [body[i:i + 4] for i in range(0, len(body), 4)]
+            stream = iter(chunks)
+            with self.assertRaises(ArgumentInvalidError) as ctx:
+                MultipartAdapter(stream, UploadEntity, self.content_type,
+                                 spool_size=8)
+            self.assertEqual(ctx.exception.code, code)
+            # Aborted before reading the rest.
+            self.assertTrue(list(stream))
+
+        # The other arguments are given, they may be converted first.
+        body = _multipart(_field("title", b"x" * 11), _field("tag", b"a"),
+                          _field("image", b"x", "a.png"))
+        with self.assertRaises(ArgumentInvalidError) as ctx:
+            UploadEntity(MultipartAdapter([body], UploadEntity,
+                                          self.content_type))
+        self.assertEqual(ctx.exception.code, "max_len")
+
+    def test_cached(self):
+        class _CachedUploadEntity(Model):
+            title = Argument(types.Unicode(max_len=2), cache_size=8)
+
+        # The bytes of UTF-8 are not limited by the length.
+        body = _multipart(_field("title", "üü".encode("utf8")))
+        adapter = MultipartAdapter([body], _CachedUploadEntity,
+                                   self.content_type)
+        self.assertEqual(_CachedUploadEntity(adapter).title, "üü")
+
+    def test_invalid(self):
+        for body in (b"", b"--XyZ\r\n", b"--XyZ\r\nX\r\n\r\n--XyZ--",
+                     b"--XyZ\r\nContent-Disposition: inline\r\n\r\n--XyZ--",
+                     b"--XyZ\r\n" + _field("title", b"t")[0] + b"\r\n\r\nt",
+                     b"--XyZ\r\n" + b"x" * 20000, b"--XyZxx"):
+            with self.assertRaises(ValueError):
+                MultipartAdapter([body], UploadEntity, self.content_type)
+
+        with self.assertRaises(ValueError):
+            MultipartAdapter([b"--\r\n"], UploadEntity, "multipart/form-data")
+
+
+class MessagePackAdapterTestCase(unittest.TestCase):
+    def test_decode(self):
+        data = py_packb({"a": 1, "b": 2})
+        for raw in (data, bytearray(data), memoryview(data)):
+            entity = DemoEntity(MessagePackAdapter(raw))
+            self.assertEqual(entity.a, 1)
+            self.assertEqual(entity.b, 2)
+
+        adapter = MessagePackAdapter(data, decoder=py_unpackb)
+        self.assertDictEqual(adapter.data, {"a": 1, "b": 2})
+
+    def test_nested(self):
+        class NestedEntity(Model):
+            demo = Argument(types.Nested(DemoEntity))
+            demos = Argument(types.Nested(DemoEntity), multiple=True)
+
+        entity = NestedEntity(MessagePackAdapter(py_packb({
+            "demo": {"a": 1, "b": 2},
+            "demos": [{"a": 3, "b": 4}],
+        })))
+        self.assertEqual(entity.demo.b, 2)
+        self.assertEqual(entity.demos[0].a, 3)
+        self.assertIsInstance(entity.demo.adapter, MessagePackAdapter)
+
+    def test_not_map(self):
+        with self.assertRaises(TypeError):
+            MessagePackAdapter(py_packb([1]))
+
+        with self.assertRaises(ValueError):
+            MessagePackAdapter(b"\xc1")
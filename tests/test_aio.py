@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""This module tests ``parameter.aio``."""
+from __future__ import print_function, division, unicode_literals
+
+import json
+import sys
+import threading
+import unittest
+
+if sys.version_info < (3, 5):
+    raise unittest.SkipTest("asyncio adapters require Python 3.5+")
+
+import asyncio     # noqa: E402
+
+from concurrent.futures import ThreadPoolExecutor  # noqa: E402
+
+from parameter import Model, Argument, types  # noqa: E402
+from parameter import ArgumentMissError, ArgumentInvalidError  # noqa: E402
+from parameter.aio import AsyncJSONAdapter, create  # noqa: E402
+
+
+class PetEntity(Model):
+    name = Argument(types.Unicode)
+
+
+class OwnerEntity(Model):
+    name = Argument(types.Unicode)
+    age = Argument(types.Integer, default=18)
+    pet = Argument(types.Nested(PetEntity))
+    pets = Argument(types.Nested(PetEntity), multiple=True)
+
+
+class LazyOwnerEntity(Model):
+    class Meta:
+        lazy = True
+
+    name = Argument(types.Unicode)
+    pet = Argument(types.Nested(PetEntity))
+
+
+DATA = {"name": "Gray", "pet": {"name": "Tom"},
+        "pets": [{"name": "Jerry"}, {"name": "Spike"}]}
+
+
+class AsyncTestCase(unittest.TestCase):
+    def setUp(self):
+        super(AsyncTestCase, self).setUp()
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        super(AsyncTestCase, self).tearDown()
+        self.loop.close()
+
+    def run_create(self, model_cls, data, **kwargs):
+        return self.loop.run_until_complete(
+            model_cls.create_async(AsyncJSONAdapter(data), **kwargs))
+
+    def assertOwner(self, owner):
+        self.assertEqual(owner.name, "Gray")
+        self.assertEqual(owner.age, 18)
+        self.assertEqual(owner.pet.name, "Tom")
+        self.assertListEqual([pet.name for pet in owner.pets],
+                             ["Jerry", "Spike"])
+
+    def test_create(self):
+        self.assertOwner(self.run_create(OwnerEntity, DATA))
+        self.assertOwner(self.run_create(OwnerEntity, json.dumps(DATA)))
+
+    def test_awaitable_body(self):
+        body = asyncio.sleep(0, result=json.dumps(DATA).encode("utf8"))
+        self.assertOwner(self.run_create(OwnerEntity, body))
+
+    def test_lazy(self):
+        owner = self.run_create(LazyOwnerEntity, DATA)
+        self.assertEqual(owner.pet.name, "Tom")
+        self.assertEqual(owner.name, "Gray")
+
+    def test_errors(self):
+        with self.assertRaises(ArgumentMissError) as ctx:
+            self.run_create(OwnerEntity, {"pet": {}})
+        self.assertEqual(ctx.exception.name, "name")
+
+        with self.assertRaises(ArgumentMissError) as ctx:
+            self.run_create(OwnerEntity, {"name": "Gray", "pet": {},
+                                          "pets": []})
+        self.assertEqual(ctx.exception.name, "name")
+
+        with self.assertRaises(ArgumentInvalidError) as ctx:
+            self.run_create(OwnerEntity, {"name": "Gray", "age": "x",
+                                          "pet": {"name": "Tom"}})
+        self.assertEqual(ctx.exception.name, "age")
+
+        with self.assertRaises(ArgumentInvalidError) as ctx:
+            self.run_create(OwnerEntity, {"name": "Gray",
+                                          "pet": {"name": "Tom"}})
+        self.assertEqual(ctx.exception.name, "pets")
+
+        with self.assertRaises(TypeError):
+            self.run_create(OwnerEntity, "[1]")
+
+        with self.assertRaises(TypeError):
+            self.run_create(OwnerEntity, dict(DATA, pet=1))
+
+    def test_offload(self):
+        threads = []
+
+        def decoder(data):
+            threads.append(threading.current_thread())
+            return json.loads(data)
+
+        body = json.dumps(DATA)
+        with ThreadPoolExecutor(1) as executor:
+            self.assertOwner(self.loop.run_until_complete(create(
+                OwnerEntity, AsyncJSONAdapter(body, decoder=decoder),
+                executor=executor, offload_size=len(body) - 1)))
+            self.assertOwner(self.loop.run_until_complete(create(
+                OwnerEntity, AsyncJSONAdapter(body, decoder=decoder),
+                executor=executor, offload_size=len(body))))
+
+        self.assertIsNot(threads[0], threading.current_thread())
+        self.assertIs(threads[1], threading.current_thread())
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""This module tests ``parameter.binary``."""
+from __future__ import print_function, division, unicode_literals
+
+import datetime
+import unittest
+
+from parameter import binary
+from parameter.binary import ExtType, py_packb, py_unpackb
+
+
+OBJECTS = [
+    None, True, False, 0, 127, 128, -32, -33, 2 ** 64 - 1, -2 ** 63, 1.5,
+    "", "ü" * 40, b"\x00\xff", [], list(range(20)),
+    {"a": [1, {"b": None}], "c": "d" * 100, "e": ExtType(5, b"ab")},
+    dict(("k%d" % i, i) for i in range(20)),
+]
+
+
+class BinaryTestCase(unittest.TestCase):
+    def test_round_trip(self):
+        for obj in OBJECTS:
+            data = py_packb(obj)
+            self.assertEqual(py_unpackb(data), obj)
+            self.assertEqual(py_unpackb(bytearray(data)), obj)
+            self.assertEqual(py_unpackb(memoryview(data)), obj)
+            self.assertEqual(binary.unpackb(data), obj)
+            self.assertEqual(py_unpackb(binary.packb(obj)), obj)
+
+    def test_formats(self):
+        cases = {
+            b"\xca\x3f\x80\x00\x00": 1.0,
+            b"\xcc\xff": 255,
+            b"\xcd\x01\x00": 256,
+            b"\xd0\x80": -128,
+            b"\xd1\x80\x00": -32768,
+            b"\xd9\x01a": "a",
+            b"\xc4\x01x": b"x",
+            b"\xdc\x00\x01\x01": [1],
+            b"\xde\x00\x01\xa1a\x01": {"a": 1},
+            b"\xd4\x01\x02": ExtType(1, b"\x02"),
+            b"\xc7\x01\x7f\x00": ExtType(127, b"\x00"),
+        }
+        for data, obj in cases.items():
+            self.assertEqual(py_unpackb(data), obj)
+
+    def test_timestamp(self):
+        epoch = py_unpackb(b"\xd6\xff\x00\x00\x00\x00")
+        for data, delta in (
+                (b"\xd6\xff\x00\x00\x00\x01", datetime.timedelta(0, 1)),
+                (b"\xd7\xff\x00\x00\x0f\xa0\x00\x00\x00\x02",
+                 datetime.timedelta(0, 2, 1)),
+                (b"\xc7\x0c\xff\x00\x00\x03\xe8" + b"\xff" * 8,
+                 datetime.timedelta(0, -1, 1))):
+            self.assertEqual(py_unpackb(data), epoch + delta)
+            self.assertEqual(binary.unpackb(data), epoch + delta)
+        self.assertEqual(epoch.year, 1970)
+
+        for data in (b"\xd5\xff\x00\x00", b"\xd4\xfe\x00"):
+            with self.assertRaises(ValueError):
+                py_unpackb(data)
+
+    def test_invalid(self):
+        for data in (b"", b"\xc1", b"\xd9\x05ab", b"\x01\x02",
+                     b"\x81\x91\x01\x01", b"\xa1\xff",
+                     b"\x91" * (binary.MAX_DEPTH + 1) + b"\x01"):
+            with self.assertRaises(ValueError):
+                py_unpackb(data)
+
+        with self.assertRaises(TypeError):
+            py_packb(object())
+
+        with self.assertRaises(OverflowError):
+            py_packb(2 ** 64)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""This module tests ``parameter.compile``."""
+from __future__ import print_function, division, unicode_literals
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import six
+
+from parameter import Model, Argument, types
+from parameter import ArgumentInvalidError, ArgumentMissError
+from parameter import compile as precompile
+from parameter import model
+from parameter.adapter import JSONAdapter
+
+
+class _CompiledEntity(Model):
+    name = Argument(types.Unicode)
+    age = Argument(types.Integer, default=18)
+    tags = Argument(types.Unicode, multiple=True, max_items=2)
+
+
+class _LazyCompiledEntity(Model):
+    name = Argument(types.Unicode)
+
+    class Meta:
+        lazy = True
+
+
+class _OrderedCompiledEntity(Model):
+    when = Argument(types.Datetime)
+    age = Argument(types.Integer)
+
+    class Meta:
+        order = "cost"
+
+
+def _redefine(qualname, *items):
+    """Define a model as if the module is imported again, ``items`` are the
+    ``(attr, value)`` pairs in the order of the class statement."""
+    namespace = {"__module__": __name__}
+    if six.PY3:
+        namespace["__qualname__"] = qualname
+    # Insert as the class statement does, the order of the arguments
+    # follows the namespace on Python 2.
+    for attr, value in items:
+        namespace[attr] = value
+    return type(Model)(str(qualname), (Model,), namespace)
+
+
+class CompileTestCase(unittest.TestCase):
+    def setUp(self):
+        self.source = precompile.generate([__name__])
+        exec(compile(self.source, "<generated>", "exec"), {})
+
+    def tearDown(self):
+        model._precompiled.clear()
+
+    def test_generate(self):
+        self.assertIn("'_CompiledEntity'", self.source)
+        self.assertIn("'_LazyCompiledEntity'", self.source)
+        self.assertEqual(len(model._precompiled), 3)
+
+    def test_precompiled(self):
+        entity_cls = _redefine(
+            "_CompiledEntity",
+            ("name", Argument(types.Unicode)),
+            ("age", Argument(types.Integer, default=18)),
+            ("tags", Argument(types.Unicode, multiple=True, max_items=2)))
+        self.assertTrue(getattr(entity_cls._init, "_meta_precompiled", False))
+
+        entity = entity_cls(JSONAdapter({"name": "a", "tags": ["b"]}))
+        self.assertEqual((entity.name, entity.age, entity.tags),
+                         ("a", 18, ["b"]))
+        with self.assertRaises(ArgumentMissError):
+            entity_cls(JSONAdapter({"tags": []}))
+        with self.assertRaises(ArgumentInvalidError):
+            entity_cls(JSONAdapter({"name": "a", "age": "x", "tags": []}))
+
+    def test_lazy(self):
+        entity_cls = _redefine("_LazyCompiledEntity",
+                               ("name", Argument(types.Unicode)),
+                               ("Meta", type(str("Meta"), (), {"lazy": True})))
+        self.assertTrue(getattr(entity_cls._init, "_meta_precompiled", False))
+        self.assertEqual(entity_cls(JSONAdapter({"name": "a"})).name, "a")
+
+    def test_ordered(self):
+        entity_cls = _redefine(
+            "_OrderedCompiledEntity",
+            ("when", Argument(types.Datetime)),
+            ("age", Argument(types.Integer)),
+            ("Meta", type(str("Meta"), (), {"order": "cost"})))
+        self.assertTrue(getattr(entity_cls._init, "_meta_precompiled", False))
+        with self.assertRaises(ArgumentInvalidError) as ctx:
+            entity_cls(JSONAdapter({"when": "x", "age": "x"}))
+        self.assertEqual(ctx.exception.name, "age")
+
+    def test_fallback(self):
+        # The definition is changed after generating.
+        entity_cls = _redefine("_CompiledEntity",
+                               ("name", Argument(types.Unicode)),
+                               ("age", Argument(types.Integer, multiple=True)))
+        self.assertFalse(hasattr(entity_cls._init, "_meta_precompiled"))
+        self.assertTrue(entity_cls._init._meta_compiled)
+
+        entity = entity_cls(JSONAdapter({"name": "a", "age": [1]}))
+        self.assertEqual((entity.name, entity.age), ("a", [1]))
+
+    def test_load(self):
+        self.assertFalse(precompile.load("tests._missing_compiled"))
+
+    def test_main(self):
+        path = tempfile.mkdtemp()
+        try:
+            filename = os.path.join(path, "models_compiled.py")
+            self.assertEqual(precompile.main([__name__, "-o", filename]), 0)
+            with open(filename) as f:
+                self.assertEqual(f.read(),
+                                 precompile._CODING + self.source)
+        finally:
+            shutil.rmtree(path)
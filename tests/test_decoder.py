@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""This module tests ``parameter.decoder``."""
+from __future__ import print_function, division, unicode_literals
+
+import json
+import unittest
+
+from parameter import decoder
+
+
+class DecoderTestCase(unittest.TestCase):
+    def tearDown(self):
+        super(DecoderTestCase, self).tearDown()
+        decoder.set_default_decoder(None)
+
+    def test_available(self):
+        names = decoder.available_decoders()
+        self.assertIn("json", names)
+        self.assertIs(decoder.get_decoder(), decoder.get_decoder(names[0]))
+
+    def test_inputs(self):
+        raw = b'{"a": [1, "\\u00fc"]}'
+        for name in decoder.available_decoders():
+            loads = decoder.get_decoder(name)
+            for data in (raw, bytearray(raw), memoryview(raw),
+                         raw.decode("utf8")):
+                self.assertDictEqual(loads(data), {"a": [1, "ü"]})
+
+            with self.assertRaises(ValueError):
+                loads(b'{"a": ')
+
+    def test_unknown(self):
+        with self.assertRaises(KeyError):
+            decoder.get_decoder("unknown")
+
+    def test_register(self):
+        calls = []
+
+        def loads(data):
+            calls.append(data)
+            return json.loads(bytes(data).decode("utf8"))
+
+        decoder.register_decoder("custom", loads)
+        decoder.set_default_decoder("custom")
+
+        self.assertIn("custom", decoder.available_decoders())
+        self.assertDictEqual(decoder.get_decoder()(b"{}"), {})
+        self.assertListEqual(calls, [b"{}"])
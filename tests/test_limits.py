@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""This module tests ``parameter.limits``."""
+from __future__ import print_function, division, unicode_literals
+
+import pickle
+import time
+import unittest
+
+from parameter import Model, Argument, types
+from parameter.adapter import JSONAdapter, MessagePackAdapter
+from parameter import binary
+from parameter.binary import py_packb
+from parameter.exception import LimitExceededError
+from parameter.limits import Limits
+
+
+class _LeafEntity(Model):
+    value = Argument(types.Integer)
+
+
+class _BranchEntity(Model):
+    value = Argument(types.Integer)
+    leaf = Argument(types.Nested(_LeafEntity))
+
+
+class _RootEntity(Model):
+    branch = Argument(types.Nested(_BranchEntity))
+
+
+class LimitsTestCase(unittest.TestCase):
+    def assertExceeds(self, limit, func, *args):
+        with self.assertRaises(LimitExceededError) as ctx:
+            func(*args)
+        self.assertEqual(ctx.exception.limit, limit)
+        self.assertIsInstance(ctx.exception, ValueError)
+
+    def test_check_json(self):
+        data = '{"a": [1, {"b": "xyz"}], "c": "\\\\\\"", "d": "{[:"}'
+        for value in (data, data.encode("utf8"),
+                      memoryview(data.encode("utf8"))):
+            Limits(max_bytes=len(data), max_depth=3, max_keys=4,
+                   max_string=4).check_json(value)
+
+            self.assertExceeds("max_bytes", Limits(max_bytes=10).check_json,
+                               value)
+            self.assertExceeds("max_depth", Limits(max_depth=2).check_json,
+                               value)
+            self.assertExceeds("max_keys", Limits(max_keys=3).check_json,
+                               value)
+            self.assertExceeds("max_string", Limits(max_string=2).check_json,
+                               value)
+
+        # The size of text is measured in UTF-8.
+        self.assertExceeds("max_bytes", Limits(max_bytes=2).check_json,
+                           '"ü"')
+
+    def test_unterminated_string(self):
+        # Quadratic if the string is scanned again from each escaped quote.
+        data = b'{"a": "' + b'\\"' * 200000
+        start = time.time()
+        Limits(max_depth=1).check_json(data)
+        self.assertExceeds("max_string", Limits(max_string=10).check_json,
+                           data)
+        self.assertExceeds("max_string", Limits(max_string=10).check_json,
+                           data.decode("utf8"))
+        self.assertLess(time.time() - start, 2)
+
+    def test_check_object(self):
+        obj = {"a": [1, {"b": "xyz"}], "c": b"12"}
+        Limits(max_depth=3, max_keys=3, max_string=3).check_object(obj)
+
+        self.assertExceeds("max_depth", Limits(max_depth=2).check_object,
+                           obj)
+        self.assertExceeds("max_keys", Limits(max_keys=2).check_object, obj)
+        self.assertExceeds("max_string", Limits(max_string=2).check_object,
+                           obj)
+
+    def test_json_adapter(self):
+        data = '{"branch": {"value": 1, "leaf": {"value": 2}}}'
+        entity = _RootEntity(JSONAdapter(data, limits=Limits(max_depth=3)))
+        self.assertEqual(entity.branch.leaf.value, 2)
+
+        self.assertExceeds("max_depth", JSONAdapter, data, None,
+                           Limits(max_depth=2))
+
+        # The depth of the spawned adapters is checked for dict.
+        adapter = JSONAdapter(JSONAdapter(data).data,
+                              limits=Limits(max_depth=2))
+        self.assertExceeds("max_depth", _RootEntity, adapter)
+
+    def test_spawn(self):
+        # Still a staticmethod.
+        for adapter_cls in (JSONAdapter, MessagePackAdapter):
+            adapter = adapter_cls.spawn({"a": 1})
+            self.assertIs(type(adapter), adapter_cls)
+            self.assertIsNone(adapter.limits)
+            self.assertIsNone(adapter_cls({}).spawn({}).limits)
+
+            limits = Limits(max_depth=2)
+            adapter = adapter_cls({}, limits=limits).spawn({"a": 1})
+            self.assertIs(type(adapter), adapter_cls)
+            self.assertIs(adapter.limits, limits)
+            self.assertEqual(adapter.depth, 2)
+            self.assertExceeds("max_depth", adapter.spawn, {})
+
+    def test_message_pack_adapter(self):
+        data = py_packb({"branch": {"value": 1, "leaf": {"value": 2}}})
+        entity = _RootEntity(MessagePackAdapter(data,
+                                                limits=Limits(max_depth=3)))
+        self.assertEqual(entity.branch.leaf.value, 2)
+
+        self.assertExceeds("max_bytes", MessagePackAdapter, data, None,
+                           Limits(max_bytes=len(data) - 1))
+        self.assertExceeds("max_keys", MessagePackAdapter, data, None,
+                           Limits(max_keys=3))
+
+        # Checked while decoding, in pure Python and by msgpack.
+        data = py_packb({"a": [1, {"b": "xyz"}], "c": b"12"})
+        unpackers = [binary.py_unpackb]
+        if binary.msgpack is not None:
+            unpackers.append(binary._msgpack_unpackb)
+        for unpackb in unpackers:
+            self.assertEqual(
+                unpackb(data, Limits(max_depth=3, max_keys=3, max_string=3)),
+                {"a": [1, {"b": "xyz"}], "c": b"12"})
+            self.assertExceeds("max_depth", unpackb, data,
+                               Limits(max_depth=2))
+            self.assertExceeds("max_keys", unpackb, data, Limits(max_keys=2))
+            self.assertExceeds("max_string", unpackb, data,
+                               Limits(max_string=2))
+
+            # Strings are measured in bytes, not in characters.
+            text = py_packb({"a": ["\xe9" * 40]})
+            self.assertEqual(unpackb(text, Limits(max_string=80)),
+                             {"a": ["\xe9" * 40]})
+            self.assertExceeds("max_string", unpackb, text,
+                               Limits(max_string=55))
+
+        # A custom decoder is checked after decoding.
+        self.assertExceeds("max_keys", MessagePackAdapter, data,
+                           binary.py_unpackb, Limits(max_keys=2))
+
+        adapter = MessagePackAdapter({"branch": {"value": 1,
+                                                 "leaf": {"value": 2}}},
+                                     limits=Limits(max_depth=2))
+        self.assertExceeds("max_depth", _RootEntity, adapter)
+
+    def test_pickle(self):
+        error = pickle.loads(pickle.dumps(LimitExceededError("max_keys",
+                                                             10)))
+        self.assertEqual(error.limit, "max_keys")
+        self.assertEqual(error.value, 10)
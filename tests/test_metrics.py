@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""This module tests ``parameter.metrics``."""
+from __future__ import print_function, division, unicode_literals
+
+import unittest
+
+import six
+
+from parameter import Model, Argument, types
+from parameter import ArgumentInvalidError, ArgumentMissError
+from parameter import metrics
+from parameter.adapter import JSONAdapter
+
+
+class _ChildEntity(Model):
+    a = Argument(types.Integer)
+
+
+class _MetricsEntity(Model):
+    name = Argument(types.Unicode)
+    age = Argument(types.Integer, default=18)
+    child = Argument(types.Nested(_ChildEntity))
+
+
+class MetricsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.events = []
+        self.recorder = metrics.MetricsRecorder(sample_size=3)
+        metrics.add_hook(self._hook)
+        metrics.add_hook(self.recorder)
+
+    def tearDown(self):
+        metrics.remove_hook(self._hook)
+        metrics.remove_hook(self.recorder)
+
+    def _hook(self, model_cls, field, duration, outcome):
+        self.events.append((model_cls, field, outcome))
+
+    def test_events(self):
+        entity = _MetricsEntity(JSONAdapter({"name": "a", "child": {"a": 1}}))
+        self.assertEqual(entity.child.a, 1)
+        # The order of the arguments is arbitrary on Python 2.
+        six.assertCountEqual(self, self.events, [
+            (_MetricsEntity, "name", None),
+            (_MetricsEntity, "age", None),
+            (_ChildEntity, "a", None),
+            (_ChildEntity, None, None),
+            (_MetricsEntity, "child", None),
+            (_MetricsEntity, None, None),
+        ])
+        self.assertListEqual(
+            self.events[self.events.index((_ChildEntity, "a", None)):][:3], [
+                (_ChildEntity, "a", None),
+                (_ChildEntity, None, None),
+                (_MetricsEntity, "child", None),
+            ])
+        self.assertEqual(self.events[-1], (_MetricsEntity, None, None))
+
+        del self.events[:]
+        with self.assertRaises(ArgumentInvalidError) as ctx:
+            _MetricsEntity(JSONAdapter({"name": "a", "age": "x",
+                                        "child": {"a": 1}}))
+        self.assertListEqual(self.events[-2:], [
+            (_MetricsEntity, "age", ctx.exception),
+            (_MetricsEntity, None, ctx.exception),
+        ])
+        self.assertTrue(all(outcome is None
+                            for _, _, outcome in self.events[:-2]))
+
+    def test_recorder(self):
+        # A single argument fails, whatever the order of the arguments is.
+        for data in ({"name": "a", "child": {"a": 1}},
+                     {"name": "a", "age": "x", "child": {"a": 1}},
+                     {"name": "a", "age": "y", "child": {"a": 1}},
+                     {"age": 1, "child": {"a": 1}}):
+            try:
+                _MetricsEntity(JSONAdapter(data))
+            except (ArgumentInvalidError, ArgumentMissError):
+                pass
+
+        stats = self.recorder.stats(_MetricsEntity)
+        self.assertEqual(stats.calls, 4)
+        self.assertEqual(stats.failures, 3)
+        self.assertDictEqual(dict(stats.failures_by_field), {
+            ("age", types.MismatchError): 2,
+            ("name", ArgumentMissError): 1,
+        })
+        self.assertGreater(stats.p50(), 0)
+        self.assertGreaterEqual(stats.p99(), stats.p50())
+        self.assertIsNotNone(stats.p99("age"))
+        self.assertIsNone(stats.p50("unknown"))
+        # The children of the failures may be created before.
+        self.assertGreaterEqual(self.recorder.stats(_ChildEntity).calls, 1)
+
+        self.recorder.reset()
+        self.assertIsNone(self.recorder.stats(_MetricsEntity))
+
+    def test_reorder(self):
+        class _OrderedEntity(Model):
+            when = Argument(types.Datetime)
+            age = Argument(types.Integer)
+
+        _OrderedEntity(JSONAdapter({"when": "2017-01-01 08:00:00", "age": 1}))
+        costs = self.recorder.stats(_OrderedEntity).costs()
+        self.assertSetEqual(set(costs), {"when", "age"})
+
+        _OrderedEntity.reorder({"age": 0.1, "when": 0.2})
+        self.assertTrue(hasattr(_OrderedEntity._init, "_meta_original"))
+        with self.assertRaises(ArgumentInvalidError) as ctx:
+            _OrderedEntity(JSONAdapter({"when": "x", "age": "x"}))
+        self.assertEqual(ctx.exception.name, "age")
+
+        metrics.remove_hook(self._hook)
+        metrics.remove_hook(self.recorder)
+        try:
+            with self.assertRaises(ArgumentInvalidError) as ctx:
+                _OrderedEntity(JSONAdapter({"when": "x", "age": "x"}))
+            self.assertEqual(ctx.exception.name, "age")
+        finally:
+            metrics.add_hook(self._hook)
+            metrics.add_hook(self.recorder)
+
+    def test_ordered(self):
+        class _OrderedEntity(Model):
+            when = Argument(types.Datetime)
+            age = Argument(types.Integer)
+
+            class Meta:
+                order = "cost"
+
+        _OrderedEntity(JSONAdapter({"when": "2017-01-01 08:00:00", "age": 1}))
+        self.assertListEqual([field for _, field, _ in self.events],
+                             ["age", "when", None])
+
+        with self.assertRaises(ArgumentInvalidError) as ctx:
+            _OrderedEntity(JSONAdapter({"when": "x", "age": "x"}))
+        self.assertEqual(ctx.exception.name, "age")
+
+        # The missing ones are checked first, the same as without hooks.
+        del self.events[:]
+        with self.assertRaises(ArgumentMissError) as ctx:
+            _OrderedEntity(JSONAdapter({"age": "x"}))
+        self.assertEqual(ctx.exception.name, "when")
+        self.assertListEqual(self.events, [
+            (_OrderedEntity, "when", ctx.exception),
+            (_OrderedEntity, None, ctx.exception),
+        ])
+
+        metrics.remove_hook(self._hook)
+        metrics.remove_hook(self.recorder)
+        try:
+            with self.assertRaises(ArgumentMissError) as ctx:
+                _OrderedEntity(JSONAdapter({"age": "x"}))
+            self.assertEqual(ctx.exception.name, "when")
+        finally:
+            metrics.add_hook(self._hook)
+            metrics.add_hook(self.recorder)
+
+    def test_new_model(self):
+        class _NewEntity(Model):
+            a = Argument(types.Integer)
+
+        _NewEntity(JSONAdapter({"a": 1}))
+        self.assertEqual(self.events[-1], (_NewEntity, None, None))
+
+    def test_restore(self):
+        # The unbound methods of Python 2 are created on every access.
+        init = vars(_MetricsEntity)["_init"]
+        try:
+            metrics.remove_hook(self._hook)
+            self.assertIs(vars(_MetricsEntity)["_init"], init)
+
+            metrics.remove_hook(self.recorder)
+            self.assertIs(vars(_MetricsEntity)["_init"],
+                          init._meta_original)
+            self.assertFalse(hasattr(_MetricsEntity._init, "_meta_original"))
+
+            del self.events[:]
+            _MetricsEntity(JSONAdapter({"name": "a", "child": {"a": 1}}))
+            self.assertListEqual(self.events, [])
+        finally:
+            metrics.add_hook(self._hook)
+            metrics.add_hook(self.recorder)
+        with self.assertRaises(ValueError):
+            metrics.remove_hook(len)
@@ -7,6 +7,9 @@ import unittest
 
 from parameter import Model, Argument, types, ArgumentInvalidError
 from parameter import BaseAdapter, ArgumentMissError
+from parameter.adapter import JSONAdapter
+from parameter.exception import LimitExceededError
+from parameter.limits import Limits
 
 
 class _TestAdapter(BaseAdapter):
@@ -104,3 +107,608 @@ class ModelTestCase(unittest.TestCase):
 
         model = _TestModel(_TestAdapter())
         self.assertListEqual(model.test, ["a", "b", "c"])
+
+    def test_compiled_init(self):
+        class _TestModel(Model):
+            integer = Argument(types.Integer)
+            test = Argument(types.Unicode, multiple=True)
+
+        self.assertIsNot(_TestModel._init, Model._init)
+
+        model = _TestModel(_TestAdapter())
+        self.assertEqual(model.integer, 10)
+        self.assertListEqual(model.test, ["a", "b", "c"])
+
+    def test_compiled_init_invalid(self):
+        class _TestModel(Model):
+            integer = Argument(types.Integer, alias="string",
+                               invalid_message="Invalid integer")
+
+        with self.assertRaises(ArgumentInvalidError) as ctx:
+            _TestModel(_TestAdapter())
+
+        self.assertEqual(ctx.exception.name, "string")
+        self.assertEqual(ctx.exception.args[0], "Invalid integer")
+        self.assertIsInstance(ctx.exception.source, types.MismatchError)
+
+    def test_custom_argument(self):
+        class _UpperArgument(Argument):
+            def convert(self, value):
+                return super(_UpperArgument, self).convert(value).upper()
+
+        class _TestModel(Model):
+            string = _UpperArgument(types.Unicode)
+
+        model = _TestModel(_TestAdapter())
+        self.assertEqual(model.string, "STRING")
+
+    def test_custom_init(self):
+        class _TestModel(Model):
+            integer = Argument(types.Integer)
+
+            def _init(self):
+                self.integer = 0
+
+        model = _TestModel(_TestAdapter())
+        self.assertEqual(model.integer, 0)
+
+    def test_slots(self):
+        class _TestModel(Model):
+            integer = Argument(types.Integer)
+
+        model = _TestModel(_TestAdapter())
+        self.assertFalse(hasattr(model, "__dict__"))
+        self.assertDictEqual(model._arguments, {"integer": 10})
+
+        with self.assertRaises(AttributeError):
+            model.other = 1
+
+    def test_declared_slots(self):
+        class _TestModel(Model):
+            __slots__ = ("extra",)
+
+            integer = Argument(types.Integer)
+
+        model = _TestModel(_TestAdapter())
+        model.extra = 1
+        self.assertEqual(model.extra, 1)
+        self.assertEqual(model.integer, 10)
+
+    def test_lazy(self):
+        class _TestModel(Model):
+            class Meta:
+                lazy = True
+
+            integer = Argument(types.Integer)
+            string = Argument(types.Integer)
+            test = Argument(types.Unicode, multiple=True)
+
+        model = _TestModel(_TestAdapter())
+        self.assertNotIn("integer", model.__dict__)
+        self.assertEqual(model.integer, 10)
+        self.assertEqual(model.__dict__["integer"], 10)
+        self.assertListEqual(model.test, ["a", "b", "c"])
+
+        with self.assertRaises(ArgumentInvalidError):
+            model.string
+
+        with self.assertRaises(ArgumentInvalidError):
+            model.validate()
+
+    def test_lazy_miss(self):
+        class _TestModel(Model):
+            class Meta:
+                lazy = True
+
+            null = Argument(types.Unicode)
+
+        model = _TestModel(_TestAdapter())
+
+        with self.assertRaises(ArgumentMissError):
+            model.validate()
+
+    def test_lazy_inherit(self):
+        class _BaseModel(Model):
+            class Meta:
+                lazy = True
+
+        class _TestModel(_BaseModel):
+            integer = Argument(types.Integer)
+
+        self.assertTrue(_TestModel._meta_options["lazy"])
+        self.assertEqual(_TestModel(_TestAdapter()).validate().integer, 10)
+
+    def test_invalid_option(self):
+        with self.assertRaises(TypeError):
+            class _TestModel(Model):
+                class Meta:
+                    unknown = True
+
+
+class _NestedModel(Model):
+    a = Argument(types.Integer)
+
+
+class _BatchModel(Model):
+    integer = Argument(types.Integer)
+    string = Argument(types.Unicode(max_len=4), default="none")
+    nested = Argument(types.Nested(_NestedModel))
+    multiple = Argument(types.Integer, multiple=True)
+
+
+class ValidateManyTestCase(unittest.TestCase):
+    def _record(self, **kwargs):
+        record = {"integer": 1, "nested": {"a": 2}, "multiple": [1, "2"]}
+        record.update(kwargs)
+        return record
+
+    def test_valid(self):
+        records = [self._record(integer=i) for i in range(5)]
+        results = list(_BatchModel.validate_many(records, chunk_size=2))
+
+        self.assertEqual([index for index, _, _ in results], list(range(5)))
+        for index, entity, error in results:
+            self.assertIsNone(error)
+            self.assertIsInstance(entity, _BatchModel)
+            self.assertEqual(entity.integer, index)
+            self.assertEqual(entity.string, "none")
+            self.assertEqual(entity.nested.a, 2)
+            self.assertListEqual(entity.multiple, [1, 2])
+
+    def test_invalid(self):
+        records = [
+            self._record(),
+            self._record(integer="a"),
+            self._record(string="abcde"),
+            {"nested": {"a": 2}, "multiple": []},
+            self._record(multiple=1),
+            self._record(nested={"a": "a"}),
+            self._record(integer=6),
+        ]
+        results = list(_BatchModel.validate_many(records, chunk_size=4))
+
+        self.assertEqual(len(results), len(records))
+        self.assertIsNone(results[0][2])
+        self.assertEqual(results[6][1].integer, 6)
+
+        for index, name, exc_cls in ((1, "integer", ArgumentInvalidError),
+                                     (2, "string", ArgumentInvalidError),
+                                     (3, "integer", ArgumentMissError),
+                                     (4, "multiple", ArgumentInvalidError),
+                                     (5, "a", ArgumentInvalidError)):
+            _, entity, error = results[index]
+            self.assertIsNone(entity)
+            self.assertIsInstance(error, exc_cls)
+            self.assertEqual(error.name, name)
+
+    def test_invalid_nested(self):
+        records = [
+            self._record(),
+            {"integer": 2, "multiple": []},
+            self._record(nested=None),
+            self._record(nested=[1]),
+            JSONAdapter(self._record(), limits=Limits(max_depth=1)),
+            self._record(integer=5),
+        ]
+        results = list(_BatchModel.validate_many(records))
+
+        self.assertEqual(results[0][1].nested.a, 2)
+        self.assertEqual(results[5][1].integer, 5)
+        for index, exc_cls in ((1, ArgumentMissError),
+                               (2, ArgumentInvalidError),
+                               (3, ArgumentInvalidError),
+                               (4, LimitExceededError)):
+            _, entity, error = results[index]
+            self.assertIsNone(entity)
+            self.assertIsInstance(error, exc_cls)
+
+        # The same as creating the models one by one.
+        with self.assertRaises(ArgumentMissError):
+            _BatchModel(JSONAdapter(records[1]))
+        with self.assertRaises(ArgumentInvalidError) as ctx:
+            _BatchModel(JSONAdapter(records[3]))
+        self.assertEqual(ctx.exception.name, "nested")
+        self.assertIsInstance(ctx.exception.source, TypeError)
+
+    def test_mistyped(self):
+        class _PriceModel(Model):
+            price = Argument(types.Double)
+            day = Argument(types.Date, default="2017-01-01")
+
+        results = list(_PriceModel.validate_many([
+            {"price": 1.5}, {"price": None}, {"price": 2.0},
+            {"price": 3, "day": 5}]))
+        self.assertListEqual([entity.price for _, entity, _ in results
+                              if entity is not None], [1.5, 2.0])
+        for index, name in ((1, "price"), (3, "day")):
+            _, entity, error = results[index]
+            self.assertIsNone(entity)
+            self.assertIsInstance(error, ArgumentInvalidError)
+            self.assertEqual((error.name, error.code), (name, "mismatch"))
+
+        # A custom type which raises TypeError doesn't abort the batch.
+        class _StrictType(types.BaseType):
+            def convert(self, val):
+                return val + 1
+
+        class _StrictModel(Model):
+            value = Argument(_StrictType)
+            values = Argument(_StrictType, multiple=True)
+
+        results = list(_StrictModel.validate_many([
+            {"value": 1, "values": []}, {"value": None, "values": []},
+            {"value": 2, "values": [None]}, {"value": 3, "values": [1]}]))
+        self.assertEqual(results[0][1].value, 2)
+        self.assertListEqual(results[3][1].values, [2])
+        for index, name in ((1, "value"), (2, "values")):
+            _, entity, error = results[index]
+            self.assertIsNone(entity)
+            self.assertIsInstance(error, ArgumentInvalidError)
+            self.assertEqual(error.name, name)
+            self.assertIsInstance(error.source, TypeError)
+
+    def test_adapters(self):
+        records = [JSONAdapter(self._record()), self._record(), "[]"]
+        results = list(_BatchModel.validate_many(records))
+
+        self.assertEqual(results[0][1].integer, 1)
+        self.assertIs(results[0][1].adapter, records[0])
+        self.assertEqual(results[1][1].integer, 1)
+        self.assertIsInstance(results[2][2], TypeError)
+
+    def test_lazy(self):
+        class _LazyModel(Model):
+            class Meta:
+                lazy = True
+
+            integer = Argument(types.Integer)
+
+        results = list(_LazyModel.validate_many([{"integer": 1},
+                                                 {"integer": "a"}]))
+
+        self.assertEqual(results[0][1].integer, 1)
+        self.assertIsInstance(results[1][2], ArgumentInvalidError)
+
+
+class CheckTestCase(unittest.TestCase):
+    def test_ok(self):
+        result = _BatchModel.check(JSONAdapter({
+            "integer": 1, "nested": {"a": 2}, "multiple": [1, "2"]}))
+
+        self.assertTrue(result.ok)
+        self.assertListEqual(result.errors, [])
+        self.assertEqual(result.values["integer"], 1)
+        self.assertEqual(result.values["string"], "none")
+        self.assertListEqual(result.values["multiple"], [1, 2])
+        self.assertEqual(result.instance.nested.a, 2)
+        self.assertEqual(result.instance.integer, 1)
+
+    def test_errors(self):
+        result = _BatchModel.check(JSONAdapter({
+            "string": "abcde", "nested": {"a": "a"}, "multiple": [1, "b"]}))
+
+        self.assertFalse(result.ok)
+        self.assertIsNone(result.instance)
+        # The order of arguments is not kept on Python 2.
+        self.assertListEqual(sorted(result.errors), [
+            ("integer", "missing"),
+            ("multiple.1", "mismatch"),
+            ("nested.a", "mismatch"),
+            ("string", "max_len"),
+        ])
+
+    def test_invalid_nested(self):
+        result = _BatchModel.check(JSONAdapter({"integer": 2,
+                                                "multiple": []}))
+        self.assertListEqual(result.errors, [("nested", "missing")])
+
+        for nested in (None, [1]):
+            result = _BatchModel.check(JSONAdapter({
+                "integer": 2, "nested": nested, "multiple": []}))
+            self.assertListEqual(result.errors, [("nested", "invalid")])
+
+        result = _BatchModel.check(JSONAdapter({
+            "integer": 2, "nested": {"a": 1}, "multiple": []},
+            limits=Limits(max_depth=1)))
+        self.assertListEqual(result.errors, [("nested", "limit")])
+
+    def test_mistyped(self):
+        class _TypedModel(Model):
+            price = Argument(types.Double)
+            amount = Argument(types.Decimal)
+            when = Argument(types.Datetime)
+            day = Argument(types.Date)
+            name = Argument(types.Unicode)
+            code = Argument(types.String)
+
+        # ``null`` of JSON and the numbers are not raised.
+        result = _TypedModel.check(JSONAdapter({
+            "price": None, "amount": None, "when": 5, "day": None,
+            "name": b"\xff", "code": b"c"}))
+        self.assertFalse(result.ok)
+        self.assertListEqual(sorted(result.errors), [
+            ("amount", "mismatch"), ("day", "mismatch"), ("name", "mismatch"),
+            ("price", "mismatch"), ("when", "mismatch"),
+        ])
+
+        result = _TypedModel.check(JSONAdapter({
+            "price": [1], "amount": [1], "when": {}, "day": 5,
+            "name": "a", "code": "b"}))
+        self.assertListEqual(sorted(result.errors), [
+            ("amount", "mismatch"), ("day", "mismatch"),
+            ("price", "mismatch"), ("when", "mismatch"),
+        ])
+
+    def test_adapter_error(self):
+        result = _BatchModel.check(JSONAdapter({
+            "integer": 1, "nested": {"a": 2}, "multiple": 1}))
+
+        self.assertListEqual(result.errors, [("multiple", "invalid")])
+
+    def test_custom_init(self):
+        class _TestModel(Model):
+            integer = Argument(types.Integer)
+
+            def _init(self):
+                self.integer = self.adapter.get_argument("integer", None)
+                if self.integer is None:
+                    raise ArgumentMissError(None, "integer")
+
+        result = _TestModel.check(JSONAdapter({"integer": 1}))
+        self.assertEqual(result.instance.integer, 1)
+
+        result = _TestModel.check(JSONAdapter({}))
+        self.assertListEqual(result.errors, [("integer", "missing")])
+
+
+class _ColumnarModel(Model):
+    integer = Argument(types.Integer(packed=True))
+    string = Argument(types.Unicode(max_len=4), default="none")
+    nested = Argument(types.Nested(_NestedModel))
+    multiple = Argument(types.Integer, multiple=True)
+
+
+class ValidateColumnsTestCase(unittest.TestCase):
+    def test_valid(self):
+        result = _ColumnarModel.validate_columns({
+            "integer": [1, 2, 3],
+            "nested": {"a": [4, "5", 6]},
+            "multiple": [[1], ["2", 3], []],
+        })
+
+        self.assertTrue(result.ok)
+        self.assertEqual(len(result), 3)
+        self.assertListEqual(result.valid, [True] * 3)
+        self.assertListEqual(list(result.columns["integer"]), [1, 2, 3])
+        self.assertListEqual(result.columns["string"], ["none"] * 3)
+        self.assertListEqual(result.columns["nested"].columns["a"],
+                             [4, 5, 6])
+        self.assertListEqual(result.columns["multiple"], [[1], [2, 3], []])
+
+    def test_invalid(self):
+        result = _ColumnarModel.validate_columns({
+            "integer": [1, "a", 3, 4],
+            "string": ["a", "b", "abcde", "d"],
+            "nested": {"a": [1, 2, 3, "x"]},
+            "multiple": [[1], [2], 3, [4, "y"]],
+        })
+
+        self.assertFalse(result.ok)
+        self.assertListEqual(result.valid, [True, False, False, False])
+        # The order of the arguments is arbitrary on Python 2.
+        self.assertDictEqual(
+            dict((row, sorted(errors))
+                 for row, errors in result.errors.items()), {
+                1: [("integer", "mismatch")],
+                2: [("multiple", "invalid"), ("string", "max_len")],
+                3: [("multiple.1", "mismatch"), ("nested.a", "mismatch")],
+            })
+        self.assertListEqual(list(result.columns["integer"]), [1, 0, 0, 0])
+        self.assertListEqual(result.columns["string"],
+                             ["a", None, None, None])
+        self.assertListEqual(result.columns["multiple"],
+                             [[1], None, None, None])
+
+    def test_missing(self):
+        result = _ColumnarModel.validate_columns({"integer": [1, 2]})
+
+        self.assertListEqual(result.valid, [False, False])
+        self.assertListEqual(sorted(result.errors[0]),
+                             [("multiple", "invalid"), ("nested", "missing")])
+
+    def test_json(self):
+        result = _NestedModel.validate_columns('{"a": [1, 2]}')
+        self.assertListEqual(result.columns["a"], [1, 2])
+
+    def test_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            _NestedModel.validate_columns({"a": [1, 2], "b": [1]})
+        with self.assertRaises(ValueError):
+            _ColumnarModel.validate_columns({"integer": [1],
+                                             "nested": {"a": [1, 2]}})
+        with self.assertRaises(TypeError):
+            _NestedModel.validate_columns({"a": 1})
+
+    def test_nested_length(self):
+        with self.assertRaises(ValueError):
+            _ColumnarModel.validate_columns({"integer": [1, 2],
+                                             "nested": {"a": [1, 2, 3]}})
+        ret = _ColumnarModel.validate_columns({"nested": {"a": [1, 2]}})
+        self.assertEqual(ret.valid, [False, False])
+
+    def test_shape_mismatch(self):
+        with self.assertRaises(ValueError):
+            _NestedModel.validate_columns({"a": {"k": 1, "z": 2}})
+        with self.assertRaises(ValueError):
+            _ColumnarModel.validate_columns({"integer": [1, 2],
+                                             "nested": {"a": {"q": 1}}})
+        with self.assertRaises(ValueError):
+            _ColumnarModel.validate_columns({"integer": [1, 2],
+                                             "nested": [1, 2]})
+
+    def test_unsupported(self):
+        class _ListNestedModel(Model):
+            nested = Argument(types.Nested(_NestedModel), multiple=True)
+
+        class _CustomModel(Model):
+            a = Argument(types.Integer)
+
+            def _init(self):
+                self.a = 1
+
+        with self.assertRaises(TypeError):
+            _ListNestedModel.validate_columns({})
+        with self.assertRaises(TypeError):
+            _CustomModel.validate_columns({"a": [1]})
+
+
+class MultipleTestCase(unittest.TestCase):
+    def test_invalid(self):
+        class _TestModel(Model):
+            values = Argument(types.Integer, multiple=True)
+
+        with self.assertRaises(ArgumentInvalidError) as ctx:
+            _TestModel(JSONAdapter({"values": [1, "a"]}))
+        self.assertIsInstance(ctx.exception.source, types.MismatchError)
+
+    def test_packed(self):
+        class _TestModel(Model):
+            values = Argument(types.Double(packed=True), multiple=True)
+
+        model = _TestModel(JSONAdapter({"values": (1.5, "2")}))
+        self.assertListEqual(list(model.values), [1.5, 2.0])
+        self.assertNotIsInstance(model.values, list)
+
+        result = _TestModel.check(JSONAdapter({"values": [1.5]}))
+        self.assertNotIsInstance(result.values["values"], list)
+
+    def test_max_items(self):
+        class _TestModel(Model):
+            values = Argument(types.Integer, multiple=True, max_items=2)
+            nested = Argument(types.Nested(_NestedModel), multiple=True,
+                              max_items=1, default=())
+
+        class _LazyModel(_TestModel):
+            class Meta:
+                lazy = True
+
+            values = Argument(types.Integer, multiple=True, max_items=2)
+
+        class _IterAdapter(JSONAdapter):
+            def get_arguments(self, name):
+                return iter(super(_IterAdapter, self).get_arguments(name))
+
+        model = _TestModel(_IterAdapter({"values": [1, "2"], "nested": []}))
+        self.assertListEqual(model.values, [1, 2])
+
+        for data in ({"values": [1, 2, 3], "nested": []},
+                     {"values": [1], "nested": [{"a": 1}, {"a": 2}]}):
+            with self.assertRaises(ArgumentInvalidError) as ctx:
+                _TestModel(_IterAdapter(data))
+            self.assertEqual(ctx.exception.code, "max_items")
+
+        result = _TestModel.check(JSONAdapter({"values": [1, 2, 3],
+                                               "nested": []}))
+        self.assertListEqual(result.errors, [("values", "max_items")])
+
+        results = list(_TestModel.validate_many([
+            {"values": [1], "nested": []},
+            {"values": [1, 2, 3], "nested": []},
+        ]))
+        self.assertIsNone(results[0][2])
+        self.assertEqual(results[1][2].code, "max_items")
+
+        model = _LazyModel(JSONAdapter({"values": [1, 2, 3]}))
+        with self.assertRaises(ArgumentInvalidError):
+            model.values
+
+
+class _CostModel(Model):
+    nested = Argument(types.Nested(_NestedModel))
+    when = Argument(types.Datetime)
+    points = Argument(types.Double, multiple=True)
+    name = Argument(types.Unicode)
+    age = Argument(types.Integer, default=18)
+
+    class Meta:
+        order = "cost"
+
+
+class CostOrderTestCase(unittest.TestCase):
+    def _data(self, **kwargs):
+        data = {"nested": {"a": 1}, "when": "2017-01-01 08:00:00",
+                "points": [1.5], "name": "a"}
+        data.update(kwargs)
+        return data
+
+    def _error(self, model_cls, data):
+        try:
+            model_cls(JSONAdapter(data))
+        except (ArgumentMissError, ArgumentInvalidError) as e:
+            return e.name, e.code
+        self.fail("No exception raised")
+
+    def test_order(self):
+        names = [_CostModel._meta_arguments[index][0]
+                 for index in _CostModel._meta_order]
+        # The cheapest ones are in the order of the arguments, which is
+        # arbitrary on Python 2.
+        self.assertListEqual(sorted(names[:2]), ["age", "name"])
+        self.assertListEqual(names[2:], ["nested", "when", "points"])
+
+        model = _CostModel(JSONAdapter(self._data()))
+        self.assertEqual(model.nested.a, 1)
+        self.assertEqual(model.when.year, 2017)
+        self.assertListEqual(model.points, [1.5])
+        self.assertEqual((model.name, model.age), ("a", 18))
+
+    def test_missing_first(self):
+        data = self._data(nested=[], when="x", points=["x"])
+        del data["name"]
+        self.assertEqual(self._error(_CostModel, data), ("name", "missing"))
+
+    def test_cheap_first(self):
+        data = self._data(when="x", points=["x"], age="x")
+        self.assertEqual(self._error(_CostModel, data), ("age", "mismatch"))
+        data = self._data(when="x", points=["x"])
+        self.assertEqual(self._error(_CostModel, data), ("when", "mismatch"))
+
+        # The batch validation reports the same error.
+        results = list(_CostModel.validate_many([
+            self._data(when="x", points=["x"], age="x")]))
+        self.assertEqual((results[0][2].name, results[0][2].code),
+                         ("age", "mismatch"))
+
+    def test_reorder(self):
+        class _TestModel(Model):
+            when = Argument(types.Datetime)
+            age = Argument(types.Integer)
+
+        data = {"when": "x", "age": "x"}
+        first = _TestModel._meta_arguments[0][0]
+        self.assertEqual(self._error(_TestModel, data), (first, "mismatch"))
+        _TestModel.reorder()
+        self.assertEqual(self._error(_TestModel, data), ("age", "mismatch"))
+        _TestModel.reorder({"when": 0.1, "age": 0.2})
+        self.assertEqual(self._error(_TestModel, data), ("when", "mismatch"))
+        _TestModel.reorder({"age": 0.2})
+        self.assertEqual(self._error(_TestModel, data), ("age", "mismatch"))
+
+    def test_invalid(self):
+        with self.assertRaises(TypeError):
+            class _TestModel(Model):
+                class Meta:
+                    order = "unknown"
+
+        with self.assertRaises(TypeError):
+            class _LazyModel(Model):
+                class Meta:
+                    lazy = True
+                    order = "cost"
+
+        class _InitModel(Model):
+            def _init(self):
+                pass
+
+        with self.assertRaises(TypeError):
+            _InitModel.reorder()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""This module tests ``parameter.parallel``."""
+from __future__ import print_function, division, unicode_literals
+
+import multiprocessing
+import pickle
+import threading
+import unittest
+
+from parameter import Model, Argument, types
+from parameter import exception
+from parameter.adapter import JSONAdapter
+from parameter.parallel import validate_parallel
+
+
+class ParallelEntity(Model):
+    a = Argument(types.Integer)
+    b = Argument(types.Unicode, default="b")
+
+
+class PriceEntity(Model):
+    price = Argument(types.Double)
+
+
+class _LockType(types.BaseType):
+    """Converts to a value which can't be pickled."""
+
+    def convert(self, val):
+        return threading.Lock()
+
+
+class LockEntity(Model):
+    a = Argument(_LockType)
+
+
+class LazyParallelEntity(Model):
+    class Meta:
+        lazy = True
+
+    a = Argument(types.Integer)
+
+
+def _records(size):
+    records = [{"a": i} for i in range(size)]
+    records[3] = {"a": "x"}
+    records[7] = {}
+    return records
+
+
+class ParallelTestCase(unittest.TestCase):
+    # Fail instead of hanging if the results are lost.
+    timeout = 30
+
+    @classmethod
+    def setUpClass(cls):
+        super(ParallelTestCase, cls).setUpClass()
+        cls.pool = multiprocessing.Pool(2)
+
+    @classmethod
+    def tearDownClass(cls):
+        super(ParallelTestCase, cls).tearDownClass()
+        cls.pool.terminate()
+        cls.pool.join()
+
+    def assertResults(self, results, size):
+        self.assertListEqual(sorted(index for index, _, _ in results),
+                             list(range(size)))
+
+        for index, instance, error in results:
+            if index == 3:
+                self.assertIsInstance(error, exception.ArgumentInvalidError)
+                self.assertEqual(error.name, "a")
+                self.assertEqual(error.code, "mismatch")
+            elif index == 7:
+                self.assertIsInstance(error, exception.ArgumentMissError)
+                self.assertEqual(error.name, "a")
+            else:
+                self.assertIsNone(error)
+                self.assertEqual(instance.a, index)
+                self.assertEqual(instance.b, "b")
+
+    def test_ordered(self):
+        results = list(validate_parallel(
+            ParallelEntity, iter(_records(50)), chunk_size=7,
+            pool=self.pool, max_pending=2, timeout=self.timeout))
+        self.assertListEqual([index for index, _, _ in results],
+                             list(range(50)))
+        self.assertResults(results, 50)
+
+    def test_mistyped(self):
+        records = [{"price": 1.5}, {"price": None}, {"price": 2.0}]
+        results = list(validate_parallel(
+            PriceEntity, records, chunk_size=2, pool=self.pool,
+            timeout=self.timeout))
+        self.assertListEqual([index for index, _, _ in results], [0, 1, 2])
+        self.assertEqual(results[0][1].price, 1.5)
+        self.assertIsInstance(results[1][2], exception.ArgumentInvalidError)
+        self.assertEqual(results[2][1].price, 2.0)
+
+    def test_unordered(self):
+        results = list(validate_parallel(
+            ParallelEntity, _records(50), chunk_size=7, ordered=False,
+            pool=self.pool, timeout=self.timeout))
+        self.assertResults(results, 50)
+
+    def test_own_pool(self):
+        results = list(validate_parallel(ParallelEntity, _records(10),
+                                         processes=2, chunk_size=3,
+                                         timeout=self.timeout))
+        self.assertResults(results, 10)
+
+    def test_instances(self):
+        # Lazy models and the records which aren't dicts are sent back as
+        # instances.
+        records = [JSONAdapter({"a": 0}), '{"a": 1}', {"a": 2}]
+        results = list(validate_parallel(
+            LazyParallelEntity, [{"a": 0}, {"a": 1}], pool=self.pool,
+            timeout=self.timeout))
+        self.assertListEqual([instance.a for _, instance, _ in results],
+                             [0, 1])
+
+        results = list(validate_parallel(
+            ParallelEntity, records[1:], pool=self.pool,
+            timeout=self.timeout))
+        self.assertListEqual([instance.a for _, instance, _ in results],
+                             [1, 2])
+        self.assertDictEqual(results[0][1].adapter.data, {"a": 1})
+        self.assertIs(results[1][1].adapter.data, records[2])
+
+    def test_unpicklable(self):
+        records = [{"a": 1}, {"a": 2, "b": threading.Lock()}, {"a": 3}]
+        for ordered in (True, False):
+            results = sorted(validate_parallel(
+                ParallelEntity, records, chunk_size=1, ordered=ordered,
+                pool=self.pool, timeout=self.timeout), key=lambda r: r[0])
+            self.assertListEqual([instance.a for _, instance, _ in results
+                                  if instance is not None], [1, 3])
+            self.assertIsNone(results[1][1])
+            self.assertIsInstance(results[1][2], Exception)
+
+            # The results can't be sent back.
+            results = list(validate_parallel(
+                LockEntity, [{"a": 1}, {"a": 2}], ordered=ordered,
+                pool=self.pool, timeout=self.timeout))
+            self.assertListEqual([index for index, _, _ in results], [0, 1])
+            for _, instance, error in results:
+                self.assertIsNone(instance)
+                self.assertIsInstance(error, TypeError)
+
+    def test_pickle_errors(self):
+        error = exception.ArgumentInvalidError(
+            "invalid", "a", exception.MismatchError("x"))
+        error = pickle.loads(pickle.dumps(error))
+        self.assertEqual(error.args, ("invalid",))
+        self.assertEqual(error.name, "a")
+        self.assertEqual(error.code, "mismatch")
+
+        error = pickle.loads(pickle.dumps(
+            exception.ArgumentMissError("miss", "a")))
+        self.assertEqual(error.name, "a")
+        self.assertEqual(error.code, "missing")
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""This module tests ``parameter.pipeline``."""
+from __future__ import print_function, division, unicode_literals
+
+import io
+import mmap
+import tempfile
+import unittest
+
+from parameter import Model, Argument, types
+from parameter import exception
+from parameter.pipeline import iter_lines, validate_ndjson
+
+
+DATA = (b'{"a": 1}\n'
+        b'\n'
+        b'  \n'
+        b'[1]\n'
+        b'{"a": "x"}\r\n'
+        b'not json\n'
+        b'{"a": 2}')
+
+
+class LineEntity(Model):
+    a = Argument(types.Integer)
+
+
+class ParentEntity(Model):
+    a = Argument(types.Integer)
+    child = Argument(types.Nested(LineEntity))
+
+
+class PriceEntity(Model):
+    price = Argument(types.Double)
+
+
+class PipelineTestCase(unittest.TestCase):
+    def assertResults(self, results):
+        results = list(results)
+        self.assertListEqual([lineno for lineno, _, _ in results],
+                             [1, 4, 5, 6, 7])
+
+        self.assertEqual(results[0][1].a, 1)
+        self.assertIsNone(results[0][2])
+        self.assertIsInstance(results[1][2], TypeError)
+        self.assertIsInstance(results[2][2], exception.ArgumentInvalidError)
+        self.assertIsInstance(results[3][2], ValueError)
+        self.assertEqual(results[4][1].a, 2)
+
+    def test_iter_lines(self):
+        expected = [b'{"a": 1}', b"", b"  ", b"[1]", b'{"a": "x"}\r',
+                    b"not json", b'{"a": 2}']
+        lines = iter_lines(DATA)
+        self.assertListEqual([bytes(line) for line in lines], expected)
+
+        for size in range(1, len(DATA) + 2):
+            lines = iter_lines(io.BytesIO(DATA), chunk_size=size)
+            self.assertListEqual([bytes(line) for line in lines], expected)
+
+    def test_bytes(self):
+        self.assertResults(validate_ndjson(LineEntity, DATA))
+        self.assertResults(validate_ndjson(LineEntity, bytearray(DATA)))
+
+    def test_stream(self):
+        self.assertResults(validate_ndjson(LineEntity, io.BytesIO(DATA),
+                                           read_size=3))
+
+    def test_chunk_size(self):
+        self.assertResults(validate_ndjson(LineEntity, DATA, chunk_size=2))
+
+    def test_mmap(self):
+        with tempfile.TemporaryFile() as f:
+            f.write(DATA)
+            f.flush()
+
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self.assertResults(validate_ndjson(LineEntity, buf))
+            # No view of the buffer is left.
+            buf.close()
+
+    def test_decoder(self):
+        lines = []
+
+        def loads(data):
+            lines.append(bytes(data))
+            return {"a": len(lines)}
+
+        results = list(validate_ndjson(LineEntity, b"x\ny\n", decoder=loads))
+        self.assertListEqual([(lineno, instance.a, error)
+                              for lineno, instance, error in results],
+                             [(1, 1, None), (2, 2, None)])
+        self.assertListEqual(lines, [b"x", b"y"])
+
+    def test_mistyped(self):
+        data = b'{"price": 1.5}\n{"price": null}\n{"price": 2.0}\n'
+        results = list(validate_ndjson(PriceEntity, data))
+        self.assertEqual(results[0][1].price, 1.5)
+        self.assertIsInstance(results[1][2], exception.ArgumentInvalidError)
+        self.assertEqual(results[2][1].price, 2.0)
+
+    def test_invalid_nested(self):
+        data = (b'{"a": 1, "child": {"a": 1}}\n'
+                b'{"a": 2, "child": [1]}\n'
+                b'{"a": 3}\n'
+                b'{"a": 4, "child": {"a": 4}}\n')
+        results = list(validate_ndjson(ParentEntity, data))
+        self.assertEqual(results[0][1].child.a, 1)
+        self.assertIsInstance(results[1][2], exception.ArgumentInvalidError)
+        self.assertIsInstance(results[2][2], exception.ArgumentMissError)
+        self.assertEqual(results[3][1].child.a, 4)
@@ -5,11 +5,21 @@ from __future__ import print_function, division, unicode_literals
 
 import decimal
 import datetime
+import re
 
 import unittest
 
+import six
+
+try:
+    import enum
+except ImportError:     # pragma: no cover
+    enum = None
+
 from parameter import Model, Argument, types, ArgumentInvalidError
 from parameter import BaseAdapter
+from parameter.adapter import JSONAdapter
+from parameter.multipart import UploadedFile
 
 
 class _TestAdapter(BaseAdapter):
@@ -100,3 +110,342 @@ class TypesTestCase(unittest.TestCase):
 
         with self.assertRaises(ArgumentInvalidError):
             _Model(_TestAdapter())
+
+    def test_try_convert(self):
+        self.assertEqual(types.Integer().try_convert("1"), 1)
+
+        invalid = types.Integer().try_convert("a")
+        self.assertIsInstance(invalid, types.Invalid)
+        self.assertEqual(invalid.code, "mismatch")
+        self.assertIsInstance(invalid.error(), types.MismatchError)
+
+        invalid = types.Unicode(max_len=1).try_convert("ab")
+        self.assertEqual(invalid.code, "max_len")
+
+        invalid = types.Date().try_convert("a")
+        self.assertEqual(invalid.code, "mismatch")
+
+        with self.assertRaises(types.MismatchError):
+            types.Double().convert("a")
+
+    def test_custom_convert(self):
+        class _Upper(types.Unicode):
+            def convert(self, val):
+                if not val:
+                    raise types.MismatchError(val)
+                return super(_Upper, self).convert(val).upper()
+
+        self.assertEqual(_Upper().try_convert("a"), "A")
+        self.assertListEqual(_Upper().convert_many(["a", "b"]), ["A", "B"])
+        self.assertEqual(_Upper().try_convert("").code, "mismatch")
+
+    def test_convert_many(self):
+        self.assertListEqual(types.Integer().convert_many([1, "2", True]),
+                             [1, 2, True])
+        self.assertListEqual(types.Double().convert_many([1.5, "2"]),
+                             [1.5, 2.0])
+        self.assertListEqual(types.Unicode().convert_many(["a", b"b"]),
+                             ["a", "b"])
+        self.assertListEqual(types.String().convert_many([b"a", "b"]),
+                             [b"a", b"b"])
+        self.assertListEqual(types.Decimal().convert_many(["1.1", b"2"]),
+                             [decimal.Decimal("1.1"), decimal.Decimal(2)])
+        self.assertListEqual(
+            types.Datetime().convert_many(["2011-11-11 11:11:11"]),
+            [datetime.datetime(2011, 11, 11, 11, 11, 11)])
+        self.assertListEqual(types.Date().convert_many(["2011-11-11"]),
+                             [datetime.date(2011, 11, 11)])
+
+    def test_convert_many_mismatch(self):
+        for type_, values in ((types.Integer(), [1, "a"]),
+                              (types.Double(), [1.0, "a"]),
+                              (types.Decimal(), ["1", "a"]),
+                              (types.Datetime(), ["a"]),
+                              (types.Date(), ["a"])):
+            with self.assertRaises(types.MismatchError):
+                type_.convert_many(values)
+
+        with self.assertRaises(types.MaxlenExceedError):
+            types.Unicode(max_len=1).convert_many(["a", "bc"])
+
+    def test_packed(self):
+        values = types.Integer(packed=True).convert_many([1, "2"])
+        self.assertListEqual(list(values), [1, 2])
+        self.assertNotIsInstance(values, list)
+
+        values = types.Double(packed=True).convert_many([1.5, "2"])
+        self.assertListEqual(list(values), [1.5, 2.0])
+
+        with self.assertRaises(types.MismatchError):
+            types.Integer(packed=True).convert_many([2 ** 64])
+
+    def test_file(self):
+        upload = UploadedFile("image", "a.png", "image/png")
+        upload.write(b"12345")
+        self.assertIs(types.File().convert(upload), upload)
+        self.assertIs(types.File(max_size=5).convert(upload), upload)
+
+        invalid = types.File(max_size=4).try_convert(upload)
+        self.assertEqual(invalid.code, "max_size")
+
+        invalid = types.File().try_convert(b"12345")
+        self.assertEqual(invalid.code, "mismatch")
+        upload.close()
+
+    def test_datetime_fast_path(self):
+        type_ = types.Datetime("%Y/%m/%d %H:%M:%S.%f")
+        self.assertIsNotNone(type_._parser)
+        self.assertEqual(type_.convert("2011/11/11 11:11:11.5"),
+                         datetime.datetime(2011, 11, 11, 11, 11, 11, 500000))
+        # Values which the fast path doesn't handle go to strptime.
+        self.assertEqual(type_.convert("2011/1/1 1:11:11.5"),
+                         datetime.datetime(2011, 1, 1, 1, 11, 11, 500000))
+        self.assertEqual(type_.try_convert("2011/13/11 11:11:11.5").code,
+                         "mismatch")
+
+        self.assertIsNone(types.Datetime("%d %b %Y")._parser)
+        self.assertEqual(types.Datetime("%d %b %Y").convert("11 Nov 2011"),
+                         datetime.datetime(2011, 11, 11))
+
+        self.assertEqual(types.Datetime("%H:%M").convert("11:11"),
+                         datetime.datetime(1900, 1, 1, 11, 11))
+        self.assertIs(type(types.Date().convert("2011-11-11")),
+                      datetime.date)
+
+    def test_iso8601(self):
+        type_ = types.Datetime(types.ISO8601)
+        self.assertEqual(type_.convert("2011-11-11T11:11"),
+                         datetime.datetime(2011, 11, 11, 11, 11))
+        self.assertEqual(type_.convert(b"2011-11-11"),
+                         datetime.datetime(2011, 11, 11))
+
+        value = type_.convert("2011-11-11 11:11:11.1234567+08:00")
+        self.assertEqual(value.microsecond, 123456)
+        self.assertEqual(value.utcoffset(), datetime.timedelta(hours=8))
+        self.assertEqual(type_.convert("2011-11-11T11:11:11Z").utcoffset(),
+                         datetime.timedelta(0))
+
+        self.assertEqual(types._parse_iso8601("2011-11-11T11"),
+                         datetime.datetime(2011, 11, 11, 11))
+        self.assertEqual(types._parse_iso8601("2011-11-11 11:11:11,5"),
+                         datetime.datetime(2011, 11, 11, 11, 11, 11, 500000))
+
+        # The values the newer fromisoformat accepts are not accepted.
+        for value in ("2011-11-11T1", "2011-13-11", "11:11", "2011-11-11+",
+                      "20111111", "2011-W45-5", "2011-11-11T11:11:11+08:00:30",
+                      "2011-11-11T24:00"):
+            self.assertEqual(type_.try_convert(value).code, "mismatch")
+        with self.assertRaises(types.MismatchError):
+            type_.convert_many(["2011-11-11", "a"])
+
+        self.assertListEqual(
+            types.Date(types.ISO8601).convert_many(["2011-11-11",
+                                                    "2011-11-11T23:00"]),
+            [datetime.date(2011, 11, 11)] * 2)
+
+    def test_datetime_tz(self):
+        tz = types._timezone("+08:00")
+        type_ = types.Datetime(types.ISO8601, tz=tz)
+
+        value = type_.convert("2011-11-11T11:11:11")
+        self.assertEqual(value.utcoffset(), datetime.timedelta(hours=8))
+        self.assertEqual(value.hour, 11)
+
+        value = type_.convert("2011-11-11T20:11:11Z")
+        self.assertEqual(value.utcoffset(), datetime.timedelta(hours=8))
+        self.assertEqual(value.day, 12)
+
+        self.assertEqual(
+            types.Date(types.ISO8601, tz=tz).convert("2011-11-11T20:11Z"),
+            datetime.date(2011, 11, 12))
+
+    def test_mistyped(self):
+        type_list = [types.Double(), types.Decimal(), types.Datetime(),
+                     types.Date(types.ISO8601)]
+        if six.PY3:
+            # ``str(None)`` is valid on Python 2.
+            type_list.append(types.String())
+        for type_ in type_list:
+            self.assertEqual(type_.try_convert(None).code, "mismatch")
+            with self.assertRaises(types.MismatchError):
+                type_.convert_many(["1", None])
+        self.assertEqual(types.Unicode().try_convert(b"\xff").code,
+                         "mismatch")
+        self.assertEqual(types.Decimal().try_convert(b"\xff").code,
+                         "mismatch")
+
+    def test_string_constraints(self):
+        type_ = types.Unicode(min_len=2, max_len=4, pattern="[a-z]+")
+        self.assertEqual(type_.convert(b"abc"), "abc")
+        self.assertEqual(type_.try_convert("a").code, "min_len")
+        self.assertEqual(type_.try_convert("abcde").code, "max_len")
+        self.assertEqual(type_.try_convert("abC").code, "pattern")
+        # The pattern must match the whole value.
+        self.assertEqual(type_.try_convert("ab1").code, "pattern")
+
+        self.assertListEqual(type_.convert_many(["ab", "abcd"]),
+                             ["ab", "abcd"])
+        for values, exc_cls in ((["ab", "a"], types.MinlenError),
+                                (["ab", "a1"], types.PatternMismatchError)):
+            with self.assertRaises(exc_cls):
+                type_.convert_many(values)
+
+        type_ = types.String(pattern=re.compile("[a-z]+", re.I))
+        self.assertEqual(type_.convert("aBc"), b"aBc")
+        self.assertEqual(type_.convert_many([b"aB"]), [b"aB"])
+        with self.assertRaises(types.PatternMismatchError):
+            type_.convert_many([b"a", b"a1"])
+
+    def test_range(self):
+        for type_ in (types.Integer(min_value=1, max_value=10),
+                      types.Integer(packed=True, min_value=1, max_value=10),
+                      types.Double(min_value=1, max_value=10),
+                      types.Decimal(min_value=1, max_value=10)):
+            self.assertEqual(type_.convert("5"), 5)
+            self.assertEqual(list(type_.convert_many([1, 10])), [1, 10])
+            for value in ("0", "11"):
+                self.assertEqual(type_.try_convert(value).code, "range")
+            with self.assertRaises(types.OutOfRangeError):
+                type_.convert_many([1, 11])
+
+        self.assertEqual(types.Integer(max_value=1).convert("0"), 0)
+        self.assertEqual(types.Integer(min_value=1).try_convert(0).code,
+                         "range")
+
+        for value in ("nan", float("nan")):
+            self.assertEqual(
+                types.Double(min_value=0).try_convert(value).code, "range")
+            self.assertEqual(
+                types.Decimal(max_value=0).try_convert(value).code, "range")
+        with self.assertRaises(types.OutOfRangeError):
+            types.Double(max_value=1).convert_many([0.5, float("nan")])
+
+    def test_choice(self):
+        type_ = types.Choice(["open", "closed"])
+        self.assertEqual(type_.choices, frozenset(["open", "closed"]))
+        self.assertEqual(type_.convert("open"), "open")
+        self.assertEqual(type_.convert(b"closed"), "closed")
+        self.assertEqual(type_.try_convert("other").code, "choice")
+        self.assertEqual(type_.try_convert(["open"]).code, "choice")
+        self.assertEqual(type_.try_convert(b"\xff").code, "choice")
+
+        value = "".join(["op", "en"])
+        self.assertIs(type_.convert(value), type_.convert("open"))
+        self.assertListEqual(type_.convert_many(["open", b"closed"]),
+                             ["open", "closed"])
+        with self.assertRaises(types.ChoiceError):
+            type_.convert_many(["open", "other"])
+
+        type_ = types.Choice([1, 2], type_=types.Integer)
+        self.assertListEqual(type_.convert_many(["1", 2]), [1, 2])
+        self.assertEqual(type_.try_convert("a").code, "mismatch")
+        self.assertEqual(type_.try_convert("3").code, "choice")
+
+    @unittest.skipIf(enum is None, "enum is not available")
+    def test_choice_enum(self):
+        class _Color(enum.Enum):
+            red = 1
+            green = 2
+
+        type_ = types.Choice(_Color, type_=types.Integer)
+        self.assertIs(type_.convert("1"), _Color.red)
+        self.assertEqual(type_.try_convert(3).code, "choice")
+
+    def test_list(self):
+        type_ = types.List(types.Integer, max_items=3)
+        self.assertListEqual(type_.convert([1, "2"]), [1, 2])
+        self.assertListEqual(type_.convert(()), [])
+        self.assertEqual(type_.try_convert([1, "a"]).code, "mismatch")
+        self.assertEqual(type_.try_convert("123").code, "mismatch")
+        self.assertEqual(type_.try_convert(["a"] * 4).code, "max_items")
+
+        values = types.List(types.Double(packed=True)).convert([1, "2"])
+        self.assertListEqual(list(values), [1.0, 2.0])
+
+        type_ = types.List(types.List(types.Unicode, max_items=1))
+        self.assertListEqual(type_.convert([["a"], [b"b"]]), [["a"], ["b"]])
+        self.assertEqual(type_.try_convert([["a", "b"]]).code, "max_items")
+
+        with self.assertRaises(TypeError):
+            types.List(types.Nested(_TestModel))
+
+    def test_tuple(self):
+        type_ = types.Tuple(types.Double, types.Unicode(max_len=1))
+        self.assertEqual(type_.convert(["1.5", "a"]), (1.5, "a"))
+        for value in ([1.5], [1.5, "a", 1], "ab", 1):
+            self.assertEqual(type_.try_convert(value).code, "mismatch")
+        self.assertEqual(type_.try_convert([1.5, "ab"]).code, "max_len")
+
+    def test_mapping(self):
+        type_ = types.Mapping(types.Unicode, types.Integer, max_items=2)
+        self.assertDictEqual(type_.convert({"a": "1", b"b": 2}),
+                             {"a": 1, "b": 2})
+        self.assertEqual(type_.try_convert({"a": "x"}).code, "mismatch")
+        self.assertEqual(type_.try_convert([("a", 1)]).code, "mismatch")
+        self.assertEqual(type_.try_convert({"a": 1, "b": 2, "c": 3}).code,
+                         "max_items")
+
+        value = {"a": [1]}
+        self.assertDictEqual(types.Mapping().convert(value), value)
+
+    def test_cached(self):
+        calls = []
+
+        class _Counted(types.Decimal):
+            def try_convert(self, val):
+                calls.append(val)
+                return super(_Counted, self).try_convert(val)
+
+        type_ = types.Cached(_Counted, maxsize=2)
+        self.assertEqual(type_.convert("1.5"), decimal.Decimal("1.5"))
+        self.assertEqual(type_.convert("1.5"), decimal.Decimal("1.5"))
+        self.assertEqual(type_.try_convert("a").code, "mismatch")
+        self.assertEqual(type_.try_convert("a").code, "mismatch")
+        self.assertListEqual(calls, ["1.5", "a", "a"])
+        self.assertEqual(type_.cache_info(), types.CacheInfo(1, 3, 2, 1))
+
+        # The least recently used one is evicted.
+        type_.convert_many(["2", "3", "2"])
+        self.assertListEqual(calls[3:], ["2", "3"])
+        type_.convert("1.5")
+        self.assertListEqual(calls[5:], ["1.5"])
+        self.assertEqual(type_.cache_info().currsize, 2)
+
+        type_.cache_clear()
+        self.assertEqual(type_.cache_info(), types.CacheInfo(0, 0, 2, 0))
+
+        with self.assertRaises(TypeError):
+            types.Cached(types.Nested(_TestModel))
+
+    def test_cached_keys(self):
+        type_ = types.Integer().cached()
+        self.assertIs(type_.convert(True), True)
+        self.assertIs(type(type_.convert(1)), int)
+        self.assertEqual(type_.try_convert([1]).code, "mismatch")
+
+        type_ = types.Cached(types.List(types.Integer))
+        self.assertListEqual(type_.convert([1]), [1])
+        self.assertListEqual(type_.convert((1,)), [1])
+        # Lists are mutable, they are not cached.
+        self.assertEqual(type_.cache_info().currsize, 0)
+
+        type_ = types.Cached(types.Tuple(types.Integer, types.Unicode))
+        type_.convert((1, "a"))
+        self.assertEqual(type_.cache_info().currsize, 1)
+
+    def test_cached_argument(self):
+        class _CachedModel(Model):
+            values = Argument(types.Integer(packed=True), multiple=True,
+                              cache_size=8)
+            max_len = Argument(types.Unicode(max_len=2), cache_size=8)
+
+        arguments = dict(_CachedModel._meta_arguments)
+        self.assertIsInstance(arguments["values"].type_, types.Cached)
+        self.assertTrue(arguments["values"].type_.packed)
+        self.assertEqual(arguments["max_len"].type_.max_len, 2)
+
+        model = _CachedModel(JSONAdapter({"values": ["1", "1", 2],
+                                          "max_len": "ab"}))
+        self.assertListEqual(list(model.values), [1, 1, 2])
+        self.assertNotIsInstance(model.values, list)
+        self.assertEqual(arguments["values"].type_.cache_info().hits, 1)